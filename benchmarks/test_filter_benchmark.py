@@ -0,0 +1,62 @@
+"""
+Micro-benchmarks for Filter.match hot paths (skipped without pytest-benchmark).
+
+Each benchmark reuses one pre-stat'd StatProxy so only the per-file match logic
+is timed. These live outside `testpaths`, so the default `pytest` run skips the
+timing loops; run them with `pytest benchmarks` and compare runs with
+`pytest benchmarks --benchmark-compare`.
+"""
+
+import datetime as dt
+import os
+import pathlib
+
+import pytest
+
+from pathql.filters.age import AgeDays
+from pathql.filters.datetime_parts import DayFilter
+from pathql.filters.filedate import FileDate
+from pathql.filters.size import Size
+from pathql.filters.stat_proxy import StatProxy
+
+pytest.importorskip("pytest_benchmark")
+
+_MTIME = dt.datetime(2025, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def bench_file(tmp_path_factory: pytest.TempPathFactory) -> tuple[pathlib.Path, StatProxy]:
+    """One read-only file with a fixed mtime, paired with an already-stat'd proxy."""
+    # Arrange
+    path = tmp_path_factory.mktemp("bench") / "2025-05-01_bench.txt"
+    path.write_bytes(b"x" * 100)
+    ns = int(_MTIME.timestamp()) * 1_000_000_000
+    os.utime(path, ns=(ns, ns))
+    proxy = StatProxy(path)
+    proxy.stat()
+    return path, proxy
+
+
+@pytest.mark.parametrize(
+    "make_filter",
+    [
+        lambda: DayFilter(1, base=_MTIME),
+        lambda: AgeDays() < 1,
+        lambda: FileDate().modified >= _MTIME,
+        lambda: FileDate().filename == dt.datetime(2025, 5, 1),
+        lambda: Size() >= 100,
+    ],
+    ids=["day", "age_days", "filedate_modified", "filedate_filename", "size"],
+)
+def test_bench_match(benchmark, bench_file, make_filter) -> None:
+    """Time a single match() call on a file that matches the filter."""
+    # Arrange
+    path, proxy = bench_file
+    filt = make_filter()
+    now = _MTIME + dt.timedelta(hours=1)
+
+    # Act
+    actual = benchmark(filt.match, path, proxy, now)
+
+    # Assert
+    assert actual is True
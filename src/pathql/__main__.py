@@ -4,6 +4,19 @@ import argparse
 import pathlib
 
 from pathql import File, Query, __version__
+from pathql.walker import list_dir
+
+# Recursive searches use Query's threaded walk once the start directory has at least
+# this many subdirectories; smaller trees are walked serially to avoid pool overhead.
+_PARALLEL_MIN_SUBDIRS = 4
+
+
+def _use_threads(root: pathlib.Path, recursive: bool) -> bool:
+    """Return True if a search of root is wide enough to be worth a thread pool."""
+    if not recursive:
+        return False
+    _, subdirs = list_dir(root)  # an unreadable root lists as empty
+    return len(subdirs) >= _PARALLEL_MIN_SUBDIRS
 
 
 def main():
@@ -33,8 +46,12 @@ Use --recursive to search subdirectories.
 
     query = Query(where_expr=File(args.pattern))
     print("PathQL v" + __version__)
+    root = pathlib.Path(".")
     for f in query.files(
-        from_paths=pathlib.Path("."), recursive=args.recursive, files_only=True
+        from_paths=root,
+        recursive=args.recursive,
+        files_only=True,
+        threaded=_use_threads(root, args.recursive),
     ):
         print(f)
 
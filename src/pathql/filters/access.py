@@ -23,6 +23,10 @@ class Read(Filter):
     Filter that matches if the file is readable by the current user.
     """
 
+    __slots__ = ()
+
+    cost: int = 5
+
     def match(
         self,
         path: pathlib.Path,
@@ -37,6 +41,10 @@ class Write(Filter):
     Filter that matches if the file is writable by the current user.
     """
 
+    __slots__ = ()
+
+    cost: int = 5
+
     def match(
         self,
         path: pathlib.Path,
@@ -51,6 +59,10 @@ class Execute(Filter):
     Filter that matches if the file is executable by the current user.
     """
 
+    __slots__ = ()
+
+    cost: int = 5
+
     def match(
         self,
         path: pathlib.Path,
@@ -25,21 +25,47 @@ This will use the created timestamp and will often be correct, surprisingly work
 better on Windows than on Unix-like systems.
 """
 import datetime as dt
+import math
 import operator
 import pathlib
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from .alias import StatProxyOrNone
-from .attribute_filter import AttributeFilter
+from .attribute_filter import AttributeFilter, _stat_column
 from .datetime_parts import normalize_attr
 
 
+def _age_window(
+    op: Callable[[int, int], bool],
+    value: int,
+    unit: float,
+) -> tuple[float, float, bool] | None:
+    """
+    Return (low, high, inside) such that `(seconds // unit) op value` holds exactly
+    when `(low <= seconds < high) is inside`, or None for operators not listed here.
+    """
+    low, high = value * unit, (value + 1) * unit
+    windows = {
+        operator.lt: (-math.inf, low, True),
+        operator.le: (-math.inf, high, True),
+        operator.ge: (low, math.inf, True),
+        operator.gt: (high, math.inf, True),
+        operator.eq: (low, high, True),
+        operator.ne: (low, high, False),
+    }
+    return windows.get(op)
+
+
 class AgeBase(AttributeFilter):
     """
     Base class for file age filters. Computes file age from stat mtime and supports
     operator overloads for expressive queries (e.g., AgeDays < 10).
     """
 
+    __slots__ = ("attr", "_stat_field", "_now_cache", "_extractor", "_window")
+
+    unit_seconds: float = 1.0
+
     def __init__(
         self,
         op: Callable[[int, int], bool] = operator.lt,
@@ -54,9 +80,10 @@ class AgeBase(AttributeFilter):
             value: Age threshold (int).
             attr: Stat attribute to use (default: 'modified').
         """
-        self.unit_seconds = getattr(self, "unit_seconds", 1.0)
         self.attr = attr
         self._stat_field = normalize_attr(attr)
+        # Query passes the same `now` for every file; remember its epoch seconds.
+        self._now_cache: tuple[Any, float] = (None, 0.0)
 
         def extractor(
             path: pathlib.Path, stat_proxy: StatProxyOrNone, now: Any = None
@@ -66,20 +93,15 @@ class AgeBase(AttributeFilter):
             Args:
                 path: Path to file.
                 stat_proxy: StatProxy for file.
-                now: Reference datetime (default: now).
+                now: Reference datetime or epoch seconds (default: now).
             Returns:
                 Age in unit_seconds (int).
             """
             if stat_proxy is None:
                 raise ValueError("stat_proxy required for age extraction")
 
-            if now is None:
-                now = dt.datetime.now()
             st = stat_proxy.stat()
-            mtime_ts = getattr(st, self._stat_field)
-            now_ts = now.timestamp()
-            age_seconds = now_ts - float(mtime_ts)
-            return int(age_seconds // self.unit_seconds)
+            return self._age_units(getattr(st, self._stat_field), self._now_ts(now))
 
         self._extractor = extractor
         super().__init__(
@@ -88,6 +110,70 @@ class AgeBase(AttributeFilter):
             self._parse_value(value) if value is not None else None,
             requires_stat=True,
         )
+        # The threshold as a window of ages in seconds, for match_batch.
+        self._window = (
+            _age_window(self.op, self.value, self.unit_seconds)
+            if self.value is not None
+            else None
+        )
+
+    def _now_ts(self, now: Any) -> float:
+        """Return `now` (datetime, epoch seconds or None for now) as epoch seconds."""
+        if now is None:
+            now = dt.datetime.now()
+        cached_now, now_ts = self._now_cache
+        if now is not cached_now:
+            now_ts = float(now) if isinstance(now, (int, float)) else now.timestamp()
+            self._now_cache = (now, now_ts)
+        return now_ts
+
+    def _age_units(self, ts: float, now_ts: float) -> int:
+        """Return the file's age in whole units: seconds since ts, floor-divided by the unit."""
+        return int((now_ts - float(ts)) // self.unit_seconds)
+
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: Any = None,
+    ) -> list[bool]:
+        """
+        Evaluate the filter over a batch of files.
+
+        Reads the timestamp as one column and converts `now` once per batch instead of
+        calling the extractor per file. The threshold is precomputed as a window of ages
+        in seconds with the same boundaries as _age_units, so each file costs a
+        subtraction and a range check instead of a floor division.
+        """
+        if self.op is None or self.value is None:
+            raise TypeError(f"{self.__class__.__name__} filter not fully specified.")
+        if any(sp is None for sp in stat_proxies):
+            raise ValueError(
+                f"{self.__class__.__name__} filter requires stat_proxy, but none was provided."
+            )
+        try:
+            now_ts = self._now_ts(now)
+        except Exception:
+            # match() gives False for every file when `now` cannot be converted.
+            return [False] * len(stat_proxies)
+        column = _stat_column(stat_proxies, self._stat_field)
+        results: list[bool] = []
+        append = results.append
+        if self._window is None:
+            op, value, age_units = self.op, self.value, self._age_units
+            for ts in column:
+                try:
+                    append(ts is not None and op(age_units(ts, now_ts), value))
+                except Exception:
+                    append(False)
+            return results
+        low, high, inside = self._window
+        for ts in column:
+            try:
+                append(ts is not None and (low <= now_ts - float(ts) < high) is inside)
+            except Exception:
+                append(False)
+        return results
 
     @staticmethod
     def _parse_value(value: int) -> int:
@@ -137,6 +223,8 @@ class AgeMinutes(AgeBase):
     at least the specified number of minutes ago.
     """
 
+    __slots__ = ()
+
     unit_seconds = 60
 
 
@@ -146,6 +234,8 @@ class AgeHours(AgeBase):
     at least the specified number of hours ago.
     """
 
+    __slots__ = ()
+
     unit_seconds = 3600
 
 
@@ -155,6 +245,8 @@ class AgeDays(AgeBase):
     at least the specified number of days ago.
     """
 
+    __slots__ = ()
+
     unit_seconds = 86400
 
 
@@ -164,6 +256,8 @@ class AgeYears(AgeBase):
     at least the specified number of years ago.
     """
 
+    __slots__ = ()
+
     unit_seconds = (
         86400 * 365.25
     )  # Use 365.25 days per year for compatibility with boundary tests
@@ -175,6 +269,8 @@ class AgeSeconds(AgeBase):
     at least the specified number of seconds ago.
     """
 
+    __slots__ = ()
+
     unit_seconds = 1
 
     @staticmethod
@@ -8,7 +8,7 @@ extraction and robust error handling.
 """
 
 import pathlib
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 from .alias import StatProxyOrNone
 from .base import Filter
@@ -37,6 +37,13 @@ class AttributeFilter(Filter):
         requires_stat: If True, raises ValueError if stat_proxy is not provided.
     """
 
+    __slots__ = ("extractor", "op", "value", "requires_stat")
+
+    cost: int = 5
+    # Subclasses whose extractor is just getattr(stat, field) name the field here so
+    # match_batch can read it as one column and compare without per-file calls.
+    stat_column: str | None = None
+
     def __init__(
         self,
         extractor: Callable[[pathlib.Path, StatProxyOrNone, Any], Any],
@@ -92,3 +99,54 @@ class AttributeFilter(Filter):
             return self.op(attr, self.value)
         except Exception:
             return False
+
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: Any = None,
+    ) -> list[bool]:
+        """
+        Evaluate the filter over a batch of files.
+
+        Same semantics as match(), but the specification checks and attribute lookups
+        are done once per batch instead of once per file.
+        """
+        if self.op is None or self.value is None:
+            raise TypeError(f"{self.__class__.__name__} filter not fully specified.")
+        if self.requires_stat and any(sp is None for sp in stat_proxies):
+            raise ValueError(
+                f"{self.__class__.__name__} filter requires stat_proxy, but none was provided."
+            )
+        op, value = self.op, self.value
+        results: list[bool] = []
+        append = results.append
+        if self.stat_column is not None:
+            for v in _stat_column(stat_proxies, self.stat_column):
+                try:
+                    append(v is not None and op(v, value))
+                except Exception:
+                    append(False)
+            return results
+        extractor = self.extractor
+        for path, stat_proxy in zip(paths, stat_proxies):
+            try:
+                append(op(extractor(path, stat_proxy, now), value))
+            except Exception:
+                append(False)
+        return results
+
+
+def _stat_column(
+    stat_proxies: Sequence[StatProxyOrNone],
+    field: str,
+) -> list[Any]:
+    """Return field from each proxy's stat result, or None where stat() fails."""
+    column: list[Any] = []
+    append = column.append
+    for stat_proxy in stat_proxies:
+        try:
+            append(getattr(stat_proxy.stat(), field))
+        except Exception:
+            append(None)
+    return column
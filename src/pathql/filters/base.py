@@ -7,6 +7,7 @@ NotFilter) for building composable filesystem queries.
 
 import pathlib
 from abc import ABC
+from typing import NamedTuple, Sequence
 from types import NotImplementedType
 
 from .alias import DatetimeOrNone, StatProxyOrNone
@@ -18,8 +19,22 @@ class Filter(ABC):
 
     Supports logical composition via &, |, and ~ operators. Subclasses must
     implement the match() method.
+
+    `cost` is a rough relative price of one match() call: 1 for name-only checks,
+    2 for regex/filename parsing, 5 for anything that stats or touches the file
+    system, 100 for filters that read file contents. All(..., by_cost=True) uses it
+    to evaluate cheap filters first; combinators otherwise keep construction order,
+    because short-circuiting decides which operands run for a path and a filter may
+    rely on an earlier one having rejected it. Query still skips the stat for any
+    file whose name alone (through Suffix/Stem/File operands) rules out a match.
+
+    Filters declare __slots__ (subclasses may omit it and fall back to a __dict__).
     """
 
+    __slots__ = ()
+
+    cost: int = 1
+
     def __and__(self, other: "Filter"):
         """Return a filter that matches if both filters match."""
         return AndFilter(self, other)
@@ -53,6 +68,23 @@ class Filter(ABC):
         """
         raise NotImplementedError
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """
+        Evaluate the filter over a batch of paths, returning one bool per path.
+
+        The default calls match() per path. Combinators override it to evaluate one
+        child across the whole batch before the next (so later children only see the
+        paths still undecided), and leaf filters can override it to hoist per-call
+        setup out of the loop.
+        """
+        match = self.match
+        return [match(p, sp, now=now) for p, sp in zip(paths, stat_proxies)]
+
     def __eq__(self, other: object) -> bool:
         """Disable == operator for Filter objects."""
         raise TypeError("== operator is not supported for Filter objects.")
@@ -62,6 +94,32 @@ class Filter(ABC):
         raise TypeError("!= operator is not supported for Filter objects.")
 
 
+class _Batch(NamedTuple):
+    """The match_batch arguments a combinator hands on to its operands."""
+
+    paths: Sequence[pathlib.Path]
+    stat_proxies: Sequence[StatProxyOrNone]
+    now: DatetimeOrNone
+
+
+def _narrowed_batch(
+    flt: Filter,
+    batch: _Batch,
+    mask: list[bool],
+    want: bool,
+) -> None:
+    """Evaluate flt on the entries where mask == want, storing the results in mask."""
+    idx = [i for i, m in enumerate(mask) if bool(m) is want]
+    if not idx:
+        return
+    paths, stat_proxies, now = batch
+    results = flt.match_batch(
+        [paths[i] for i in idx], [stat_proxies[i] for i in idx], now=now
+    )
+    for i, result in zip(idx, results):
+        mask[i] = result
+
+
 class AndFilter(Filter):
     """
     Filter that matches if both left and right filters match.
@@ -72,10 +130,13 @@ class AndFilter(Filter):
         may not be executed. Filters should be pure functions without side effects.
     """
 
+    __slots__ = ("left", "right", "cost")
+
     def __init__(self, left: Filter, right: Filter):
         """Initialize with two filters to combine with logical AND."""
         self.left = left
         self.right = right
+        self.cost = left.cost + right.cost
 
     def __and__(self, other: Filter | type[Filter]) -> "AndFilter | NotImplementedType":
         # Allow chaining: (Read & Write) & Execute and ((Read & Write) & (Execute & Write))
@@ -94,6 +155,17 @@ class AndFilter(Filter):
             path, stat_proxy, now=now
         )
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """Evaluate left over the batch, then right only where left matched."""
+        mask = self.left.match_batch(paths, stat_proxies, now=now)
+        _narrowed_batch(self.right, _Batch(paths, stat_proxies, now), mask, want=True)
+        return mask
+
 
 class OrFilter(Filter):
     """
@@ -105,10 +177,13 @@ class OrFilter(Filter):
         may not be executed. Filters should be pure functions without side effects.
     """
 
+    __slots__ = ("left", "right", "cost")
+
     def __init__(self, left: Filter, right: Filter):
         """Initialize with two filters to combine with logical OR."""
         self.left: Filter = left
         self.right: Filter = right
+        self.cost = left.cost + right.cost
 
     def __or__(self, other: Filter | type[Filter]) -> "OrFilter | NotImplementedType":
         # Allow chaining: (Read | Write) | Execute
@@ -127,16 +202,30 @@ class OrFilter(Filter):
             path, stat_proxy, now=now
         )
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """Evaluate left over the batch, then right only where left did not match."""
+        mask = self.left.match_batch(paths, stat_proxies, now=now)
+        _narrowed_batch(self.right, _Batch(paths, stat_proxies, now), mask, want=False)
+        return mask
+
 
 class NotFilter(Filter):
     """
     Filter that matches if the operand filter does not match.
     """
 
+    __slots__ = ("operand", "cost")
+
     # Does not require stat by default
     def __init__(self, operand: Filter):
         """Initialize with a filter to negate."""
         self.operand = operand
+        self.cost = operand.cost
 
     def match(
         self,
@@ -147,6 +236,14 @@ class NotFilter(Filter):
         """Return True if the operand filter does not match the path."""
         return not self.operand.match(path, stat_proxy, now=now)
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """Return the negated batch results of the operand filter."""
+        return [not m for m in self.operand.match_batch(paths, stat_proxies, now=now)]
 
 
 
@@ -155,15 +252,23 @@ class All(Filter):
     Filter that matches if all contained filters match (like Python's all()).
 
     Supports: All([f1, f2, f3]) or All(f1, f2, f3)
-    Short-circuits on first failure.
+    Short-circuits on first failure; filters are evaluated in the order given. With
+    by_cost=True they are evaluated cheapest `cost` first instead (equal costs keep
+    their order), which is only safe when no filter relies on an earlier one having
+    rejected the path.
     """
 
-    def __init__(self, *filters: Filter):
+    __slots__ = ("filters", "cost")
+
+    def __init__(self, *filters: Filter, by_cost: bool = False):
         # Allow passing a single iterable or multiple filters
         if len(filters) == 1 and isinstance(filters[0], (list, tuple, set)):
             self.filters: list[Filter] = list(filters[0])
         else:
             self.filters= list(filters)
+        if by_cost:
+            self.filters.sort(key=lambda f: f.cost)
+        self.cost = sum(f.cost for f in self.filters)
 
     def match(
         self,
@@ -177,20 +282,36 @@ class All(Filter):
                 return False
         return True
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """Evaluate each filter only over the paths every earlier filter matched."""
+        batch = _Batch(paths, stat_proxies, now)
+        mask = [True] * len(paths)
+        for f in self.filters:
+            _narrowed_batch(f, batch, mask, want=True)
+        return mask
+
 class Any(Filter):
     """
     Filter that matches if any contained filter matches (like Python's any()).
 
     Supports: Any([f1, f2, f3]) or Any(f1, f2, f3)
-    Short-circuits on first match.
+    Short-circuits on first match; filters are evaluated in the order given.
     """
 
+    __slots__ = ("filters", "cost")
+
     def __init__(self, *filters: Filter):
         # Allow passing a single iterable or multiple filters
         if len(filters) == 1 and isinstance(filters[0], (list, tuple, set)):
             self.filters: list[Filter] = list(filters[0])
         else:
             self.filters= list(filters)
+        self.cost = sum(f.cost for f in self.filters)
 
     def match(
         self,
@@ -204,6 +325,19 @@ class Any(Filter):
                 return True
         return False
 
+    def match_batch(
+        self,
+        paths: Sequence[pathlib.Path],
+        stat_proxies: Sequence[StatProxyOrNone],
+        now: DatetimeOrNone = None,
+    ) -> list[bool]:
+        """Evaluate each filter only over the paths no earlier filter matched."""
+        batch = _Batch(paths, stat_proxies, now)
+        mask = [False] * len(paths)
+        for f in self.filters:
+            _narrowed_batch(f, batch, mask, want=False)
+        return mask
+
 class AllowAll(Filter):
     """
     Lets all files pass through.  Good for testing
@@ -212,6 +346,8 @@ class AllowAll(Filter):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *filters: Filter):
         # Just ignore filters, we aren't going to use them.  Don't depend on side effects.
         pass
@@ -233,6 +369,8 @@ class AllowNone(Filter):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *filters: Filter):
         # Just ignore filters, we aren't going to use them.  Don't depend on side effects.
         pass
@@ -17,6 +17,8 @@ class Between(Filter):
     This matches values x such that lower <= x < upper.
     """
 
+    __slots__ = ("filter", "cost")
+
     def __init__(
         self,
         filter_instance: Filter,  # Not all Filters support comparisons
@@ -63,6 +65,7 @@ class Between(Filter):
                 "Failed to combine comparison filters with '&' "
                 f"for type {type(filter_instance).__name__!r}."
             ) from exc
+        self.cost = self.filter.cost
 
     def match(
         self,
@@ -5,8 +5,6 @@ The naming style ensures files are easily sorted by date and time, and provides
 Use these helpers to create consistent, sortable archive filenames for your workflows.
 """
 import datetime as dt
-import pathlib
-import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -28,40 +26,89 @@ class DateFilenameParts:
     hour: Optional[int] = None
 
 
+# Days in each month of a non-leap year, indexed by month number.
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Characters that may separate date parts, and that may follow the date prefix.
+_PART_SEPARATORS = "_-"
+_PREFIX_TERMINATORS = "_-."
+
+
+def _scan_date_prefix(name: str) -> list[int] | None:
+    """
+    Scan a leading YYYY[[sep]MM[[sep]DD[[sep]HH]]] date prefix without a regex.
+
+    Each part after the year is two digits, optionally preceded by '_' or '-'.
+    The prefix must be followed by '_', '-', '.', or the end of the string; if the
+    longest run of parts is not, shorter runs are tried (as regex backtracking
+    would). Returns [year, month, day, hour] truncated to the parts found, or None.
+    """
+    length = len(name)
+    if length < 4 or not name[:4].isdecimal():
+        return None
+    values = [int(name[:4])]
+    ends = [4]
+    pos = 4
+    while len(values) < 4:
+        start = pos + 1 if pos < length and name[pos] in _PART_SEPARATORS else pos
+        digits = name[start : start + 2]
+        if len(digits) != 2 or not digits.isdecimal():
+            break
+        values.append(int(digits))
+        pos = start + 2
+        ends.append(pos)
+    for count in range(len(values), 0, -1):
+        end = ends[count - 1]
+        if end == length or name[end] in _PREFIX_TERMINATORS:
+            return values[:count]
+    return None
+
+
 def filename_to_datetime_parts(filename: StrOrPath) -> DateFilenameParts|None:
     """
     Extracts yyyy, mm, dd, hh components from a filename of the form:
     YYYY-MM-DD_HH_{ArchiveName}.{EXT}, YYYY-MM-DD_{ArchiveName}.{EXT},
     YYYY-MM_{ArchiveName}.{EXT}, or YYYY-{ArchiveName}.{EXT}.
-    Accepts a string or pathlib.Path; if pathlib.Path, uses the name attribute.
+    Accepts a string or any object with a name attribute (pathlib.Path, os.DirEntry);
+    for the latter the name is used.
     Returns a DateFilenameParts dataclass with missing values as None.
     """
-    if isinstance(filename, pathlib.Path):
+    if not isinstance(filename, str):
         filename = filename.name
-    # Regex explanation:
-    # ^                        : Start of string
-    # (?P<year>\d{4})          : 4-digit year, captured as 'year'
-    # (?:[_\-]?(?P<month>\d{2}))? : Optional 2-digit month, optionally preceded by '_' or '-'
-    # (?:[_\-]?(?P<day>\d{2}))?   : Optional 2-digit day, optionally preceded by '_' or '-'
-    # (?:[_\-]?(?P<hour>\d{2}))?  : Optional 2-digit hour, optionally preceded by '_' or '-'
-    # (?:[_\-\.]|$)             : Optional separator ('_', '-', or '.') or end of string after the last date part
-    pattern = (
-        r"^(?P<year>\d{4})"
-        r"(?:[_\-]?(?P<month>\d{2}))?"
-        r"(?:[_\-]?(?P<day>\d{2}))?"
-        r"(?:[_\-]?(?P<hour>\d{2}))?"
-        r"(?:[_\-\.]|$)"
-    )
-    match = re.match(pattern, filename)
-    if not match:
+    values = _scan_date_prefix(filename)
+    if values is None:
         return None
-    parts = match.groupdict()
-    return DateFilenameParts(
-        year=int(parts["year"]),
-        month=int(parts["month"]) if parts["month"] else None,
-        day=int(parts["day"]) if parts["day"] else None,
-        hour=int(parts["hour"]) if parts["hour"] else None,
-    )
+    return DateFilenameParts(*values)
+
+
+def wallclock_seconds(
+    year: int,
+    month: int = 1,
+    day: int = 1,
+    hour: int = 0,
+) -> int:
+    """
+    Return naive wall-clock seconds since 0001-01-01 for the given date parts.
+
+    Uses the rata die (days_from_civil) closed form, so the result matches
+    `dt.datetime(year, month, day, hour).toordinal()`-based arithmetic without
+    building a datetime. Out of range parts raise ValueError as datetime would.
+    """
+    leap = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not (
+        dt.MINYEAR <= year <= dt.MAXYEAR
+        and 1 <= month <= 12
+        and 1 <= day <= _MONTH_DAYS[month] + leap
+        and 0 <= hour <= 23
+    ):
+        raise ValueError(f"Invalid date parts: {year}-{month}-{day} {hour}h")
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    ordinal = era * 146097 + doe - 305  # 0001-01-01 is ordinal 1
+    return ordinal * 86400 + hour * 3600
 
 
 def path_from_dt_ints(
@@ -1,11 +1,15 @@
 """Datetime part filters for filesystem queries.
 
 These filters match files by parts of their modification, creation, or access
-timestamp. Constructors validate and normalize the `attr` once; `match()` uses
-the canonical attribute name.
+timestamp. Constructors validate and normalize the `attr` once and turn the
+requested calendar period into a half-open [lo, hi) range of epoch nanoseconds,
+so `match()` is an exact integer range check on the stat `st_*time_ns` field with
+no per-file datetime work.
 """
 
 import datetime as dt
+import functools
+import math
 import pathlib
 
 from dateutil.relativedelta import relativedelta
@@ -75,13 +79,113 @@ def normalize_attr(attr: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _period_range(
+    fields: tuple[str, ...],
+    values: tuple[int, ...],
+) -> tuple[int, int, bool]:
+    """Return (lo, hi, exact) epoch-ns bounds for the local period named by fields/values.
+
+    Cached because filters for the same period (e.g. "this hour") are rebuilt
+    repeatedly with the same parts; the bounds only depend on those parts.
+    """
+    parts = {"month": 1, "day": 1}
+    parts.update(zip(fields, values))
+    try:
+        start = dt.datetime(**parts)
+        try:
+            end = start + relativedelta(**{f"{fields[-1]}s": 1})
+        except (ValueError, OverflowError):
+            # The period ends past datetime's range (e.g. year 9999): clamp it there.
+            end = None
+        lo = _fold_epoch_ns(start)
+        if end is None:
+            # Up to and including the last whole second datetime can represent.
+            last = _epoch_ns(dt.datetime.max.replace(microsecond=0)) + 1_000_000_000
+            hi = (last, last)
+        else:
+            hi = _fold_epoch_ns(end)
+    except (ValueError, OverflowError, OSError):
+        # e.g. DayFilter(31) in a 30-day month: nothing can match.
+        return 0, 0, True
+    return min(lo), max(hi), lo[0] == lo[1] and hi[0] == hi[1]
+
+
+def _epoch_ns(when: dt.datetime) -> int:
+    """Return the epoch nanoseconds of a whole-second local datetime."""
+    return int(when.timestamp()) * 1_000_000_000
+
+
+def _fold_epoch_ns(when: dt.datetime) -> tuple[int, int]:
+    """Return the epoch nanoseconds of both readings (fold=0, fold=1) of when."""
+    ns = _epoch_ns(when)
+    try:
+        return ns, _epoch_ns(when.replace(fold=1))
+    except (ValueError, OverflowError):
+        # Resolving fold=1 in the last day before dt.datetime.max steps past year 9999.
+        return ns, ns
+
+
+def _float_epoch_ns(ts: float) -> int:
+    """Return float epoch seconds as nanoseconds, scaling only the fractional part."""
+    seconds = math.floor(ts)
+    return seconds * 1_000_000_000 + round((ts - seconds) * 1_000_000_000)
+
+
 class _DatetimePartFilter(Filter):
-    pass
+    """
+    Base for filters that compare a part of a stat timestamp.
+
+    Subclasses set the attributes named in `_fields` (most significant first), then
+    call `super().__init__(attr)`. The local-time period those fields select
+    is stored as integer epoch-nanosecond bounds. If a bound falls in a DST fold or
+    gap the bounds are widened to cover both readings and `match()` re-checks the
+    parts exactly.
+    """
+
+    __slots__ = ("year", "month", "day", "attr", "_attr_ns", "_lo", "_hi", "_exact")
+
+    cost: int = 5
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, attr: str) -> None:
+        """Set the stat attribute and precompute the [lo, hi) epoch-ns period range."""
+        self.attr = normalize_attr(attr)
+        self._attr_ns = f"{self.attr}_ns"
+        values = tuple(getattr(self, f) for f in self._fields)
+        self._lo, self._hi, self._exact = _period_range(self._fields, values)
+
+    def match(
+        self,
+        path: pathlib.Path,
+        stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
+        now: DatetimeOrNone = None,
+    ) -> bool:
+        """Return True if the file's timestamp falls in this filter's period."""
+        if stat_proxy is None:
+            raise ValueError(
+                f"{self.__class__.__name__} requires stat_proxy, but none was provided."
+            )
+        st = stat_proxy.stat()
+        ts_ns = getattr(st, self._attr_ns, None)
+        if ts_ns is None:
+            # Stat objects without the *_ns fields (duck-typed proxies) carry floats.
+            ts_ns = _float_epoch_ns(getattr(st, self.attr))
+        if not self._lo <= ts_ns < self._hi:
+            return False
+        if self._exact:
+            return True
+        dt_obj = dt.datetime.fromtimestamp(ts_ns // 1_000_000_000)
+        return all(getattr(dt_obj, f) == getattr(self, f) for f in self._fields)
 
 
 class YearFilter(_DatetimePartFilter):
     """Filter files by year (with optional base and offset)."""
 
+    __slots__ = ()
+
+    _fields = ("year",)
+
     def __init__(
         self,
         year: int,
@@ -95,26 +199,16 @@ class YearFilter(_DatetimePartFilter):
         self.year = year
         self.month = base.month
         self.day = base.day
-        self.attr = normalize_attr(attr)
-
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's year matches the filter's year."""
-        if stat_proxy is None:
-            raise ValueError("YearFilter requires stat_proxy, but none was provided.")
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return dt_obj.year == self.year
+        super().__init__(attr)
 
 
-class MonthFilter(Filter):
+class MonthFilter(_DatetimePartFilter):
     """Filter files by month (supports month name or number)."""
 
+    __slots__ = ()
+
+    _fields = ("year", "month")
+
     def __init__(
         self,
         month: int | str,
@@ -128,7 +222,7 @@ class MonthFilter(Filter):
         self.year = base.year
         self.month = self._normalize_month(month)
         self.day = base.day
-        self.attr = normalize_attr(attr)
+        super().__init__(attr)
 
     def _normalize_month(self, v: int | str) -> int:
         key = v.strip().lower() if isinstance(v, str) else v
@@ -136,24 +230,13 @@ class MonthFilter(Filter):
             return MONTH_NAME_TO_NUM[key]
         raise ValueError(f"Unknown month: {v}")
 
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's year and month match the filter."""
-        if stat_proxy is None:
-            raise ValueError("YearFilter requires stat_proxy, but none was provided.")
 
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return dt_obj.year == self.year and dt_obj.month == self.month
+class DayFilter(_DatetimePartFilter):
+    """Filter files by day of month (with base/offset)."""
 
+    __slots__ = ()
 
-class DayFilter(Filter):
-    """Filter files by day of month (with base/offset)."""
+    _fields = ("year", "month", "day")
 
     def __init__(
         self,
@@ -168,30 +251,16 @@ class DayFilter(Filter):
         self.year = base.year
         self.month = base.month
         self.day = day
-        self.attr = normalize_attr(attr)
-
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's year, month and day match the filter."""
-        if stat_proxy is None:
-            raise ValueError("DayFilter requires stat_proxy, but none was provided.")
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return (
-            dt_obj.year == self.year
-            and dt_obj.month == self.month
-            and dt_obj.day == self.day
-        )
+        super().__init__(attr)
 
 
-class HourFilter(Filter):
+class HourFilter(_DatetimePartFilter):
     """Filter files by hour (with base/offset)."""
 
+    __slots__ = ("hour",)
+
+    _fields = ("year", "month", "day", "hour")
+
     def __init__(
         self,
         hour: int,
@@ -206,31 +275,16 @@ class HourFilter(Filter):
         self.month = base.month
         self.day = base.day
         self.hour = hour
-        self.attr = normalize_attr(attr)
+        super().__init__(attr)
 
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's date/time matches this hour filter."""
-        if stat_proxy is None:
-            raise ValueError("HourFilter requires stat_proxy, but none was provided.")
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return (
-            dt_obj.year == self.year
-            and dt_obj.month == self.month
-            and dt_obj.day == self.day
-            and dt_obj.hour == self.hour
-        )
 
-
-class MinuteFilter(Filter):
+class MinuteFilter(_DatetimePartFilter):
     """Filter files by minute (with base/offset)."""
 
+    __slots__ = ("hour", "minute")
+
+    _fields = ("year", "month", "day", "hour", "minute")
+
     def __init__(
         self,
         minute: int,
@@ -246,32 +300,16 @@ class MinuteFilter(Filter):
         self.day = base.day
         self.hour = base.hour
         self.minute = minute
-        self.attr = normalize_attr(attr)
+        super().__init__(attr)
 
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's date/time matches this minute filter."""
-        if stat_proxy is None:
-            raise ValueError("MinuteFilter requires stat_proxy, but none was provided.")
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return (
-            dt_obj.year == self.year
-            and dt_obj.month == self.month
-            and dt_obj.day == self.day
-            and dt_obj.hour == self.hour
-            and dt_obj.minute == self.minute
-        )
-
-
-class SecondFilter(Filter):
+
+class SecondFilter(_DatetimePartFilter):
     """Filter files by second (with base/offset)."""
 
+    __slots__ = ("hour", "minute", "second")
+
+    _fields = ("year", "month", "day", "hour", "minute", "second")
+
     def __init__(
         self,
         second: int,
@@ -288,25 +326,4 @@ class SecondFilter(Filter):
         self.hour = base.hour
         self.minute = base.minute
         self.second = second
-        self.attr = normalize_attr(attr)
-
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy: StatProxyOrNone,  # type: ignore[name-defined]
-        now: DatetimeOrNone = None,
-    ) -> bool:
-        """Return True if the file's date/time matches this second filter."""
-        if stat_proxy is None:
-            raise ValueError("SecondFilter requires stat_proxy, but none was provided.")
-        st = stat_proxy.stat()
-        ts = getattr(st, self.attr)
-        dt_obj = dt.datetime.fromtimestamp(ts)
-        return (
-            dt_obj.year == self.year
-            and dt_obj.month == self.month
-            and dt_obj.day == self.day
-            and dt_obj.hour == self.hour
-            and dt_obj.minute == self.minute
-            and dt_obj.second == self.second
-        )
+        super().__init__(attr)
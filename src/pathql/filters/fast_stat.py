@@ -0,0 +1,137 @@
+"""
+stat() without forced attribute sync, via Linux statx(2) and AT_STATX_DONT_SYNC.
+
+On network filesystems (NFS, CIFS) a plain stat() may make the client revalidate
+attributes with the server, which dominates the cost of walking large trees.
+AT_STATX_DONT_SYNC lets the kernel answer from its attribute cache instead. On local
+filesystems the result is identical to os.stat().
+
+Opt in for all StatProxy instances with:
+
+    StatProxy.stat_func = stat_dont_sync
+
+On platforms without statx, stat_dont_sync is os.stat.
+"""
+
+import ctypes
+import os
+import pathlib
+import sys
+from typing import Callable
+
+# Flags and masks from <fcntl.h> / <linux/stat.h>.
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_BASIC_STATS = 0x07FF
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx (256 bytes)."""
+
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx() -> Callable[..., int] | None:
+    """Return libc's statx function, or None if this platform does not provide it."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+_statx = _load_statx()
+
+HAVE_STATX: bool = _statx is not None
+
+
+def _ns(ts: _StatxTimestamp) -> int:
+    """Return a statx timestamp as integer nanoseconds."""
+    return ts.tv_sec * 1_000_000_000 + ts.tv_nsec
+
+
+def _float(ts: _StatxTimestamp) -> float:
+    """Return a statx timestamp as float seconds, rounded the way os.stat() does."""
+    return ts.tv_sec + ts.tv_nsec * 1e-9
+
+
+def _statx_dont_sync(path: str | os.PathLike[str]) -> os.stat_result:
+    """Call statx(AT_STATX_DONT_SYNC) on path, following symlinks like os.stat()."""
+    buf = _Statx()
+    if _statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC, STATX_BASIC_STATS, buf) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), os.fspath(path))
+    return os.stat_result(
+        (
+            buf.stx_mode,
+            buf.stx_ino,
+            os.makedev(buf.stx_dev_major, buf.stx_dev_minor),
+            buf.stx_nlink,
+            buf.stx_uid,
+            buf.stx_gid,
+            buf.stx_size,
+            buf.stx_atime.tv_sec,
+            buf.stx_mtime.tv_sec,
+            buf.stx_ctime.tv_sec,
+            _float(buf.stx_atime),
+            _float(buf.stx_mtime),
+            _float(buf.stx_ctime),
+            _ns(buf.stx_atime),
+            _ns(buf.stx_mtime),
+            _ns(buf.stx_ctime),
+            buf.stx_blksize,
+            buf.stx_blocks,
+            os.makedev(buf.stx_rdev_major, buf.stx_rdev_minor),
+        )
+    )
+
+
+def stat_dont_sync(path: pathlib.Path | str) -> os.stat_result:
+    """
+    Return os.stat(path), letting the kernel skip attribute sync where supported.
+
+    Raises OSError (e.g. FileNotFoundError) like os.stat().
+    """
+    if _statx is None:
+        return os.stat(path)
+    return _statx_dont_sync(path)
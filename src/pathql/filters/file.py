@@ -1,15 +1,38 @@
 """Filter for matching filenames using shell-style glob patterns."""
 
 import fnmatch
+import os
 import pathlib
+import re
+from typing import Callable
 
 from .alias import DatetimeOrNone
 from .base import Filter
 
+# fnmatch.fnmatch() runs names and patterns through os.path.normcase, which folds case
+# on Windows; File does the same, but only pays for the call where it changes anything.
+_NORMCASE = os.path.normcase("A") != "A"
+
+
+def name_folder(ignore_case: bool) -> Callable[[str], str] | None:
+    """
+    Return the function File applies to a name before matching (lowering if ignore_case,
+    then os.path.normcase), or None where it would leave every name unchanged.
+    """
+    if _NORMCASE:
+        if ignore_case:
+            return lambda name: os.path.normcase(name.lower())
+        return os.path.normcase
+    return str.lower if ignore_case else None
+
 
 class File(Filter):
     """Match a file's name using a shell-style glob pattern."""
 
+    __slots__ = ("pattern", "ignore_case", "_regex", "_fold")
+
+    cost: int = 2
+
     def __init__(
         self,
         pattern: str,
@@ -17,10 +40,22 @@ class File(Filter):
     ) -> None:
         """Create a File filter.
 
-        Pattern matching is case-insensitive by default.
+        Pattern matching is case-insensitive by default: the lowered name is matched
+        against the lowered pattern. As with fnmatch.fnmatch(), name and pattern are
+        also passed through os.path.normcase, so on Windows matching stays
+        case-insensitive even with ignore_case=False. The glob is translated to a
+        regular expression once here rather than on every match().
         """
         self.pattern = pattern.lower() if ignore_case else pattern
         self.ignore_case = ignore_case
+        normalized = os.path.normcase(self.pattern) if _NORMCASE else self.pattern
+        self._regex = re.compile(fnmatch.translate(normalized))
+        self._fold = name_folder(ignore_case)
+
+    @property
+    def regex(self) -> "re.Pattern[str]":
+        """Return the compiled glob match() applies to the (lowered) file name."""
+        return self._regex
 
     def match(
         self,
@@ -29,5 +64,5 @@ class File(Filter):
         now: DatetimeOrNone = None,
     ) -> bool:
         """Return True if the filename matches the configured pattern."""
-        fname = path.name.lower() if self.ignore_case else path.name
-        return fnmatch.fnmatch(fname, self.pattern)
+        fname = path.name if self._fold is None else self._fold(path.name)
+        return self._regex.match(fname) is not None
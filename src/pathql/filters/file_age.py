@@ -22,7 +22,7 @@ from typing import Callable
 
 from .alias import IntOrNone, StatProxyOrNone
 from .attribute_filter import AttributeFilter
-from .date_filename import filename_to_datetime_parts
+from .date_filename import filename_to_datetime_parts, wallclock_seconds
 
 
 class FilenameAgeBase(AttributeFilter):
@@ -31,6 +31,10 @@ class FilenameAgeBase(AttributeFilter):
     date parts, not filesystem timestamps. Supports operator overloads for
     expressive queries.
     """
+
+    __slots__ = ()
+
+    cost: int = 2
     unit_seconds: float = 1.0
 
     def __init__(
@@ -67,13 +71,16 @@ class FilenameAgeBase(AttributeFilter):
             parts = filename_to_datetime_parts(path)
             if parts is None:
                 raise ValueError(f"Filename does not contain a valid date for age : {path}")
-            file_date = dt.datetime(
+            file_seconds = wallclock_seconds(
                 parts.year,
                 parts.month if parts.month is not None else 1,
                 parts.day if parts.day is not None else 1,
                 parts.hour if parts.hour is not None else 0,
             )
-            age_seconds = (now - file_date).total_seconds()
+            now_seconds = (
+                now.toordinal() * 86400 + now.hour * 3600 + now.minute * 60 + now.second
+            )
+            age_seconds = (now_seconds - file_seconds) + now.microsecond / 1_000_000
             return int(math.floor(age_seconds / self.unit_seconds))
 
         super().__init__(
@@ -110,19 +117,31 @@ class FilenameAgeBase(AttributeFilter):
 
 class FilenameAgeMinutes(FilenameAgeBase):
     """Filename age filter in minutes."""
+
+    __slots__ = ()
+
     unit_seconds = 60.0
 
 
 class FilenameAgeHours(FilenameAgeBase):
     """Filename age filter in hours."""
+
+    __slots__ = ()
+
     unit_seconds = 3600.0
 
 
 class FilenameAgeDays(FilenameAgeBase):
     """Filename age filter in days."""
+
+    __slots__ = ()
+
     unit_seconds = 86400.0
 
 
 class FilenameAgeYears(FilenameAgeBase):
     """Filename age filter in years."""
+
+    __slots__ = ()
+
     unit_seconds = 86400.0 * 365.25
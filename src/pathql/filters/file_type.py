@@ -18,7 +18,10 @@ class FileType(Filter):
         FileType().unknown
     """
 
+    __slots__ = ("type_name",)
+
     # StatProxy-based, no requires_stat logic needed
+    cost: int = 5
 
     FILE: str = "file"
     DIRECTORY: str = "directory"
@@ -54,26 +57,43 @@ class FileType(Filter):
         stat_proxy: StatProxyOrNone = None,  # type: ignore[name-defined]
         now: DatetimeOrNone = None,
     ) -> bool:
-        """Check if the path matches the specified type."""
+        """
+        Check if the path matches the specified type.
+
+        When the proxy carries an os.DirEntry, the link, file and directory checks are
+        answered from readdir's d_type without a stat() (a symlink still stats its
+        target for the directory check); only unknown needs the full stat().
+
+        A missing proxy (ValueError) or a path that cannot be stat'd (OSError: missing,
+        broken link, no access) matches only UNKNOWN. Any other exception raised by
+        the proxy propagates instead of being reported as a non-match.
+        """
         try:
             if stat_proxy is None:
                 raise ValueError("FileType requires stat_proxy, but none was provided.")
 
+            dirent = stat_proxy.dirent
+            if dirent is not None:
+                if self.type_name == FileType.FILE:
+                    return dirent.is_file(follow_symlinks=False)
+                if self.type_name == FileType.DIRECTORY:
+                    return dirent.is_dir()
+            is_link = dirent.is_symlink() if dirent is not None else path.is_symlink()
             if self.type_name == FileType.LINK:
-                return path.is_symlink()
-            if not path.exists():
-                return self.type_name == FileType.UNKNOWN
-            st = stat_proxy.stat()
-            mode = st.st_mode
-            if self.type_name == FileType.FILE:
-                # Only return True for regular files that are NOT symlinks
-                return stat.S_ISREG(mode) and not path.is_symlink()
-            if self.type_name == FileType.DIRECTORY:
-                return stat.S_ISDIR(mode)
-            if self.type_name == FileType.UNKNOWN:
-                return not (
-                    stat.S_ISREG(mode) or stat.S_ISDIR(mode) or stat.S_ISLNK(mode)
-                )
-            return False
-        except Exception:  # type: ignore[broad-except]
+                return is_link
+            # A missing path (or broken link) makes stat() raise: handled as unknown below.
+            return self._mode_matches(stat_proxy.stat().st_mode, is_link)
+        except (OSError, ValueError):
+            # No proxy, or the path cannot be stat'd (missing, broken link, no access).
             return self.type_name == FileType.UNKNOWN
+
+    def _mode_matches(self, mode: int, is_link: bool) -> bool:
+        """Return True if a stat st_mode (and the link flag) is of this filter's type."""
+        if self.type_name == FileType.FILE:
+            # Only return True for regular files that are NOT symlinks
+            return stat.S_ISREG(mode) and not is_link
+        if self.type_name == FileType.DIRECTORY:
+            return stat.S_ISDIR(mode)
+        if self.type_name == FileType.UNKNOWN:
+            return not (stat.S_ISREG(mode) or stat.S_ISDIR(mode) or stat.S_ISLNK(mode))
+        return False
@@ -12,6 +12,7 @@ comparison with datetime objects, allowing expressive queries such as:
 Use the .created, .modified, .accessed, or .filename properties for source selection.
 """
 
+import calendar
 import datetime as dt
 import operator
 import pathlib
@@ -19,7 +20,57 @@ from typing import Any, Callable
 
 from .alias import StatProxyOrNone
 from .attribute_filter import AttributeFilter
-from .date_filename import filename_to_datetime
+from .date_filename import filename_to_datetime_parts
+
+# FileDate source name -> os.stat_result timestamp field.
+_STAT_FIELDS: dict[str, str] = {
+    "modified": "st_mtime",
+    "created": "st_ctime",
+    "accessed": "st_atime",
+}
+
+
+def _datetime_key(fields: tuple[int, ...]) -> int:
+    """
+    Pack wall-clock date fields into one int that sorts like the datetime.
+
+    fields is (year, month, day, hour[, minute[, second[, microsecond]]]); omitted
+    trailing fields are 0.
+    """
+    year, month, day, hour, minute, second, microsecond = fields + (0,) * (7 - len(fields))
+    return (
+        ((((year * 100 + month) * 100 + day) * 100 + hour) * 100 + minute) * 100 + second
+    ) * 1_000_000 + microsecond
+
+
+def _epoch_us(value: dt.datetime) -> int:
+    """Return value as integer microseconds since the epoch, without float rounding."""
+    return int(value.replace(microsecond=0).timestamp()) * 1_000_000 + value.microsecond
+
+
+def _extract_filename_key(
+    path: pathlib.Path, _stat_proxy: StatProxyOrNone, _now: Any = None
+) -> int:
+    """
+    Return the filename-encoded date as a packed int (see _datetime_key).
+
+    Missing month/day/hour default to 1/1/0 like filename_to_datetime, and out of
+    range parts raise ValueError, without building a datetime per file.
+    """
+    parts = filename_to_datetime_parts(path)
+    if parts is None:
+        raise ValueError("Year is required in filename to convert to datetime.")
+    month = parts.month if parts.month is not None else 1
+    day = parts.day if parts.day is not None else 1
+    hour = parts.hour if parts.hour is not None else 0
+    if not (
+        parts.year >= dt.MINYEAR
+        and 1 <= month <= 12
+        and 1 <= day <= calendar.monthrange(parts.year, month)[1]
+        and hour <= 23
+    ):
+        raise ValueError(f"Invalid date in filename: {path}")
+    return _datetime_key((parts.year, month, day, hour))
 
 
 class FileDate(AttributeFilter):
@@ -29,6 +80,8 @@ class FileDate(AttributeFilter):
     Use .created, .modified, .accessed, or .filename properties for source selection.
     """
 
+    __slots__ = ("source", "cost")
+
     def __init__(
         self,
         source: str = "modified",
@@ -37,35 +90,41 @@ class FileDate(AttributeFilter):
     ):
         """
         Initialize a FileDate filter for file date comparison.
+
+        The threshold datetime is converted once here: to integer epoch microseconds
+        for stat-based sources, and to a packed date int for the filename source.
+        Matching then compares plain numbers instead of building a datetime per file.
+        Stat times are rounded to the microsecond, the resolution of datetime, so
+        FileDate().modified == some_datetime holds for a file whose mtime equals that
+        datetime to the microsecond even if the filesystem stores nanoseconds.
+
         Args:
             source: Which date to use ('modified', 'created', 'accessed', 'filename').
             op: Comparison operator (e.g., operator.gt).
             value: Datetime threshold for comparison.
         """
         self.source = source
+        if source == "filename":
+            if isinstance(value, dt.datetime):
+                value = _datetime_key(tuple(value.timetuple())[:6] + (value.microsecond,))
+            super().__init__(_extract_filename_key, op, value, requires_stat=False)
+            self.cost = 2
+            return
+        if source not in _STAT_FIELDS:
+            raise ValueError(f"Unknown source for FileDate: `{source}`")
+
+        stat_field = _STAT_FIELDS[source]
 
         def extractor(
-            path: pathlib.Path, stat_proxy: StatProxyOrNone, now: Any = None
-        ) -> dt.datetime:
-            if self.source in ("modified", "created", "accessed"):
-                if stat_proxy is None:
-                    raise ValueError(
-                        f"Missing stat_proxy for FileDate filter {self.source}"
-                    )
-                st = stat_proxy.stat()
-                if self.source == "modified":
-                    return dt.datetime.fromtimestamp(st.st_mtime)
-                elif self.source == "created":
-                    return dt.datetime.fromtimestamp(st.st_ctime)
-                elif self.source == "accessed":
-                    return dt.datetime.fromtimestamp(st.st_atime)
-            elif self.source == "filename":
-                return filename_to_datetime(path)
-            raise ValueError(f"Unknown source for FileDate: `{self.source}`")
-
-        super().__init__(
-            extractor, op, value, requires_stat=(self.source != "filename")
-        )
+            _path: pathlib.Path, stat_proxy: StatProxyOrNone, _now: Any = None
+        ) -> int:
+            if stat_proxy is None:
+                raise ValueError(f"Missing stat_proxy for FileDate filter {source}")
+            return round(getattr(stat_proxy.stat(), stat_field) * 1_000_000)
+
+        epoch = _epoch_us(value) if isinstance(value, dt.datetime) else value
+        super().__init__(extractor, op, epoch, requires_stat=True)
+        self.cost = AttributeFilter.cost
 
     @property
     def accessed(self) -> "FileDate":
@@ -8,6 +8,8 @@ class ProxyNotNeededTriggersExceptionOnUsage(StatProxy):
     that stat was not needed or should not be used in this context.
     """
 
+    __slots__ = ()
+
     def __init__(self, path:pathlib.Path|None=None):
         self.path = path
 
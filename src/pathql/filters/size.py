@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import operator
 import pathlib
 import re
 from types import NotImplementedType
@@ -56,18 +58,7 @@ def _parse_size(value: object) -> int | NotImplementedType:
     elif isinstance(value, float):
         val = value
     elif isinstance(value, str):
-        m = _SIZE_RE.match(value)
-        if not m:
-            raise ValueError(f"invalid size string: {value!r}")
-        num_str, unit = m.group(1), (m.group(2) or "").lower()
-        try:
-            num = float(num_str)
-        except ValueError as exc:
-            raise ValueError(f"invalid numeric value in size: {value!r}") from exc
-        multiplier = _UNIT_MULTIPLIERS.get(unit)
-        if multiplier is None:
-            raise ValueError(f"unknown size unit: {unit!r}")
-        val = num * multiplier
+        return _parse_size_str(value)
     else:
         return NotImplemented
 
@@ -77,6 +68,23 @@ def _parse_size(value: object) -> int | NotImplementedType:
     return int(val)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_size_str(value: str) -> int:
+    """Parse a size string like "1.5 kb" into bytes; queries reuse a few such strings."""
+    m = _SIZE_RE.match(value)
+    if not m:
+        raise ValueError(f"invalid size string: {value!r}")
+    num_str, unit = m.group(1), (m.group(2) or "").lower()
+    try:
+        num = float(num_str)
+    except ValueError as exc:
+        raise ValueError(f"invalid numeric value in size: {value!r}") from exc
+    multiplier = _UNIT_MULTIPLIERS.get(unit)
+    if multiplier is None:
+        raise ValueError(f"unknown size unit: {unit!r}")
+    return int(num * multiplier)
+
+
 def parse_size(value: object) -> int:
     """
     Parse a file size value and return the byte count as an int.
@@ -113,6 +121,10 @@ def _extract_size(
 class Size(AttributeFilter):
     """Filter for file size (in bytes), supports operator overloads."""
 
+    __slots__ = ()
+
+    stat_column = "st_size"
+
     def __init__(self, op: Callable[[int, int], bool] = None, value: object = None):
         """
         Initialize a Size filter for file size in bytes.
@@ -127,34 +139,34 @@ class Size(AttributeFilter):
         """
         Return a Size filter for files <= other bytes.
         """
-        return Size(lambda x, y: x <= y, parse_size(other))
+        return Size(operator.le, parse_size(other))
 
     def __lt__(self, other: object) -> "Size":
         """
         Return a Size filter for files < other bytes.
         """
-        return Size(lambda x, y: x < y, parse_size(other))
+        return Size(operator.lt, parse_size(other))
 
     def __ge__(self, other: object) -> "Size":
         """
         Return a Size filter for files >= other bytes.
         """
-        return Size(lambda x, y: x >= y, parse_size(other))
+        return Size(operator.ge, parse_size(other))
 
     def __gt__(self, other: object) -> "Size":
         """
         Return a Size filter for files > other bytes.
         """
-        return Size(lambda x, y: x > y, parse_size(other))
+        return Size(operator.gt, parse_size(other))
 
     def __eq__(self, other: object) -> "Size":
         """
         Return a Size filter for files == other bytes.
         """
-        return Size(lambda x, y: x == y, parse_size(other))
+        return Size(operator.eq, parse_size(other))
 
     def __ne__(self, other: object) -> "Size":
         """
         Return a Size filter for files != other bytes.
         """
-        return Size(lambda x, y: x != y, parse_size(other))
+        return Size(operator.ne, parse_size(other))
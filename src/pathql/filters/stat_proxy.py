@@ -5,15 +5,39 @@ StatProxy: Lazy, cached stat() for PathQL filters, with stat call counting.
 import os
 import pathlib
 import threading
+from typing import Callable
+
+
+def path_stat(path: pathlib.Path) -> os.stat_result:
+    """Return path.stat(); the default StatProxy.stat_func."""
+    return path.stat()
 
 
 class StatProxy:
     """
     Lazily calls .stat() on a pathlib.Path, caching the result and counting calls.
+
+    One proxy is shared by every filter evaluated against the same path, so
+    combinators like `(Size() > 10) & (AgeDays() < 5)` issue a single stat syscall.
+
+    Set the class attribute `stat_func` (e.g. to fast_stat.stat_dont_sync) to replace
+    the stat call used by every proxy, including ones built from a DirEntry. With the
+    default, path_stat, a proxy built from a DirEntry uses the entry's stat instead.
     """
 
-    def __init__(self, path: pathlib.Path):
+    __slots__ = ("path", "_dirent", "_stat", "_stat_error", "_stat_calls", "_lock")
+
+    stat_func: Callable[[pathlib.Path], os.stat_result] = path_stat
+
+    def __init__(self, path: pathlib.Path, dirent: os.DirEntry | None = None):
+        """
+        Args:
+            path: Path to stat.
+            dirent: Optional os.DirEntry for path (e.g. from os.scandir); its cached
+                stat is used instead of calling path.stat().
+        """
         self.path = path
+        self._dirent = dirent
         self._stat = None
         self._stat_error = None
         self._stat_calls = 0
@@ -31,7 +55,11 @@ class StatProxy:
             self._stat_calls += 1
             if self._stat is None and self._stat_error is None:
                 try:
-                    self._stat = self.path.stat()
+                    stat_func = type(self).stat_func
+                    if self._dirent is not None and stat_func is path_stat:
+                        self._stat = self._dirent.stat()
+                    else:
+                        self._stat = stat_func(self.path)
                 except Exception as e:
                     self._stat_error = e
                     raise
@@ -39,6 +67,26 @@ class StatProxy:
                 raise self._stat_error
             return self._stat
 
+    def invalidate(self) -> None:
+        """Drop the cached stat result (or error) so the next stat() hits the filesystem."""
+        with self._lock:
+            self._dirent = None
+            self._stat = None
+            self._stat_error = None
+
+    # Subclasses that skip __init__ (e.g. StatProxyGuard) leave the slots below unset,
+    # so the read-only properties fall back to None for them.
+
+    @property
+    def cached_stat(self) -> os.stat_result | None:
+        """Return the stat result if stat() already succeeded, without calling it."""
+        return getattr(self, "_stat", None)
+
+    @property
+    def dirent(self) -> os.DirEntry | None:
+        """Return the os.DirEntry this proxy was built from, if any."""
+        return getattr(self, "_dirent", None)
+
     @property
     def stat_calls(self) -> int:
         """Return the number of times stat() was called on this proxy."""
@@ -12,6 +12,8 @@ class StatProxyGuard(StatProxy):
     inappropriate stat usage early in development or testing.
     """
 
+    __slots__ = ()
+
     def __init__(self, path: PathOrNone = None):  # pylint: disable=super-init-not-called
         self.path = path
 
@@ -14,6 +14,7 @@ The Stem filter is composable with other filters and supports instance-level equ
 and inequality operators for expressive query building.
 """
 
+import functools
 import pathlib
 import re
 from typing import List, Union
@@ -21,6 +22,19 @@ from typing import List, Union
 from .base import Filter
 from .alias import StatProxyOrNone, DatetimeOrNone
 
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(patterns: tuple[str, ...]) -> "tuple[re.Pattern[str], ...]":
+    """
+    Compile each stem pattern for fullmatch.
+
+    Patterns are regexes in which '*' is shorthand for '.*'. They are compiled one by
+    one, so groups, backreferences and inline flags keep their meaning. Cached per
+    pattern tuple, so rebuilding a Stem filter with the same patterns skips the compile.
+    """
+    return tuple(re.compile(p.replace("*", ".*")) for p in patterns)
+
+
 class Stem(Filter):
     """
     Filter for matching the file stem (filename without extension), supports wildcards.
@@ -32,8 +46,15 @@ class Stem(Filter):
         Stem() == "foo"            # New style
         Stem() == ["foo*", "bar*"] # New style, multiple patterns
         Stem() != "foo"            # Negation
+
+    Patterns are compiled when the filter is built, so an invalid regex raises
+    re.error from Stem(...) rather than from match().
     """
 
+    __slots__ = ("ignore_case", "patterns", "_regexes", "_negate")
+
+    cost: int = 2
+
     def __init__(
         self,
         patterns: Union[str, List[str], None] = None,
@@ -46,8 +67,19 @@ class Stem(Filter):
         """
         self.ignore_case = ignore_case
         self.patterns = self._normalize_patterns(patterns)
+        self._regexes = _compile_patterns(tuple(self.patterns))
         self._negate = False  # For != operator
 
+    @property
+    def regexes(self) -> "tuple[re.Pattern[str], ...]":
+        """Return the compiled patterns match() fullmatches against the stem."""
+        return self._regexes
+
+    @property
+    def negated(self) -> bool:
+        """Return True if this filter was built with != and matches non-matching stems."""
+        return self._negate
+
     def _normalize_patterns(self, patterns: Union[str, List[str], None]) -> List[str]:
         """
         Normalize input patterns to a list of strings, lowercased if ignore_case is True.
@@ -76,11 +108,11 @@ class Stem(Filter):
         Return True if the file's stem matches any of the patterns (supports wildcards).
         Raises ValueError if no patterns are set.
         """
-        if not self.patterns:
+        if not self._regexes:
             raise ValueError("Stem filter requires at least one pattern.")
         stem = path.stem.lower() if self.ignore_case else path.stem
-        for pattern in self.patterns:
-            if re.fullmatch(pattern.replace("*", ".*"), stem):
+        for regex in self._regexes:
+            if regex.fullmatch(stem):
                 return not self._negate
         return self._negate
 
@@ -16,13 +16,43 @@ The Suffix filter is composable with other filters and supports instance-level e
 and inequality operators for expressive query building.
 """
 
+import functools
 import pathlib
 import re
+import sys
 from typing import List
 
 from .alias import DatetimeOrNone, StrOrListOfStr, StatProxyOrNone
 from .base import Filter
-from .stat_proxy_guard import StatProxyGuard
+
+# From this many suffixes up, a set lookup on the text after the last dot beats
+# str.endswith(tuple), which tries every suffix in turn.
+_SET_LOOKUP_MIN = 5
+
+
+def suffix_set(suffixes: tuple[str, ...]) -> frozenset[str] | None:
+    """
+    Return suffixes as a set for last-dot lookup, or None if endswith should be used.
+
+    name[name.rfind("."):] in suffix_set(...) equals name.endswith(suffixes) when every
+    suffix has a single leading dot, which multi-part ones like ".tar.gz" do not.
+    """
+    if len(suffixes) < _SET_LOOKUP_MIN or any("." in s[1:] for s in suffixes):
+        return None
+    return frozenset(suffixes)
+
+
+@functools.lru_cache(maxsize=256)
+def _dotted(patterns: tuple[str, ...]) -> tuple[tuple[str, ...], frozenset[str] | None]:
+    """
+    Return the interned dotted suffixes for patterns and their suffix_set().
+
+    Queries build the same few Suffix filters over and over; equal pattern lists share
+    one suffix tuple (and set) instead of each instance allocating its own.
+    """
+    dotted = tuple(sys.intern(p if p.startswith(".") else f".{p}") for p in patterns)
+    return dotted, suffix_set(dotted)
+
 
 class Suffix(Filter):
     """
@@ -30,6 +60,8 @@ class Suffix(Filter):
     Accepts a string or list of extensions and matches files with those extensions.
     """
 
+    __slots__ = ("nosplit", "ignore_case", "patterns", "_suffixes", "_suffix_set", "_negate")
+
     def __init__(
         self,
         patterns: StrOrListOfStr | None = None,
@@ -45,8 +77,20 @@ class Suffix(Filter):
         self.nosplit = nosplit
         self.ignore_case = ignore_case
         self.patterns = self._normalize_patterns(patterns)
+        # Dotted suffixes, so matching is a single str.endswith(tuple) call.
+        self._suffixes, self._suffix_set = _dotted(tuple(self.patterns))
         self._negate = False  # For != operator
 
+    @property
+    def dotted_suffixes(self) -> tuple[str, ...]:
+        """Return the patterns as dot-prefixed suffixes, as match() compares them."""
+        return self._suffixes
+
+    @property
+    def negated(self) -> bool:
+        """Return True if this filter was built with != and matches non-matching names."""
+        return self._negate
+
     def _normalize_patterns(self, patterns: StrOrListOfStr | None) -> List[str]:
         if patterns is None:
             return []
@@ -81,16 +125,10 @@ class Suffix(Filter):
         """
         if not self.patterns:
             raise ValueError("Suffix filter requires at least one pattern.")
-        if stat_proxy is None:
-            stat_proxy = StatProxyGuard(path)
-
         filename = path.name.lower() if self.ignore_case else path.name
-        for pattern in self.patterns:
-            # Ensure pattern starts with a dot
-            dot_pattern = f".{pattern}" if not pattern.startswith(".") else pattern
-            if filename.endswith(dot_pattern):
-                return not self._negate
-        return self._negate
+        if self._suffix_set is not None:
+            return (filename[filename.rfind("."):] in self._suffix_set) != self._negate
+        return filename.endswith(self._suffixes) != self._negate
 
     def __eq__(self, other: object):
         """
@@ -1,8 +1,9 @@
 """
-Query engine for pathql: threaded producer-consumer file search and filtering.
+Query engine for pathql: file search and filtering, serial or on a thread pool.
 
-This module defines the Query class, which uses a producer thread to walk the filesystem
-and a consumer (main thread) to filter files using pathql filters.
+This module defines the Query class, which walks the filesystem with os.scandir and
+filters files using pathql filters. Threaded queries scan and filter each directory
+as one task on a worker pool.
 
 Supports both classic constructor configuration and fluent/builder-style chained setup:
     Query(from_paths="...", where_expr=Suffix() == ".txt")
@@ -10,10 +11,11 @@ Supports both classic constructor configuration and fluent/builder-style chained
 """
 
 import datetime as dt
+import os
 import pathlib
-import queue
-import threading
-from typing import Iterator
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, NamedTuple
 
 from .filters.alias import (
     DatetimeOrNone,
@@ -21,16 +23,55 @@ from .filters.alias import (
     StrOrPath,
     StrPathOrListOfStrPath,
 )
-from .filters.base import AllowAll, Filter
+from .filters.base import (
+    All,
+    AllowAll,
+    AllowNone,
+    AndFilter,
+    Any,
+    Filter,
+    NotFilter,
+    OrFilter,
+)
+from .filters.file import File, name_folder
 from .filters.stat_proxy import StatProxy
+from .filters.stem import Stem
+from .filters.suffix import Suffix, suffix_set
 from .result_set import ResultSet
+from .walker import DirListing, list_dir, scan_dirs
+
+# Number of walked paths evaluated together by Filter.match_batch in unthreaded walks.
+_MATCH_BATCH_SIZE = 256
+
+# Worker threads for threaded walks; each task scans and filters one directory.
+_THREAD_WORKERS = os.cpu_count() or 4
+
+# A matched path and the StatProxy it was matched with (None if no proxy was needed).
+_Match = tuple[pathlib.Path, StatProxy | None]
+
+NamePredicate = Callable[[str], bool]
+
+
+class _Walk(NamedTuple):
+    """
+    Settings for walking one root, resolved from the query defaults by _matches.
+
+    stat_cache / dir_cache, when given, share proxies and directory listings with the
+    walks of other roots that use the same caches.
+    """
+
+    recursive: bool
+    files: bool
+    now: dt.datetime
+    stat_cache: dict[pathlib.Path, StatProxy] | None = None
+    dir_cache: dict[pathlib.Path, DirListing] | None = None
 
 
 class Query(Filter):
     """
     Query engine for pathql.
 
-    Uses a threaded producer-consumer model to walk the filesystem and filter files.
+    Walks the filesystem serially, or with one task per directory on a thread pool.
 
     Supports both classic constructor configuration and fluent/builder-style chained setup.
     """
@@ -57,21 +98,25 @@ class Query(Filter):
             threaded (bool): Whether to use threaded search.
         """
         self._from_paths: StrPathOrListOfStrPath = from_paths
+        self._roots: list[pathlib.Path] = _as_paths(from_paths)
         self._where_expr: Filter = where_expr or AllowAll()
         self._recursive: bool = recursive
         self._files_only: bool = files_only
         self._now: DatetimeOrNone = now
         self._threaded: bool = threaded
+        self._plan: tuple[NamePredicate | None, bool] | None = None
 
     # --- Builder/Fluent API methods ---
     def from_paths(self, paths: StrPathOrListOfStrPath) -> "Query":
         """Set the source path(s) for the query."""
         self._from_paths = paths
+        self._roots = _as_paths(paths)
         return self
 
     def where(self, expr: Filter) -> "Query":
         """Set the filter expression for the query."""
         self._where_expr = expr
+        self._plan = None
         return self
 
     def recursive(self, value: bool = True) -> "Query":
@@ -127,6 +172,29 @@ class Query(Filter):
         return self._threaded
 
     # --- Query logic ---
+    def _name_plan(self) -> tuple[NamePredicate | None, bool]:
+        """
+        Return (pushed-down name predicate, name_exact) for the WHERE expression, built
+        on first use and reused by every later files/select call until where() replaces
+        the expression. name_exact is True when the name predicate alone decides the
+        expression, so walkers can skip evaluating it entirely.
+        """
+        if self._plan is None:
+            self._plan = _name_predicate(self._where_expr)
+        return self._plan
+
+    @staticmethod
+    def _extract_name_predicate(expr: Filter) -> NamePredicate | None:
+        """
+        Return a function of DirEntry.name that is False whenever expr cannot match.
+
+        Recognizes Suffix, Stem and File (and their negations) combined with AND/OR,
+        All/Any and NOT. Non-name conjuncts are dropped, so the predicate may accept
+        names the full expression rejects; it never rejects a name expr would accept.
+        Returns None if no name-level check can be pushed down to the walker.
+        """
+        return _name_predicate(expr)[0]
+
     def match(
         self,
         path: pathlib.Path,
@@ -135,67 +203,119 @@ class Query(Filter):
     ) -> bool:
         """
         Check if a single path matches the filter expression.
+
+        A StatProxy is created when none is given, so every filter in the expression
+        shares one stat() of the path. The expression is evaluated with match_batch,
+        as in files(), so a path matches here exactly when a walk would yield it.
         """
         if now is None:
             now = dt.datetime.now()
-        return self._where_expr.match(path, stat_proxy, now=now)
+        if stat_proxy is None:
+            stat_proxy = StatProxy(path)
+        return bool(self._where_expr.match_batch([path], [stat_proxy], now=now)[0])
 
     def _unthreaded_files(
         self,
         path: StrOrPath,
-        recursive: bool = True,
-        files: bool = True,
-        now: DatetimeOrNone = None,
-    ) -> Iterator[pathlib.Path]:
+        walk: _Walk,
+    ) -> Iterator[_Match]:
         """
-        Yield files matching filter expression using a single-threaded approach (no queue/thread).
+        Yield (path, proxy) for files matching filter expression using a single-threaded
+        approach (no queue/thread); proxy is None when the name alone decided the match.
+
+        Walks with os.scandir so the file-type check and any stat() reuse the DirEntry.
+        Name-level predicates are pushed down to the walker and checked on the entry
+        name first; the full expression still decides the survivors unless the name
+        alone decides it. pathlib.Path objects are only built for files that reach the
+        filter. Candidates are matched in batches of _MATCH_BATCH_SIZE via
+        Filter.match_batch.
         """
         if isinstance(path, str):
             path = pathlib.Path(path)
-        if now is None:
-            now = dt.datetime.now()
-        iterator = path.rglob("*") if recursive else path.glob("*")
-        for p in iterator:
-            if files and not p.is_file():
-                continue
-            stat_proxy = StatProxy(p)
-            if self._where_expr.match(p, stat_proxy, now=now):
-                yield p
+        files, now, stat_cache = walk.files, walk.now, walk.stat_cache
+        name_pred, name_exact = self._name_plan()
+        paths: list[pathlib.Path] = []
+        proxies: list[StatProxy] = []
+        for directory, entries in scan_dirs(
+            path, recursive=walk.recursive, name_filter=name_pred, dir_cache=walk.dir_cache
+        ):
+            for entry in entries:
+                if files and not entry.is_file():
+                    continue
+                p = directory / entry.name
+                if name_exact:
+                    yield p, None
+                    continue
+                paths.append(p)
+                proxies.append(_stat_proxy(p, entry, stat_cache))
+                if len(paths) >= _MATCH_BATCH_SIZE:
+                    yield from self._match_batch(paths, proxies, now)
+                    paths, proxies = [], []
+        if paths:
+            yield from self._match_batch(paths, proxies, now)
+
+    def _match_batch(
+        self,
+        paths: list[pathlib.Path],
+        proxies: list[StatProxy],
+        now: dt.datetime,
+    ) -> Iterator[tuple[pathlib.Path, StatProxy]]:
+        """Yield (path, proxy) for the batch entries that match the expression, in order."""
+        mask = self._where_expr.match_batch(paths, proxies, now=now)
+        for p, proxy, matched in zip(paths, proxies, mask):
+            if matched:
+                yield p, proxy
 
     def _threaded_files(
         self,
         path: StrOrPath,
-        recursive: bool = True,
-        files: bool = True,
-        now: DatetimeOrNone = None,
-    ) -> Iterator[pathlib.Path]:
+        walk: _Walk,
+    ) -> Iterator[_Match]:
         """
-        Yield files matching the filter expression using a threaded producer-consumer model.
+        Yield (path, proxy) for files matching the filter expression using a pool of
+        directory tasks; proxy is None when the name alone decided the match.
+
+        Each task scandirs one directory, drops entries whose name fails the pushed-down
+        name predicate, evaluates the rest with one Filter.match_batch call (as the
+        unthreaded walk does) and returns (matches, subdirs); subdirs are submitted as
+        new tasks as soon as their parent finishes. Results are yielded in the same
+        order as the unthreaded walk, whatever order the tasks complete in.
         """
         if isinstance(path, str):
             path = pathlib.Path(path)
-        if now is None:
-            now = dt.datetime.now()
-        q: queue.Queue[pathlib.Path | None] = queue.Queue(maxsize=10)
+        recursive, files, now, stat_cache, dir_cache = walk
+        name_pred, name_exact = self._name_plan()
 
-        def producer():
-            iterator = path.rglob("*") if recursive else path.glob("*")
-            for p in iterator:
-                if files and not p.is_file():
+        def scan_dir(directory: pathlib.Path) -> tuple[list[_Match], list[pathlib.Path]]:
+            entries, subdirs = list_dir(directory, dir_cache)
+            matches: list[_Match] = []
+            paths: list[pathlib.Path] = []
+            proxies: list[StatProxy] = []
+            for entry in entries:
+                if name_pred is not None and not name_pred(entry.name):
+                    continue
+                if files and not entry.is_file():
+                    continue
+                p = directory / entry.name
+                if name_exact:
+                    matches.append((p, None))
                     continue
-                q.put(p)
-            q.put(None)  # Sentinel to signal completion
-
-        t = threading.Thread(target=producer, daemon=True)
-        t.start()
-        while True:
-            p = q.get()
-            if p is None:
-                break
-            stat_proxy = StatProxy(p)
-            if self._where_expr.match(p, stat_proxy, now=now):
-                yield p
-        t.join()
+                paths.append(p)
+                proxies.append(_stat_proxy(p, entry, stat_cache))
+            if paths:
+                matches.extend(self._match_batch(paths, proxies, now))
+            return matches, subdirs if recursive else []
+
+        pool = ThreadPoolExecutor(max_workers=_THREAD_WORKERS)
+        try:
+            # Consume tasks in scan_dirs() order; submitted siblings keep the pool busy.
+            stack: list[Future] = [pool.submit(scan_dir, path)]
+            while stack:
+                matches, subdirs = stack.pop().result()
+                yield from matches
+                stack.extend(reversed([pool.submit(scan_dir, d) for d in subdirs]))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def files(
         self,
@@ -209,8 +329,37 @@ class Query(Filter):
         Yield files matching the filter expression for a single path or a list of paths.
         Handles both threaded and non-threaded modes. Uses default from_path if paths not given.
         """
-        if from_paths is None:
-            from_paths = self._from_paths
+        for path, _ in self._matches(from_paths, recursive, files_only, now, threaded):
+            yield path
+
+    def entries(
+        self,
+        from_paths: StrPathOrListOfStrPath | None = None,
+        recursive: bool | None = None,
+        files_only: bool | None = None,
+        now: DatetimeOrNone = None,
+        threaded: bool | None = None,
+    ) -> Iterator[tuple[pathlib.Path, os.stat_result | None]]:
+        """
+        Yield (path, stat) for the files files() would yield, in the same order.
+
+        stat is the stat result the filters already fetched while matching the path,
+        so callers can read sizes and times without another stat() call. It is None
+        when no filter needed it (e.g. name-only queries).
+        """
+        for path, proxy in self._matches(from_paths, recursive, files_only, now, threaded):
+            yield path, proxy.cached_stat if proxy is not None else None
+
+    def _matches(
+        self,
+        from_paths: StrPathOrListOfStrPath | None,
+        recursive: bool | None,
+        files_only: bool | None,
+        now: DatetimeOrNone,
+        threaded: bool | None,
+    ) -> Iterator[_Match]:
+        """Yield (path, proxy) for each match, applying the query defaults; see files()."""
+        path_list = self._roots if from_paths is None else _as_paths(from_paths)
         if recursive is None:
             recursive = self._recursive
         if files_only is None:
@@ -219,20 +368,18 @@ class Query(Filter):
             now = self._now or dt.datetime.now()
         if threaded is None:
             threaded = self._threaded
-        if isinstance(from_paths, (str, pathlib.Path)):
-            path_list = [from_paths]
-        else:
-            path_list = list(from_paths)
-        path_list = [pathlib.Path(p) for p in path_list]
-        for path in path_list:
-            if threaded:
-                yield from self._threaded_files(
-                    path, recursive=recursive, files=files_only, now=now
-                )
-            else:
-                yield from self._unthreaded_files(
-                    path, recursive=recursive, files=files_only, now=now
-                )
+        # Overlapping roots (e.g. a dir and its subdir) revisit paths, so those roots share
+        # stats and listings. Disjoint roots never revisit a path; caching them would only
+        # hold memory.
+        shared = _overlapping_roots(path_list)
+        stat_cache: dict[pathlib.Path, StatProxy] = {}
+        dir_cache: dict[pathlib.Path, DirListing] = {}
+        walk_root = self._threaded_files if threaded else self._unthreaded_files
+        for i, path in enumerate(path_list):
+            walk = _Walk(recursive, files_only, now)
+            if i in shared:
+                walk = walk._replace(stat_cache=stat_cache, dir_cache=dir_cache)
+            yield from walk_root(path, walk)
 
     def select(
         self,
@@ -244,6 +391,303 @@ class Query(Filter):
     ) -> ResultSet:
         """
         Return a ResultSet of files matching the filter expr for a path or a list of paths.
-        Uses default from_path if paths not given.
+        Uses default from_path if paths not given. Stat results fetched while filtering
+        seed the ResultSet's stat cache, so aggregations do not stat those files again.
         """
-        return ResultSet(self.files(from_paths, recursive, files_only, now, threaded))
+        paths: list[pathlib.Path] = []
+        stats: dict[pathlib.Path, os.stat_result] = {}
+        for path, st in self.entries(from_paths, recursive, files_only, now, threaded):
+            paths.append(path)
+            if st is not None:
+                stats[path] = st
+        return ResultSet(paths, stats)
+
+
+def _as_paths(paths: StrPathOrListOfStrPath) -> list[pathlib.Path]:
+    """Normalize a path or a list/tuple of paths to a list of pathlib.Path."""
+    if isinstance(paths, (str, pathlib.Path)):
+        return [pathlib.Path(paths)]
+    return [pathlib.Path(p) for p in paths]
+
+
+def _overlapping_roots(paths: list[pathlib.Path]) -> set[int]:
+    """Return the indexes of the roots that equal, contain or lie inside another root."""
+    resolved = [p.resolve() for p in paths] if len(paths) > 1 else []
+    shared: set[int] = set()
+    for i, outer in enumerate(resolved):
+        for j, inner in enumerate(resolved[i + 1:], start=i + 1):
+            if outer == inner or outer in inner.parents or inner in outer.parents:
+                shared.update((i, j))
+    return shared
+
+
+def _stat_proxy(
+    path: pathlib.Path,
+    entry: os.DirEntry,
+    stat_cache: dict[pathlib.Path, StatProxy] | None,
+) -> StatProxy:
+    """Return the StatProxy for path, reusing the one in stat_cache if present."""
+    if stat_cache is None:
+        return StatProxy(path, entry)
+    proxy = stat_cache.get(path)
+    if proxy is None:
+        proxy = stat_cache[path] = StatProxy(path, entry)
+    return proxy
+
+
+def _stem(name: str) -> str:
+    """Return the stem of a file name, as pathlib.PurePath(name).stem does."""
+    i = name.rfind(".")
+    if i <= 0:
+        return name  # no dot, or a dotfile such as ".bashrc"
+    if i < len(name) - 1:
+        return name[:i]
+    # A trailing dot is a suffix on some Python versions and not on others.
+    return pathlib.PurePath(name).stem
+
+
+def _name_predicate(expr: Filter) -> tuple[NamePredicate | None, bool]:
+    """
+    Return (predicate, exact) for the name-level part of expr.
+
+    predicate(name) is False whenever expr cannot match a file of that name, or None
+    if nothing can be said from the name. exact is True when the name alone decides
+    expr: predicate(name) equals its result, or with a None predicate expr matches
+    everything. Exactness is what allows a NOT to be pushed down as well.
+
+    Nodes are recognized by exact type, so a user subclass that overrides match() is
+    never pushed down and is always evaluated through its own match().
+    """
+    handler = _NAME_PREDICATE_HANDLERS.get(type(expr))
+    if handler is None:
+        return None, False
+    return handler(expr)
+
+
+def _suffix_node(expr: Suffix) -> tuple[NamePredicate | None, bool]:
+    """Name plan of a Suffix: its endswith/set check."""
+    if not expr.patterns:
+        return None, False  # leave Suffix.match to raise its ValueError
+    return _suffix_predicate(expr.dotted_suffixes, expr.ignore_case, expr.negated), True
+
+
+def _stem_node(expr: Stem) -> tuple[NamePredicate | None, bool]:
+    """Name plan of a Stem: its regexes fullmatched against the stem."""
+    if not expr.regexes:
+        return None, False  # leave Stem.match to raise its ValueError
+    stem_match, negate = _stem_matcher(expr.regexes, expr.ignore_case), expr.negated
+    return (lambda name: stem_match(name) != negate), True
+
+
+def _file_node(expr: File) -> tuple[NamePredicate | None, bool]:
+    """Name plan of a File: its glob regex matched against the name."""
+    return _file_matcher(expr.regex, expr.ignore_case), True
+
+
+def _allow_all_node(_expr: AllowAll) -> tuple[NamePredicate | None, bool]:
+    """Name plan of AllowAll: every name, exactly."""
+    return None, True
+
+
+def _allow_none_node(_expr: AllowNone) -> tuple[NamePredicate | None, bool]:
+    """Name plan of AllowNone: no name, exactly."""
+    return (lambda name: False), True
+
+
+def _not_node(expr: NotFilter) -> tuple[NamePredicate | None, bool]:
+    """Name plan of a NOT: the negated operand plan, only when that plan is exact."""
+    pred, exact = _name_predicate(expr.operand)
+    if not exact:
+        return None, False
+    if pred is None:
+        return (lambda name: False), True
+    return _negation(pred), True
+
+
+def _and_node(expr: AndFilter | All) -> tuple[NamePredicate | None, bool]:
+    """Name plan of an AND/All: every operand's name check must pass."""
+    children = [expr.left, expr.right] if isinstance(expr, AndFilter) else expr.filters
+    parts = [_name_predicate(f) for f in children]
+    preds = [pred for pred, _ in parts if pred is not None]
+    exact = all(ex for _, ex in parts)
+    if not preds:
+        return None, exact
+    return _all_of(preds), exact
+
+
+def _or_node(expr: OrFilter | Any) -> tuple[NamePredicate | None, bool]:
+    """Name plan of an OR/Any: some operand's name check must pass."""
+    children, merged = _merge_or_operands(_or_operands(expr))
+    parts = [_name_predicate(f) for f in children]
+    if not parts and not merged:
+        return None, False
+    if any(pred is None and not ex for pred, ex in parts):
+        return None, False
+    if any(pred is None for pred, _ in parts):
+        return None, True  # an exact always-true branch
+    preds = merged + [pred for pred, _ in parts]
+    exact = all(ex for _, ex in parts)
+    return _any_of(preds), exact
+
+
+# Exact filter type -> its name plan; anything else is left to match().
+_NAME_PREDICATE_HANDLERS: dict[type, Callable[[Filter], tuple[NamePredicate | None, bool]]] = {
+    Suffix: _suffix_node,
+    Stem: _stem_node,
+    File: _file_node,
+    AllowAll: _allow_all_node,
+    AllowNone: _allow_none_node,
+    NotFilter: _not_node,
+    AndFilter: _and_node,
+    All: _and_node,
+    OrFilter: _or_node,
+    Any: _or_node,
+}
+
+
+def _suffix_predicate(
+    dotted: tuple[str, ...],
+    ignore_case: bool,
+    negate: bool,
+) -> NamePredicate:
+    """Return the name check of a Suffix: one endswith or set lookup over its suffixes."""
+    lookup = suffix_set(dotted)
+    if lookup is not None:
+        if ignore_case:
+            if negate:
+                return lambda name: (n := name.lower())[n.rfind("."):] not in lookup
+            return lambda name: (n := name.lower())[n.rfind("."):] in lookup
+        if negate:
+            return lambda name: name[name.rfind("."):] not in lookup
+        return lambda name: name[name.rfind("."):] in lookup
+    if ignore_case:
+        if negate:
+            return lambda name: not name.lower().endswith(dotted)
+        return lambda name: name.lower().endswith(dotted)
+    if negate:
+        return lambda name: not name.endswith(dotted)
+    return lambda name: name.endswith(dotted)
+
+
+def _or_operands(expr: Filter) -> list[Filter]:
+    """Return the operands of a tree of nested OrFilter/Any nodes, flattened."""
+    kind = type(expr)  # exact type: subclasses keep their own match()
+    if kind is OrFilter:
+        return _or_operands(expr.left) + _or_operands(expr.right)
+    if kind is Any:
+        return [f for child in expr.filters for f in _or_operands(child)]
+    return [expr]
+
+
+def _merge_or_operands(operands: list[Filter]) -> tuple[list[Filter], list[NamePredicate]]:
+    """
+    Split OR operands into the rest and merged name checks.
+
+    Plain (non-negated) Suffix operands with the same ignore_case collapse into one
+    dotted tuple, so Suffix("txt") | Suffix("md") costs a single endswith per name.
+    Stem and File operands likewise collapse into one compiled regex alternation
+    each, so N OR'd patterns cost one regex match instead of N. Regexes that define
+    groups or set global inline flags (see _alternable) are kept as separate regexes,
+    since an alternation would renumber their groups or misplace their flags.
+    """
+    rest: list[Filter] = []
+    suffixes: dict[bool, tuple[str, ...]] = {}
+    stems: dict[bool, list[re.Pattern[str]]] = {}
+    files: dict[bool, list[re.Pattern[str]]] = {}
+    for flt in operands:
+        kind = type(flt)
+        if kind is Suffix and flt.patterns and not flt.negated:
+            suffixes[flt.ignore_case] = suffixes.get(flt.ignore_case, ()) + flt.dotted_suffixes
+        elif kind is Stem and flt.regexes and not flt.negated:
+            stems.setdefault(flt.ignore_case, []).extend(flt.regexes)
+        elif kind is File:
+            files.setdefault(flt.ignore_case, []).append(flt.regex)
+        else:
+            rest.append(flt)
+    preds = [_suffix_predicate(dotted, case, False) for case, dotted in suffixes.items()]
+    for ignore_case, regexes in stems.items():
+        preds.append(_stem_matcher(_merge_regexes(regexes), ignore_case))
+    for ignore_case, regexes in files.items():
+        preds.extend(_file_matcher(regex, ignore_case) for regex in _merge_regexes(regexes))
+    return rest, preds
+
+
+# Flags of a pattern without inline global flags, e.g. re.UNICODE for str patterns.
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+
+def _alternable(regex: "re.Pattern[str]") -> bool:
+    """
+    Return True if regex can join an alternation unchanged: it defines no groups (so
+    no backreference or group name depends on numbering) and sets no global flags.
+
+    This inspects the compiled pattern, so escaped parentheses and parentheses inside
+    a character class do not count as groups.
+    """
+    return regex.groups == 0 and regex.flags == _DEFAULT_REGEX_FLAGS
+
+
+def _merge_regexes(regexes: "list[re.Pattern[str]]") -> "tuple[re.Pattern[str], ...]":
+    """Return regexes with every alternable one merged into a single alternation, first."""
+    simple = [r.pattern for r in regexes if _alternable(r)]
+    merged = (_alternation(simple),) if simple else ()
+    return merged + tuple(r for r in regexes if not _alternable(r))
+
+
+def _stem_matcher(
+    regexes: "tuple[re.Pattern[str], ...]",
+    ignore_case: bool,
+) -> NamePredicate:
+    """Return a name check that fullmatches any regex against the stem, as Stem.match does."""
+    if len(regexes) == 1:
+        fullmatch = regexes[0].fullmatch
+        if ignore_case:
+            return lambda name: fullmatch(_stem(name).lower()) is not None
+        return lambda name: fullmatch(_stem(name)) is not None
+    matchers = [r.fullmatch for r in regexes]
+
+    def any_fullmatch(name: str) -> bool:
+        """Return True if any regex fullmatches the (lowered) stem of name."""
+        stem = _stem(name).lower() if ignore_case else _stem(name)
+        return any(m(stem) for m in matchers)
+
+    return any_fullmatch
+
+
+def _file_matcher(regex: "re.Pattern[str]", ignore_case: bool) -> NamePredicate:
+    """Return a name check that matches regex against the name, as File.match does."""
+    name_match = regex.match
+    fold = name_folder(ignore_case)
+    if fold is None:
+        return lambda name: name_match(name) is not None
+    return lambda name: name_match(fold(name)) is not None
+
+
+def _alternation(sources: list[str]) -> "re.Pattern[str]":
+    """Compile regex sources into one pattern that matches where any of them does."""
+    return re.compile("|".join(f"(?:{source})" for source in sources))
+
+
+def _negation(pred: NamePredicate) -> NamePredicate:
+    """Return the negation of a name predicate."""
+    return lambda name: not pred(name)
+
+
+def _all_of(preds: list[NamePredicate]) -> NamePredicate:
+    """Return the conjunction of name predicates, without a generator for one or two."""
+    if len(preds) == 1:
+        return preds[0]
+    if len(preds) == 2:
+        first, second = preds
+        return lambda name: first(name) and second(name)
+    return lambda name: all(pred(name) for pred in preds)
+
+
+def _any_of(preds: list[NamePredicate]) -> NamePredicate:
+    """Return the disjunction of name predicates, without a generator for one or two."""
+    if len(preds) == 1:
+        return preds[0]
+    if len(preds) == 2:
+        first, second = preds
+        return lambda name: first(name) or second(name)
+    return lambda name: any(pred(name) for pred in preds)
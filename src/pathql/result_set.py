@@ -6,6 +6,8 @@ maximum values.
 
 Methods:
 - `count`: Return the count of items in the result set.
+- `get`: Return one field of one path, reusing the result set's stat cache.
+- `warmup`: Stat every uncached path on a thread pool before aggregating.
 - `sort_`: Sort the result set based on a key and order.
 - `top_n`: Return the top N items from the result set.
 - `bottom_n`: Return the bottom N items from the result set.
@@ -13,85 +15,158 @@ Methods:
 - `average`: Return the average value of the result set.
 - `min`: Return the minimum value in the result set.
 - `max`: Return the maximum value in the result set.
+- `min_max`: Return the minimum and maximum values in one pass.
+- `sorted_index`: Build a SortedIndex for repeated range lookups on one field.
 
 The `ResultSet` class is designed to work seamlessly with the PathQL query engine,
 allowing users to perform complex queries and aggregations on file systems or other
 data sources.
 """
 
+import bisect
 import datetime as dt
 import heapq
+import operator
+import os
 import pathlib
 import statistics
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
 
 from .result_fields import ResultField
 
 # scalar_aggregate is not used in this module; removed unused import
 
+# Fields computed from the path alone, keyed to their extractor. attrgetter runs in C,
+# without a Python frame per path.
+_PATH_KEYS: dict[ResultField, Callable[[pathlib.Path], Any]] = {
+    ResultField.NAME: operator.attrgetter("name"),
+    ResultField.SUFFIX: operator.attrgetter("suffix"),
+    ResultField.STEM: operator.attrgetter("stem"),
+    ResultField.PATH: str,
+    ResultField.PARENT: lambda f: str(f.parent),
+    ResultField.PARENTS: operator.attrgetter("parent.parts"),
+    ResultField.PARENTS_STEM_SUFFIX: lambda f: (f.parent.parts, f.stem, f.suffix),
+}
+
+# Fields read from the stat result: (stat attribute, convert to a datetime).
+_STAT_KEYS: dict[ResultField, tuple[str, bool]] = {
+    ResultField.SIZE: ("st_size", False),
+    ResultField.MTIME: ("st_mtime", False),
+    ResultField.CTIME: ("st_ctime", False),
+    ResultField.ATIME: ("st_atime", False),
+    ResultField.MTIME_DT: ("st_mtime", True),
+    ResultField.CTIME_DT: ("st_ctime", True),
+    ResultField.ATIME_DT: ("st_atime", True),
+}
+
+# Default pool size for ResultSet.warmup(); stat() releases the GIL, so on slow or cold
+# filesystems the calls overlap.
+_WARMUP_WORKERS = 8
+
 
 class ResultSet(list[pathlib.Path]):
     """
     A materialized list of pathlib.Path objects with aggregation and sorting methods.
+
+    Each path is stat'd at most once per result set: stat-based fields read a shared
+    cache, so several aggregations over the same files cost one stat() per file.
+    The cache is a snapshot; files changed after their first stat are not re-read.
     """
 
-    def _get_key(self, field: ResultField) -> Callable[[pathlib.Path], Any]:
+    def __init__(
+        self,
+        paths: Iterable[pathlib.Path] = (),
+        stats: dict[pathlib.Path, os.stat_result] | None = None,
+    ) -> None:
+        """
+        Args:
+            paths: The paths in the result set.
+            stats: Stat results already known for some of the paths (e.g. from the
+                walk that found them); shared with, not copied into, the cache.
         """
-        A materialized list of pathlib.Path objects with aggregation and sorting methods.
+        super().__init__(paths)
+        self._stat_cache: dict[pathlib.Path, os.stat_result] = {} if stats is None else stats
+
+    def warmup(self, max_workers: int = _WARMUP_WORKERS) -> None:
+        """
+        Stat every path not yet in the stat cache, concurrently, and cache the results.
+
+        Never called implicitly: aggregations stat serially unless the caller warms the
+        set first, e.g. for a large set on a slow or network filesystem. Paths whose
+        stat() fails are left out, so the aggregation that needs them raises the error
+        as it would without warmup.
         """
-        if field == ResultField.SIZE:
-            return lambda f: f.stat().st_size
-        elif field == ResultField.MTIME:
-            return lambda f: f.stat().st_mtime
-        elif field == ResultField.CTIME:
-            return lambda f: f.stat().st_ctime
-        elif field == ResultField.ATIME:
-            return lambda f: f.stat().st_atime
-        elif field == ResultField.MTIME_DT:
-            return lambda f: dt.datetime.fromtimestamp(f.stat().st_mtime)
-        elif field == ResultField.CTIME_DT:
-            return lambda f: dt.datetime.fromtimestamp(f.stat().st_ctime)
-        elif field == ResultField.ATIME_DT:
-            return lambda f: dt.datetime.fromtimestamp(f.stat().st_atime)
-        elif field == ResultField.NAME:
-            return lambda f: f.name
-        elif field == ResultField.SUFFIX:
-            return lambda f: f.suffix
-        elif field == ResultField.STEM:
-            return lambda f: f.stem
-        elif field == ResultField.PATH:
-            return str  # lambda f: str(f)
-        elif field == ResultField.PARENT:
-            return lambda f: str(f.parent)
-        elif field == ResultField.PARENTS:
-            return lambda f: f.parent.parts
-        elif field == ResultField.PARENTS_STEM_SUFFIX:
-            return lambda f: (f.parent.parts, f.stem, f.suffix)
-        else:
+        missing = [p for p in self if p not in self._stat_cache]
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for path, st in zip(missing, pool.map(_try_stat, missing)):
+                if st is not None:
+                    self._stat_cache[path] = st
+
+    def _stat(self, path: pathlib.Path) -> os.stat_result:
+        """Return path.stat(), calling it only the first time path is seen."""
+        st = self._stat_cache.get(path)
+        if st is None:
+            st = self._stat_cache[path] = path.stat()
+        return st
+
+    def _get_key(self, field: ResultField) -> Callable[[pathlib.Path], Any]:
+        """Return the function extracting field from a path."""
+        if not isinstance(field, ResultField):
             raise ValueError(f"Unknown field: {field}")
+        key = _PATH_KEYS.get(field)
+        if key is not None:
+            return key
+        attr, as_datetime = _STAT_KEYS[field]
+        stat, get = self._stat, operator.attrgetter(attr)
+        if as_datetime:
+            return lambda f: dt.datetime.fromtimestamp(get(stat(f)))
+        return lambda f: get(stat(f))
+
+    def get(self, field: ResultField, path: pathlib.Path) -> Any:
+        """Return field for path as the aggregations see it (stat fields come from the cache)."""
+        return self._get_key(field)(path)
 
     def max(self, field: ResultField) -> Optional[Any]:
         """Return the maximum value in the result set using built-in max."""
-        key = self._get_key(field)
-        vals = [key(f) for f in self]
-        return max(vals) if vals else None
+        return max(map(self._get_key(field), self), default=None)
 
     def min(self, field: ResultField) -> Optional[Any]:
         """Return the minimum value in the result set using built-in min."""
-        key = self._get_key(field)
-        vals = [key(f) for f in self]
-        return min(vals) if vals else None
+        return min(map(self._get_key(field), self), default=None)
+
+    def min_max(self, field: ResultField) -> tuple[Any, Any]:
+        """Return (min, max) of field in one pass, or (None, None) if the set is empty."""
+        values = map(self._get_key(field), self)
+        lo = hi = next(values, None)
+        for value in values:
+            if value < lo:
+                lo = value
+            elif value > hi:
+                hi = value
+        return lo, hi
 
     def average(self, field: ResultField) -> Optional[float]:
-        """Return the average value of the result set using statistics.mean."""
-        key = self._get_key(field)
-        vals = [key(f) for f in self]
-        return statistics.mean(vals) if vals else None
+        """
+        Return the average value of the result set, as statistics.mean would.
+
+        Integer fields (e.g. SIZE) are summed exactly and give an int when the mean is
+        whole, else the correctly rounded float, without mean's slow Fraction arithmetic.
+        Other fields use statistics.fmean (an exact fsum, then one division).
+        """
+        vals = list(map(self._get_key(field), self))
+        if not vals:
+            return None
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in vals):
+            total, n = sum(vals), len(vals)
+            return total // n if total % n == 0 else total / n
+        return statistics.fmean(vals)
 
     def median(self, field: ResultField) -> Optional[float]:
         """Return the median value of the result set."""
-        key = self._get_key(field)
-        vals = [key(f) for f in self]
+        vals = list(map(self._get_key(field), self))
         return statistics.median(vals) if vals else None
 
     def count_(self) -> int:
@@ -101,14 +176,63 @@ class ResultSet(list[pathlib.Path]):
     def sort_(self, field: ResultField, ascending: bool = True) -> "ResultSet":
         """Sort the result set based on a key and order."""
         key = self._get_key(field)
-        return ResultSet(sorted(self, key=key, reverse=not ascending))
+        return ResultSet(sorted(self, key=key, reverse=not ascending), self._stat_cache)
 
     def top_n(self, field: ResultField, n: int) -> "ResultSet":
         """Return the top N items from the result set."""
         key = self._get_key(field)
-        return ResultSet(heapq.nlargest(n, self, key=key))
+        if 2 * n >= len(self):
+            # From half the set up a full sort beats the heap; the result is the same.
+            return ResultSet(sorted(self, key=key, reverse=True)[:n], self._stat_cache)
+        return ResultSet(heapq.nlargest(n, self, key=key), self._stat_cache)
 
     def bottom_n(self, field: ResultField, n: int) -> "ResultSet":
         """Return the bottom N items from the result set."""
         key = self._get_key(field)
-        return ResultSet(heapq.nsmallest(n, self, key=key))
+        if 2 * n >= len(self):
+            return ResultSet(sorted(self, key=key)[:n], self._stat_cache)
+        return ResultSet(heapq.nsmallest(n, self, key=key), self._stat_cache)
+
+    def sorted_index(self, field: ResultField) -> "SortedIndex":
+        """Return a SortedIndex of this result set on field (e.g. MTIME or MTIME_DT)."""
+        return SortedIndex(self, self._get_key(field))
+
+
+def _try_stat(path: pathlib.Path) -> os.stat_result | None:
+    """Return path.stat(), or None if it fails."""
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+class SortedIndex:
+    """
+    Result set sorted once by a key, answering range queries by binary search.
+
+    Each between() call costs O(log N + K) for K matches instead of a full scan, so
+    build one when the same files are filtered by several date or size windows.
+    The index is a snapshot: later changes to the source ResultSet are not seen.
+    """
+
+    __slots__ = ("_keys", "_paths")
+
+    def __init__(
+        self,
+        paths: list[pathlib.Path],
+        key: Callable[[pathlib.Path], Any],
+    ) -> None:
+        """Compute each path's key once and sort by it."""
+        pairs = sorted(((key(p), p) for p in paths), key=lambda kp: kp[0])
+        self._keys = [k for k, _ in pairs]
+        self._paths = [p for _, p in pairs]
+
+    def __len__(self) -> int:
+        """Return the number of indexed paths."""
+        return len(self._paths)
+
+    def between(self, lower: Any, upper: Any) -> ResultSet:
+        """Return paths with lower <= key < upper, in ascending key order."""
+        lo = bisect.bisect_left(self._keys, lower)
+        hi = bisect.bisect_left(self._keys, upper, lo)
+        return ResultSet(self._paths[lo:hi])
@@ -7,6 +7,7 @@ matching utilities. Designed for use in file operations and filter logic.
 
 from __future__ import annotations
 
+import functools
 import pathlib
 from typing import Generator
 from collections.abc import Iterable
@@ -14,25 +15,41 @@ from collections.abc import Iterable
 from .filters.alias import StrPathOrListOfStrPath
 
 
+@functools.lru_cache(maxsize=4096)
+def _str_to_path(path: str) -> pathlib.Path:
+    """Return pathlib.Path(path), cached so repeated strings are only parsed once."""
+    return pathlib.Path(path)
+
+
 def normalize_path(
     paths: StrPathOrListOfStrPath,
 ) -> Generator[pathlib.Path, None, None]:
     """
     Normalize input into a generator of pathlib.Path objects.
     Accepts a str, pathlib.Path, or a (possibly nested) list/tuple of those.
-    Recursively flattens lists/tuples. Raises ValueError for unsupported types.
+    Flattens nested lists/tuples/iterables with an explicit stack of iterators
+    (no recursion). Raises ValueError for unsupported types.
 
     """
-    match paths:
-        case str():
-            yield pathlib.Path(paths)
-        case pathlib.Path():
-            yield paths
-        case list() | tuple():
-            for item in paths:
-                yield from normalize_path(item)
-        case Iterable():
-            for item in paths:
-                yield from normalize_path(item)
-        case _:
-            raise ValueError(f"Invalid paths argument: {paths!r}")
+    # Fast path for the common single-path call.
+    if type(paths) is str:
+        yield _str_to_path(paths)
+        return
+    if isinstance(paths, pathlib.Path):
+        yield paths
+        return
+
+    stack = [iter((paths,))]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, str):
+                yield _str_to_path(item)
+            elif isinstance(item, pathlib.Path):
+                yield item
+            elif isinstance(item, Iterable):
+                stack.append(iter(item))
+                break
+            else:
+                raise ValueError(f"Invalid paths argument: {item!r}")
+        else:
+            stack.pop()
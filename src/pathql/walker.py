@@ -0,0 +1,80 @@
+"""
+Directory walker for PathQL built on os.scandir.
+
+Yields each directory's os.DirEntry list so callers can reuse the metadata readdir
+already returned (entry type and, on Windows, full stat info) instead of issuing a
+separate stat() per path.
+"""
+
+import os
+import pathlib
+from typing import Callable, Iterator
+
+# (entries, subdirs) of one directory, as returned by list_dir().
+DirListing = tuple[list[os.DirEntry], list[pathlib.Path]]
+
+
+def scan_dirs(
+    root: pathlib.Path,
+    recursive: bool = True,
+    name_filter: Callable[[str], bool] | None = None,
+    dir_cache: dict[pathlib.Path, DirListing] | None = None,
+) -> Iterator[tuple[pathlib.Path, list[os.DirEntry]]]:
+    """
+    Yield (directory, entries) for each directory under root, covering the same entries
+    as rglob("*")/glob("*").
+
+    Directories are walked with an explicit stack (no recursion). Symlinked
+    directories are listed but not descended into, and directories that cannot be
+    read are skipped, matching pathlib's glob behavior.
+
+    If name_filter is given, only entries whose name it accepts are kept; the check
+    runs on DirEntry.name before any Path is built. Directories are still descended
+    into whether or not their own name passes.
+
+    No pathlib.Path is built per entry, so callers can defer that (directory / name)
+    to the entries they keep. dir_cache is passed on to list_dir().
+    """
+    stack: list[pathlib.Path] = [pathlib.Path(root)]
+    while stack:
+        directory = stack.pop()
+        entries, subdirs = list_dir(directory, dir_cache)
+        if name_filter is not None:
+            entries = [entry for entry in entries if name_filter(entry.name)]
+        yield directory, entries
+        if recursive:
+            # Reverse so directories are visited in listing order when popped.
+            stack.extend(reversed(subdirs))
+
+
+def list_dir(
+    directory: pathlib.Path,
+    dir_cache: dict[pathlib.Path, DirListing] | None = None,
+) -> DirListing:
+    """
+    Return (entries, subdirs) for one directory: every DirEntry, and the paths of the
+    entries that are real (non-symlink) directories. An unreadable directory is empty.
+
+    If dir_cache is given, a directory already listed through the same cache (e.g.
+    reached again from an overlapping root) is not scanned again; that includes a
+    missing directory, which is cached as empty for the lifetime of the cache.
+    """
+    if dir_cache is not None:
+        listing = dir_cache.get(directory)
+        if listing is None:
+            listing = dir_cache[directory] = list_dir(directory)
+        return listing
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+    return entries, [directory / entry.name for entry in entries if _is_real_dir(entry)]
+
+
+def _is_real_dir(entry: os.DirEntry) -> bool:
+    """Return True if entry is a directory and not a symlink to one."""
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return False
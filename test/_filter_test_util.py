@@ -0,0 +1,37 @@
+"""Trivial constant filters shared across the filter combinator tests."""
+
+import pathlib
+
+from pathql.filters.alias import DatetimeOrNone, StatProxyOrNone
+from pathql.filters.base import Filter
+
+
+class TrueFilter(Filter):
+    """Filter that always matches."""
+
+    def match(
+        self,
+        path: pathlib.Path,
+        stat_proxy: StatProxyOrNone = None,
+        now: DatetimeOrNone = None,
+    ) -> bool:
+        """All files match."""
+        return True
+
+
+class FalseFilter(Filter):
+    """Filter that never matches."""
+
+    def match(
+        self,
+        path: pathlib.Path,
+        stat_proxy: StatProxyOrNone = None,
+        now: DatetimeOrNone = None,
+    ) -> bool:
+        """No files match."""
+        return False
+
+
+# Stateless, so one instance of each can be shared by every test.
+TRUE_FILTER = TrueFilter()
+FALSE_FILTER = FalseFilter()
@@ -6,18 +6,133 @@ This module provides reusable fixtures for testing PathQL's file query and filte
 - size-based test folders for aggregation and sorting
 - rich filesystem structures for recursive and symlink tests
 - result set files with known sizes and names for aggregation and sorting validation
+- read-only trees (mini_fs, hundred_files, size_test_folder) built once per session
 
-All fixtures use pytest's tmp_path for automatic cleanup and cross-platform compatibility.
+Fixtures use pytest's tmp_path / tmp_path_factory for automatic cleanup and cross-platform
+compatibility. Setting PATHQL_TEST_SHM=1 opts in to placing the temp root in RAM-backed
+/dev/shm on Linux, when it is writable and neither --basetemp nor PYTEST_DEBUG_TEMPROOT was
+given (see pytest_configure). Session-scoped trees are shared, so tests must not modify them;
+copy into tmp_path first (shutil.copytree) if a test needs to mutate files.
+
+The suite is safe to run in parallel with pytest-xdist (pytest -n auto). Each worker gets its
+own basetemp subdirectory, so session- and module-scoped trees created via tmp_path_factory
+(type_tree, link_env, sized_file, ...) are built once per worker and never shared or raced on;
+fixture names need no worker_id suffix.
 """
 
 import os
 import pathlib
+import shutil
 import sys
 import time
-from typing import Any, Dict, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator
 
 import pytest
 
+from _filter_test_util import FALSE_FILTER, TRUE_FILTER
+from pathql.filters.base import Filter
+from pathql.filters.stat_proxy import StatProxy
+from pathql.result_set import ResultSet
+
+
+SHM_ROOT = pathlib.Path("/dev/shm")
+# Opt-in switch for the /dev/shm base directory; pytest's default temp root is kept otherwise.
+SHM_ENV_VAR = "PATHQL_TEST_SHM"
+_shm_basetemp_key = pytest.StashKey[str]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """With PATHQL_TEST_SHM=1, put tmp_path_factory's base directory on tmpfs (in RAM)."""
+    if os.environ.get(SHM_ENV_VAR) != "1":
+        return
+    if config.option.basetemp is not None or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        # The user already chose where temp files go.
+        return
+    if hasattr(config, "workerinput"):
+        # An xdist worker; the controller already chose the base.
+        return
+    if SHM_ROOT.is_dir() and os.access(SHM_ROOT, os.W_OK):
+        config.option.basetemp = str(SHM_ROOT / f"pathql-{os.getpid()}")
+        config.stash[_shm_basetemp_key] = config.option.basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove a /dev/shm base directory chosen by pytest_configure; pytest keeps explicit ones."""
+    basetemp = config.stash.get(_shm_basetemp_key, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def true_filter() -> Filter:
+    """Shared filter instance that always matches."""
+    # Arrange
+    return TRUE_FILTER
+
+
+@pytest.fixture(scope="session")
+def false_filter() -> Filter:
+    """Shared filter instance that never matches."""
+    # Arrange
+    return FALSE_FILTER
+
+
+def _fast_write(dirfd: int | None, name: str, data: bytes) -> None:
+    """Create (or truncate) name relative to the open directory dirfd and write data."""
+    fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dirfd)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_files(
+    root: pathlib.Path,
+    contents: Dict[str, bytes],
+    max_workers: int = 1,
+) -> None:
+    """Write each name -> data under root with os.open/os.write relative to one dir fd."""
+    if os.open in os.supports_dir_fd:
+        dirfd: int | None = os.open(root, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        prefix = ""
+    else:  # e.g. Windows: no dir_fd support, fall back to absolute paths
+        dirfd, prefix = None, os.fspath(root) + os.sep
+    try:
+        # Independent creates overlap well: the GIL is released around open/write.
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(lambda kv: _fast_write(dirfd, prefix + kv[0], kv[1]), contents.items()))
+    finally:
+        if dirfd is not None:
+            os.close(dirfd)
+
+
+@pytest.fixture(scope="session")
+def mini_fs(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Create a small, read-only file structure for query tests (once per session)."""
+    # Arrange
+    root = tmp_path_factory.mktemp("mini_fs")
+    (root / "subdir").mkdir()
+    _write_files(
+        root,
+        {
+            "foo.txt": b"a" * 100,
+            "bar.md": b"b" * 200,
+            "baz.txt": b"c" * 50,
+            os.path.join("subdir", "qux.txt"): b"d" * 300,
+        },
+    )
+    return root
+
+
+@pytest.fixture(scope="session")
+def hundred_files(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Create a read-only folder with 100 files for concurrency tests (once per session)."""
+    # Arrange
+    folder = tmp_path_factory.mktemp("hundred_files")
+    _write_files(folder, {f"file_{i}.txt": b"x" for i in range(100)}, max_workers=8)
+    return folder
+
 
 def _set_permissions(
     path: pathlib.Path, readable: bool, writable: bool, executable: bool
@@ -61,6 +176,7 @@ def access_matrix(tmp_path: pathlib.Path) -> Iterator[Dict[str, pathlib.Path]]:
     Creates all combinations of rwx files in tmp_path.
     Returns a dict mapping file name (e.g. 'rwx.ext') to pathlib.Path.
     """
+    # Arrange
     perms = [
         (True, True, True, "rwx"),
         (True, True, False, "rw"),
@@ -87,16 +203,70 @@ def access_matrix(tmp_path: pathlib.Path) -> Iterator[Dict[str, pathlib.Path]]:
             pass
 
 
-@pytest.fixture(scope="function")
-def size_test_folder(tmp_path: pathlib.Path):
+@pytest.fixture(scope="session")
+def size_test_folder(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
     """
-    Create a folder with two files: 100.txt (100 bytes), 200.txt (200 bytes)
+    Create a read-only folder with two files: 100.txt (100 bytes), 200.txt (200 bytes)
     """
-    f1 = tmp_path / "100.txt"
-    f2 = tmp_path / "200.txt"
-    f1.write_bytes(b"A" * 100)
-    f2.write_bytes(b"B" * 200)
-    return tmp_path
+    # Arrange
+    folder = tmp_path_factory.mktemp("size_test_folder")
+    (folder / "100.txt").write_bytes(b"A" * 100)
+    (folder / "200.txt").write_bytes(b"B" * 200)
+    return folder
+
+
+@pytest.fixture(scope="session")
+def sized_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[[int], pathlib.Path]:
+    """
+    Return a factory giving a read-only file of exactly size bytes, one per size per session.
+
+    Files are extended with os.truncate (sparse where supported) and reused by every test
+    that asks for the same size. Each pytest-xdist worker has its own basetemp, so workers
+    never share or race on these files.
+    """
+    # Arrange
+    folder = tmp_path_factory.mktemp("sized_files")
+
+    def make(size: int) -> pathlib.Path:
+        """Return folder/<size>.bin, creating it on first request."""
+        path = folder / f"{size}.bin"
+        if not path.exists():
+            path.touch()
+            os.truncate(path, size)
+        return path
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def size_test_files(size_test_folder: pathlib.Path) -> tuple[pathlib.Path, ...]:
+    """The size_test_folder files, sorted by name and listed once per session (read only)."""
+    # Arrange
+    return tuple(sorted(size_test_folder.iterdir()))
+
+
+@pytest.fixture(scope="session")
+def size_test_proxies(size_test_folder: pathlib.Path) -> tuple[StatProxy, ...]:
+    """
+    One StatProxy per size_test_files entry, in the same order, shared by the session.
+
+    Proxies wrap the scandir entries, as Query builds them, and cache their stat, so
+    every file is stat'd once however many Size tests read it.
+    """
+    # Arrange
+    with os.scandir(size_test_folder) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    return tuple(StatProxy(size_test_folder / e.name, e) for e in entries)
+
+
+@pytest.fixture(scope="session")
+def size_test_sizes(
+    size_test_files: tuple[pathlib.Path, ...],
+    size_test_proxies: tuple[StatProxy, ...],
+) -> dict[pathlib.Path, int]:
+    """Map each size_test_files entry to its st_size, read from the shared proxies."""
+    # Arrange
+    return {p: sp.stat().st_size for p, sp in zip(size_test_files, size_test_proxies)}
 
 
 ## Removed unused/redundant imports
@@ -118,6 +288,7 @@ def rich_filesystem(tmp_path: pathlib.Path):
         - i.link (symlink to a10.txt)
     Sets modification and creation times for control.
     """
+    # Arrange
     root = tmp_path
     files = [
         root / "a10.txt",
@@ -159,12 +330,14 @@ def _create_test_files(tmp_path: pathlib.Path, files: dict[str, int]):
         p.write_bytes(b"x" * size)
 
 
-@pytest.fixture
-def test_result_files(tmp_path: pathlib.Path) -> list[pathlib.Path]:
+@pytest.fixture(scope="session")
+def test_result_files(tmp_path_factory: pytest.TempPathFactory) -> list[pathlib.Path]:
     """
     Create files with known sizes and useful names for aggregation and sorting tests.
-    Returns a list of file paths.
+    Returns a list of file paths. Shared by the whole session, so tests must not modify them.
     """
+    # Arrange
+    tmp_path = tmp_path_factory.mktemp("result_files")
     files = {
         "largest_1.txt": 3000,
         "largest_2.txt": 2000,
@@ -186,12 +359,24 @@ def test_result_files(tmp_path: pathlib.Path) -> list[pathlib.Path]:
     return [tmp_path / name for name in files]
 
 
-@pytest.fixture
-def test_result_folder(tmp_path: pathlib.Path) -> pathlib.Path:
+@pytest.fixture(scope="session")
+def result_set(test_result_files: list[pathlib.Path]) -> ResultSet:
+    """
+    ResultSet over test_result_files, shared by the session so its stat cache is filled
+    once. Aggregations return new sets; tests must not mutate this one.
+    """
+    # Arrange
+    return ResultSet(test_result_files)
+
+
+@pytest.fixture(scope="session")
+def test_result_folder(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
     """
     Create files with known sizes and useful names for aggregation and sorting tests.
-    Returns the folder containing the files.
+    Returns the folder containing the files. Shared by the whole session; read only.
     """
+    # Arrange
+    tmp_path = tmp_path_factory.mktemp("result_folder")
     files = {
         "largest_1.txt": 3000,
         "largest_2.txt": 2000,
@@ -218,15 +403,17 @@ def test_result_folder(tmp_path: pathlib.Path) -> pathlib.Path:
     return tmp_path
 
 
-@pytest.fixture
-def test_result_files_with_mtime(tmp_path: pathlib.Path) -> list[pathlib.Path]:
+@pytest.fixture(scope="session")
+def test_result_files_with_mtime(tmp_path_factory: pytest.TempPathFactory) -> list[pathlib.Path]:
     """
     Create files named oldest_1.txt, oldest_2.txt, oldest_3.txt, middle_1.txt, ...,
                       youngest_1.txt, youngest_2.txt, youngest_3.txt.
 
     Each file's modification time is set N days ago, for easy inspection and sorting by age.
-    Returns a list of pathlib.Path objects.
+    Returns a list of pathlib.Path objects. Shared by the whole session; read only.
     """
+    # Arrange
+    tmp_path = tmp_path_factory.mktemp("result_files_with_mtime")
     files: list[dict[str, Any]] = [
         {"name": "oldest_1.txt", "size": 100, "modification_days_offset": 30},
         {"name": "oldest_2.txt", "size": 110, "modification_days_offset": 29},
@@ -239,11 +426,11 @@ def test_result_files_with_mtime(tmp_path: pathlib.Path) -> list[pathlib.Path]:
         {"name": "youngest_3.txt", "size": 180, "modification_days_offset": 0},
     ]
     paths: list[pathlib.Path] = []
-    now = time.time()
+    now_ns = time.time_ns()
     for file in files:
         p: pathlib.Path = tmp_path / file["name"]
         p.write_bytes(b"x" * file["size"])
-        mtime: float = now - (file["modification_days_offset"] * 86400)
-        os.utime(p, (mtime, mtime))
+        mtime_ns: int = now_ns - file["modification_days_offset"] * 86400 * 1_000_000_000
+        os.utime(p, ns=(mtime_ns, mtime_ns))
         paths.append(p)
     return paths
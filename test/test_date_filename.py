@@ -12,6 +12,7 @@ from pathql.filters.date_filename import (
     filename_to_datetime,
     path_from_datetime,
     path_from_dt_ints,
+    wallclock_seconds,
 )
 
 
@@ -337,3 +338,36 @@ def test_path_from_dt_ints_and_datetime_exceptions(args: dict[str, str | dt.date
         func = path_from_dt_ints
     with pytest.raises(expected_exception, match=assert_message):
         func(**args)
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        (1, 1, 1, 0),
+        (1970, 1, 1, 0),
+        (2000, 2, 29, 23),
+        (2024, 3, 1, 12),
+        (9999, 12, 31, 23),
+    ],
+)
+def test_wallclock_seconds_matches_datetime(parts: tuple[int, int, int, int]):
+    """wallclock_seconds agrees with datetime ordinal arithmetic, including leap days."""
+    # Arrange
+    d = dt.datetime(*parts)
+
+    # Act
+    actual = wallclock_seconds(*parts)
+
+    # Assert
+    assert actual == d.toordinal() * 86400 + d.hour * 3600
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [(2023, 2, 29, 0), (1900, 2, 29, 0), (2024, 13, 1, 0), (2024, 4, 31, 0), (2024, 1, 1, 24)],
+)
+def test_wallclock_seconds_rejects_invalid_parts(parts: tuple[int, int, int, int]):
+    """Out of range date parts raise ValueError, as the datetime constructor would."""
+    # Act & Assert
+    with pytest.raises(ValueError):
+        wallclock_seconds(*parts)
@@ -3,7 +3,8 @@
 import datetime as dt
 import os
 import pathlib
-from typing import Type
+import types
+from typing import Callable, Type
 
 import pytest
 
@@ -15,6 +16,8 @@ from pathql.filters.datetime_parts import (
     MonthFilter,
     SecondFilter,
     YearFilter,
+    _float_epoch_ns,
+    _period_range,
     normalize_attr,
 )
 from pathql.filters.stat_proxy import StatProxy
@@ -30,34 +33,63 @@ def make_file_with_mtime(
     """Create file at tmp_path with a modification time (mtime) set to the given datetime."""
     file = tmp_path / f"f_{datetime_obj.strftime('%Y%m%d%H%M%S')}"
     file.write_text("x")
-    ts = datetime_obj.timestamp()
-    os.utime(str(file), (ts, ts))
+    ns = int(datetime_obj.replace(microsecond=0).timestamp()) * 1_000_000_000
+    ns += datetime_obj.microsecond * 1_000
+    os.utime(str(file), ns=(ns, ns))
     return file
 
 
+_PART_DT = dt.datetime(2025, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def part_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """One read-only file with mtime 2025-05-01 12:00:00, shared by the part tests."""
+    # Arrange
+    return make_file_with_mtime(tmp_path_factory.mktemp("parts"), _PART_DT)
+
+
 @pytest.mark.parametrize(
-    "year,should_match",
+    "make_filter,should_match",
     [
-        (2025, True),
-        (2024, False),
+        (lambda: YearFilter(2025), True),
+        (lambda: YearFilter(2024), False),
+        (lambda: DayFilter(1, base=_PART_DT), True),
+        (lambda: DayFilter(2, base=_PART_DT), False),
+        (lambda: HourFilter(12, base=_PART_DT), True),
+        (lambda: HourFilter(13, base=_PART_DT), False),
+        (lambda: MinuteFilter(0, base=_PART_DT), True),
+        (lambda: MinuteFilter(1, base=_PART_DT), False),
+        (lambda: SecondFilter(0, base=_PART_DT), True),
+        (lambda: SecondFilter(1, base=_PART_DT), False),
+    ],
+    ids=[
+        "year-2025",
+        "year-2024",
+        "day-1",
+        "day-2",
+        "hour-12",
+        "hour-13",
+        "minute-0",
+        "minute-1",
+        "second-0",
+        "second-1",
     ],
 )
-def test_year_filter(
-    tmp_path: pathlib.Path,
-    year: int,
+def test_part_filters(
+    part_file: pathlib.Path,
+    make_filter: Callable[[], Filter],
     should_match: bool,
 ) -> None:
-    """YearFilter returns expected matches for given years."""
+    """Year/Day/Hour/Minute/Second filters match the parts of a file's mtime."""
     # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
+    filter_ = make_filter()
 
     # Act
-    filter_ = YearFilter(year)
-    actual = filter_.match(file, get_stat_proxy(file))
+    actual = filter_.match(part_file, get_stat_proxy(part_file))
 
     # Assert
-    assert actual is should_match, f"YearFilter({year}) should be {should_match}"
+    assert actual is should_match, f"{filter_.__class__.__name__} should be {should_match}"
 
 
 @pytest.mark.parametrize(
@@ -71,119 +103,19 @@ def test_year_filter(
     ],
 )
 def test_month_filter(
-    tmp_path: pathlib.Path,
+    part_file: pathlib.Path,
     month: int | str,
     should_match: bool,
 ) -> None:
     """MonthFilter matches numeric and string month names."""
-    # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
-
     # Act
     filter_ = MonthFilter(month)
-    actual = filter_.match(file, get_stat_proxy(file))
+    actual = filter_.match(part_file, get_stat_proxy(part_file))
 
     # Assert
     assert actual is should_match, f"MonthFilter({month}) should be {should_match}"
 
 
-@pytest.mark.parametrize(
-    "day,should_match",
-    [
-        (1, True),
-        (2, False),
-    ],
-)
-def test_day_filter(
-    tmp_path: pathlib.Path,
-    day: int,
-    should_match: bool,
-) -> None:
-    """DayFilter matches the expected day of month."""
-    # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
-
-    # Act
-    filter_ = DayFilter(day, base=dt_)
-    actual = filter_.match(file, get_stat_proxy(file))
-
-    # Assert
-    assert actual is should_match, f"DayFilter({day}) should be {should_match}"
-
-
-@pytest.mark.parametrize(
-    "hour,should_match",
-    [
-        (12, True),
-        (13, False),
-    ],
-)
-def test_hour_filter(
-    tmp_path: pathlib.Path,
-    hour: int,
-    should_match: bool,
-) -> None:
-    """HourFilter matches the expected hour of day."""
-    # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
-
-    # Act
-    filter_ = HourFilter(hour, base=dt_)
-    actual = filter_.match(file, get_stat_proxy(file))
-
-    # Assert
-    assert actual is should_match, f"HourFilter({hour}) should be {should_match}"
-
-
-@pytest.mark.parametrize(
-    "minute,should_match",
-    [
-        (0, True),
-        (1, False),
-    ],
-)
-def test_minute_filter(
-    tmp_path: pathlib.Path,
-    minute: int,
-    should_match: bool,
-) -> None:
-    """MinuteFilter matches the expected minute of hour."""
-    # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
-    # Act
-    filter_ = MinuteFilter(minute, base=dt_)
-    actual = filter_.match(file, get_stat_proxy(file))
-    # Assert
-    assert actual is should_match, f"MinuteFilter({minute}) should be {should_match}"
-
-
-@pytest.mark.parametrize(
-    "second,should_match",
-    [
-        (0, True),
-        (1, False),
-    ],
-)
-def test_second_filter(
-    tmp_path: pathlib.Path,
-    second: int,
-    should_match: bool,
-) -> None:
-    """SecondFilter matches the expected second of minute."""
-    # Arrange
-    dt_ = dt.datetime(2025, 5, 1, 12, 0, 0)
-    file = make_file_with_mtime(tmp_path, dt_)
-    # Act
-    filter_ = SecondFilter(second, base=dt_)
-    actual = filter_.match(file, get_stat_proxy(file))
-    # Assert
-    assert actual is should_match, f"SecondFilter({second}) should be {should_match}"
-
-
 @pytest.mark.parametrize(
     "cls", [YearFilter, MonthFilter, DayFilter, HourFilter, MinuteFilter, SecondFilter]
 )
@@ -240,4 +172,207 @@ def test_filters_missing_stat_proxy(filter_cls, args):
     f = filter_cls(*args)
     # Act & Assert
     with pytest.raises(ValueError):
-        f.match(pathlib.Path("foo.txt"), stat_proxy=None)
\ No newline at end of file
+        f.match(pathlib.Path("foo.txt"), stat_proxy=None)
+
+@pytest.mark.parametrize(
+    "mtime,day,should_match",
+    [
+        (dt.datetime(2025, 4, 30, 0, 0, 0), 30, True),  # lower bound inclusive
+        (dt.datetime(2025, 4, 30, 23, 59, 59), 30, True),
+        (dt.datetime(2025, 5, 1, 0, 0, 0), 30, False),  # upper bound exclusive
+        (dt.datetime(2025, 4, 30, 12, 0, 0), 31, False),  # April has no 31st
+    ],
+)
+def test_day_filter_range_bounds(
+    tmp_path: pathlib.Path,
+    mtime: dt.datetime,
+    day: int,
+    should_match: bool,
+) -> None:
+    """DayFilter matches the half-open local day [00:00, next 00:00)."""
+    # Arrange
+    file = make_file_with_mtime(tmp_path, mtime)
+
+    # Act
+    filter_ = DayFilter(day, base=dt.datetime(2025, 4, 15))
+    actual = filter_.match(file, get_stat_proxy(file))
+
+    # Assert
+    assert actual is should_match
+
+
+# (name, factory) pairs: each factory builds the "same period as now" filter for one part.
+PART_FACTORIES = (
+    ("year", lambda now: YearFilter(now.year, base=now)),
+    ("month", lambda now: MonthFilter(now.month, base=now)),
+    ("day", lambda now: DayFilter(now.day, base=now)),
+    ("hour", lambda now: HourFilter(now.hour, base=now)),
+    ("minute", lambda now: MinuteFilter(now.minute, base=now)),
+)
+
+_EDGE_MTIME = dt.datetime(2025, 1, 1, 0, 0, 1)
+
+
+@pytest.fixture(scope="module")
+def edge_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """One read-only file with mtime 2025-01-01 00:00:01, shared by the edge-case rows."""
+    # Arrange
+    return make_file_with_mtime(tmp_path_factory.mktemp("edge"), _EDGE_MTIME)
+
+
+PartFilterBuilder = Callable[[int, str, Callable[[dt.datetime], Filter], dt.datetime], Filter]
+
+
+@pytest.fixture(scope="module")
+def part_filter_cache() -> PartFilterBuilder:
+    """Return a builder that reuses part filters across rows selecting the same period."""
+    # Arrange
+    cache: dict[tuple[str, tuple[int, ...]], Filter] = {}
+
+    def build(
+        depth: int,
+        name: str,
+        factory: Callable[[dt.datetime], Filter],
+        now: dt.datetime,
+    ) -> Filter:
+        """Build factory(now), keyed on the first `depth` fields of now (its period)."""
+        key = (name, now.timetuple()[:depth])
+        if key not in cache:
+            cache[key] = factory(now)
+        return cache[key]
+
+    return build
+
+
+def evaluate_parts(
+    factories: tuple,
+    path: pathlib.Path,
+    now: dt.datetime,
+    stat_proxy: StatProxy,
+    build: PartFilterBuilder,
+) -> dict[str, bool]:
+    """Evaluate every part filter for `now` against one path and one shared stat proxy."""
+    return {
+        name: build(depth, name, factory, now).match(path, stat_proxy)
+        for depth, (name, factory) in enumerate(factories, start=1)
+    }
+
+
+def _parts(year: bool, month: bool, day: bool, hour: bool, minute: bool) -> dict[str, bool]:
+    """Build the expected per-part results for one edge-case row."""
+    return {"year": year, "month": month, "day": day, "hour": hour, "minute": minute}
+
+
+@pytest.mark.parametrize(
+    "now,expected",
+    [
+        (dt.datetime(2025, 1, 1, 0, 0, 59), _parts(True, True, True, True, True)),
+        (dt.datetime(2025, 1, 1, 0, 1, 0), _parts(True, True, True, True, False)),
+        (dt.datetime(2025, 1, 1, 1, 0, 0), _parts(True, True, True, False, False)),
+        (dt.datetime(2025, 1, 2, 0, 0, 1), _parts(True, True, False, False, False)),
+        (dt.datetime(2025, 2, 1, 0, 0, 1), _parts(True, False, False, False, False)),
+        (dt.datetime(2024, 12, 31, 23, 59, 59), _parts(False, False, False, False, False)),
+    ],
+    ids=["same-minute", "next-minute", "next-hour", "next-day", "next-month", "prev-year"],
+)
+def test_parts_edge_case_matrix(
+    edge_file: pathlib.Path,
+    part_filter_cache: PartFilterBuilder,
+    now: dt.datetime,
+    expected: dict[str, bool],
+) -> None:
+    """Part filters for `now` match a file from 2025-01-01 00:00:01 only where periods agree."""
+    # Arrange
+    stat_proxy = get_stat_proxy(edge_file)
+
+    # Act
+    results = evaluate_parts(PART_FACTORIES, edge_file, now, stat_proxy, part_filter_cache)
+
+    # Assert
+    assert results == expected
+
+
+def test_period_range_is_shared_between_equal_filters() -> None:
+    """Filters for the same period reuse the cached epoch range."""
+    # Arrange
+    base = dt.datetime(2025, 5, 1, 12, 30)
+    _period_range.cache_clear()
+
+    # Act
+    first = HourFilter(12, base=base)
+    second = HourFilter(12, base=base.replace(minute=45))
+
+    # Assert
+    assert (first._lo, first._hi) == (second._lo, second._hi)
+    assert _period_range.cache_info().hits == 1
+
+
+def test_day_filter_is_exact_to_the_nanosecond(tmp_path: pathlib.Path) -> None:
+    """A file 1ns before midnight is not in the next day (float st_mtime would round up)."""
+    # Arrange
+    file = tmp_path / "edge.txt"
+    file.write_text("x")
+    midnight_ns = int(dt.datetime(2025, 4, 30).timestamp()) * 1_000_000_000
+    os.utime(file, ns=(midnight_ns - 1, midnight_ns - 1))
+
+    # Act
+    april_30 = DayFilter(30, base=dt.datetime(2025, 4, 15)).match(file, get_stat_proxy(file))
+    april_29 = DayFilter(29, base=dt.datetime(2025, 4, 15)).match(file, get_stat_proxy(file))
+
+    # Assert
+    assert (april_30, april_29) == (False, True)
+
+
+class FieldStatProxy:
+    """Duck-typed proxy whose stat() carries only the given fields."""
+
+    def __init__(self, **fields: float | int) -> None:
+        self._stat = types.SimpleNamespace(**fields)
+
+    def stat(self) -> types.SimpleNamespace:
+        return self._stat
+
+
+def test_day_filter_accepts_stat_without_ns_fields() -> None:
+    """A duck-typed stat carrying only float st_mtime still matches by day."""
+    # Arrange
+    mtime = dt.datetime(2025, 4, 30, 12, 0).timestamp()
+
+    # Act
+    april_30 = DayFilter(30, base=dt.datetime(2025, 4, 15)).match(
+        pathlib.Path("x.txt"), FieldStatProxy(st_mtime=mtime)
+    )
+
+    # Assert
+    assert april_30 is True
+
+
+def test_float_fallback_scales_only_the_fraction() -> None:
+    """The float st_mtime fallback keeps nanoseconds that seconds * 1e9 would round away."""
+    # Act
+    actual = _float_epoch_ns(1_700_000_000.25)
+
+    # Assert
+    assert actual == 1_700_000_000_250_000_000
+
+
+@pytest.mark.parametrize(
+    "make_filter",
+    [
+        lambda: YearFilter(9999),
+        lambda: MonthFilter(12, base=dt.datetime(9999, 1, 15)),
+        lambda: DayFilter(31, base=dt.datetime(9999, 12, 1)),
+    ],
+    ids=["year", "month", "day"],
+)
+def test_last_period_before_datetime_max_matches(make_filter: Callable[[], Filter]) -> None:
+    """Periods ending past dt.datetime.max are clamped there instead of matching nothing."""
+    # Arrange
+    mtime_ns = int(dt.datetime(9999, 12, 31, 12, 0).timestamp()) * 1_000_000_000
+    proxy = FieldStatProxy(st_mtime_ns=mtime_ns)
+
+    # Act
+    actual = make_filter().match(pathlib.Path("x.txt"), proxy)
+
+    # Assert
+    assert actual is True
@@ -0,0 +1,73 @@
+"""Tests for stat_dont_sync: statx(AT_STATX_DONT_SYNC) matches os.stat."""
+
+import os
+import pathlib
+
+import pytest
+
+from pathql.filters.fast_stat import stat_dont_sync
+from pathql.filters.size import Size
+from pathql.filters.stat_proxy import StatProxy
+
+_FIELDS = (
+    "st_mode",
+    "st_ino",
+    "st_dev",
+    "st_nlink",
+    "st_uid",
+    "st_gid",
+    "st_size",
+    "st_atime_ns",
+    "st_mtime_ns",
+    "st_ctime_ns",
+    "st_mtime",
+    "st_blocks",
+)
+
+
+def test_stat_dont_sync_matches_os_stat(tmp_path: pathlib.Path) -> None:
+    """Every basic field agrees with os.stat for a file and a directory."""
+    # Arrange
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"x" * 123)
+    os.utime(f, ns=(1_700_000_000_123_456_789, 1_700_000_000_987_654_321))
+
+    for path in (f, tmp_path):
+        # Act
+        expected = os.stat(path)
+        actual = stat_dont_sync(path)
+
+        # Assert
+        for field in _FIELDS:
+            assert getattr(actual, field) == getattr(expected, field), (path, field)
+
+
+def test_stat_dont_sync_missing_file(tmp_path: pathlib.Path) -> None:
+    """A missing path raises FileNotFoundError, like os.stat."""
+    # Act & Assert
+    with pytest.raises(FileNotFoundError):
+        stat_dont_sync(tmp_path / "missing")
+
+
+def test_stat_proxy_uses_stat_func(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """StatProxy.stat_func replaces the stat call for every proxy."""
+    # Arrange
+    f = tmp_path / "a.txt"
+    f.write_bytes(b"x" * 10)
+    calls: list[pathlib.Path] = []
+
+    def recording_stat(path: pathlib.Path) -> os.stat_result:
+        calls.append(path)
+        return stat_dont_sync(path)
+
+    monkeypatch.setattr(StatProxy, "stat_func", recording_stat)
+
+    # Act
+    matched = (Size() == 10).match(f, StatProxy(f))
+
+    # Assert
+    assert matched is True
+    assert calls == [f]
@@ -4,6 +4,11 @@ import pytest
 from pathql.filters.file_age import FilenameAgeMinutes, FilenameAgeHours, FilenameAgeDays, FilenameAgeYears
 from pathql.filters.base import Filter
 
+# Reference dates are invariant across the whole parametrize matrix.
+_FILE_DATE = dt.datetime(2019, 1, 1, 0, 0)
+_NOW = dt.datetime(2019, 1, 2, 0, 0)  # 1 day later
+_AGE_SECONDS = (_NOW - _FILE_DATE).total_seconds()
+
 @pytest.mark.parametrize(
     "filter_cls, filename, unit_seconds, assert_message",
     [
@@ -25,10 +30,9 @@ from pathql.filters.base import Filter
 @pytest.mark.parametrize("path_type", [str, pathlib.Path])  # Test both str and Path types for filename input
 def test_fileage_operators(filter_cls: type[Filter], filename: str, unit_seconds: float, assert_message: str, path_type):
     # Arrange
-    file_date = dt.datetime(2019, 1, 1, 0, 0)
-    now = dt.datetime(2019, 1, 2, 0, 0)  # 1 day later
+    now = _NOW
     path = path_type(filename)
-    age_units = int((now - file_date).total_seconds() // unit_seconds)
+    age_units = int(_AGE_SECONDS // unit_seconds)
 
     # Act & Assert
     # < operator
@@ -7,7 +7,7 @@ import typing
 import pytest
 
 from pathql.filters import Exec, Execute, Filter, RdWt, RdWtEx, Read, Write
-from pathql.query import StatProxy
+from pathql.filters.stat_proxy import StatProxy
 
 
 @pytest.fixture
@@ -1,16 +1,36 @@
-"""Tests for Age filters: minutes, hours, days, and years."""
+"""Tests for Age filters: minutes, hours, days, and years.
+
+Filesystem state lives in per-worker temp dirs, so the module is safe under
+`pytest -n auto` (pytest-xdist).
+"""
 
 import datetime as dt
+import math
 import operator
 import os
 import pathlib
-from typing import Callable,Any
+from typing import Callable, Any
 
 import pytest
 
-from pathql.filters.age import AgeDays, AgeHours, AgeMinutes, AgeYears
+from pathql.filters.age import AgeBase, AgeDays, AgeHours, AgeMinutes, AgeSeconds, AgeYears
 from pathql.filters.alias import DatetimeOrNone
 from pathql.filters.base import Filter
+from pathql.filters.stat_proxy import StatProxy
+from pathql.query import Query
+
+
+def _set_mtime_seconds_ago(
+    path: pathlib.Path,
+    seconds: float,
+    now: dt.datetime | None = None,
+) -> None:
+    """Set file mtime to N seconds before `now` using integer epoch nanoseconds."""
+    now = now or dt.datetime.now()
+    now_ns = int(now.replace(microsecond=0).timestamp()) * 1_000_000_000
+    now_ns += now.microsecond * 1_000
+    mtime_ns = now_ns - round(seconds * 1_000_000_000)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
 
 
 def set_mtime_minutes_ago(
@@ -18,12 +38,8 @@ def set_mtime_minutes_ago(
     minutes: float,
     now: dt.datetime | None = None,
 ) -> None:
-    """Set file mtime to N minutes ago using a datetime object."""
-    if now is None:
-        now = dt.datetime.now()
-    ago = now - dt.timedelta(minutes=minutes)
-    ts = ago.timestamp()
-    os.utime(path, (ts, ts))
+    """Set file mtime to N minutes ago."""
+    _set_mtime_seconds_ago(path, minutes * 60.0, now)
 
 
 def set_mtime_hours_ago(
@@ -31,12 +47,8 @@ def set_mtime_hours_ago(
     hours: float,
     now: dt.datetime | None = None,
 ) -> None:
-    """Set file mtime to N hours ago using a datetime object."""
-    if now is None:
-        now = dt.datetime.now()
-    ago = now - dt.timedelta(hours=hours)
-    ts = ago.timestamp()
-    os.utime(path, (ts, ts))
+    """Set file mtime to N hours ago."""
+    _set_mtime_seconds_ago(path, hours * 3600.0, now)
 
 
 def set_mtime_days_ago(
@@ -44,12 +56,8 @@ def set_mtime_days_ago(
     days: float,
     now: dt.datetime | None = None,
 ) -> None:
-    """Set file mtime to N days ago using a datetime object."""
-    if now is None:
-        now = dt.datetime.now()
-    ago = now - dt.timedelta(days=days)
-    ts = ago.timestamp()
-    os.utime(path, (ts, ts))
+    """Set file mtime to N days ago."""
+    _set_mtime_seconds_ago(path, days * 86400.0, now)
 
 
 def set_mtime_years_ago(
@@ -57,79 +65,62 @@ def set_mtime_years_ago(
     years: float,
     now: dt.datetime | None = None,
 ) -> None:
-    """Set file mtime to N years ago using a datetime object."""
-    if now is None:
-        now = dt.datetime.now()
-    # Approximate years using days
-    ago = now - dt.timedelta(days=years * 365.25)
-    ts = ago.timestamp()
-    os.utime(path, (ts, ts))
+    """Set file mtime to N years ago (approximated as 365.25 days per year)."""
+    _set_mtime_seconds_ago(path, years * 365.25 * 86400.0, now)
 
 
-# Parameterized test for all age filters and operators
-@pytest.mark.parametrize(
-    "filter_cls,setter,unit",
-    [
-        (AgeMinutes, set_mtime_minutes_ago, 1),
-        (AgeHours, set_mtime_hours_ago, 1),
-        (AgeDays, set_mtime_days_ago, 1),
-        (AgeYears, set_mtime_years_ago, 1),
-    ],
-)
-@pytest.mark.parametrize(
-    "op,expected_below,expected_exact,expected_above",
-    [
-        (operator.lt, True, False, False),
-        # With integer unit rounding, 'just above' the threshold floors to the same unit as exact
-        (operator.le, True, True, True),
-        (operator.ge, False, True, True),
-        (operator.gt, False, False, False),
-    ],
-)
-def test_age_thresholds(
-    tmp_path: pathlib.Path,
-    filter_cls: type[Filter],
-    setter: Callable[[pathlib.Path, float, dt.datetime | None], None],
-    unit: float,
-    op: Callable[[Filter, float], Filter],
-    expected_below: bool,
-    expected_exact: bool,
-    expected_above: bool,
-) -> None:
-    """Parametric test across age units and comparison operators (below/equal/above)."""
+@pytest.fixture(scope="module")
+def age_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Create one file per module; tests only adjust its mtime via os.utime."""
     # Arrange
-    f = tmp_path / "test.txt"
+    f = tmp_path_factory.mktemp("age") / "test.txt"
     f.write_text("X")
-    now = dt.datetime.now()  # Use datetime, not time.time()
+    return f
+
+
+# Age units under test: (filter class, mtime setter, below/exact/above offsets).
+# AgeYears uses whole-day fractions to avoid leap year ambiguity.
+_AGE_UNITS = [
+    (AgeMinutes, set_mtime_minutes_ago, (1 - 0.0001, 1, 1 + 0.0001)),
+    (AgeHours, set_mtime_hours_ago, (1 - 0.0001, 1, 1 + 0.0001)),
+    (AgeDays, set_mtime_days_ago, (1 - 0.0001, 1, 1 + 0.0001)),
+    (AgeYears, set_mtime_years_ago, (364 / 365, 1, 366 / 365)),
+]
 
-    from pathql.filters.stat_proxy import StatProxy
+# Expected (below, exact, above) results per operator against a threshold of 1.
+# With integer unit rounding, 'just above' the threshold floors to the same unit as exact.
+_OP_EXPECTATIONS = [
+    (operator.lt, (True, False, False)),
+    (operator.le, (True, True, True)),
+    (operator.ge, (False, True, True)),
+    (operator.gt, (False, False, False)),
+]
 
-    if filter_cls is AgeYears:
-        # Use integer days to avoid leap year ambiguity
-        setter(f, 364 / 365, now)  # Just below 1 year
-        result_below = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_below is expected_below
 
-        setter(f, 1, now)  # Exactly 1 year
-        result_exact = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_exact is expected_exact
+def test_age_thresholds(age_file: pathlib.Path) -> None:
+    """Table-driven test across age units and comparison operators (below/equal/above).
 
-        setter(f, 366 / 365, now)  # Just above 1 year
-        result_above = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_above is expected_above
-    else:
-        # Act & Assert: Just below threshold
-        setter(f, unit - 0.0001, now)
-        result_below = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_below is expected_below
+    Runs as a single test so the file and fixture setup are paid once; each
+    assertion message names the unit, operator, and position on failure.
+    """
+    # Arrange
+    f = age_file
+    now = dt.datetime.now()  # Use datetime, not time.time()
+    positions = ("below", "exact", "above")
 
-        setter(f, unit, now)
-        result_exact = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_exact is expected_exact
+    for filter_cls, setter, offsets in _AGE_UNITS:
+        for idx, offset in enumerate(offsets):
+            # Act
+            setter(f, offset, now)
+            sp = StatProxy(f)
+            for op, expected in _OP_EXPECTATIONS:
+                actual = op(filter_cls(), 1).match(f, stat_proxy=sp, now=now)
 
-        setter(f, unit + 0.0001, now)
-        result_above = op(filter_cls(), unit).match(f, stat_proxy=StatProxy(f), now=now)
-        assert result_above is expected_above
+                # Assert
+                assert actual is expected[idx], (
+                    f"{filter_cls.__name__} {op.__name__} 1 ({positions[idx]}): "
+                    f"expected {expected[idx]}, got {actual}"
+                )
 
 
 @pytest.mark.parametrize(
@@ -142,7 +133,7 @@ def test_age_thresholds(
     ],
 )
 def test_age_filter_eq_ne_behaviour(
-    tmp_path: pathlib.Path,
+    age_file: pathlib.Path,
     filter_cls: type[Filter],
     setter: Callable[[pathlib.Path, float, DatetimeOrNone], None],
     unit: float,
@@ -152,22 +143,20 @@ def test_age_filter_eq_ne_behaviour(
     For example, AgeDays == 0 matches files with age >= 0 and < 1 day.
     """
     # Arrange
-    f: pathlib.Path = tmp_path / "test.txt"
-    f.write_text("X")
+    f: pathlib.Path = age_file
     now: DatetimeOrNone = dt.datetime.now()
 
     # Newly created file -> unit_age == 0
     setter(f, 0, now)
-    from pathql.filters.stat_proxy import StatProxy
+    sp = StatProxy(f)
 
-    assert operator.eq(filter_cls(), 0).match(f, stat_proxy=StatProxy(f), now=now)
-    assert not operator.ne(filter_cls(), 0).match(f, stat_proxy=StatProxy(f), now=now)
+    assert operator.eq(filter_cls(), 0).match(f, stat_proxy=sp, now=now)
+    assert not operator.ne(filter_cls(), 0).match(f, stat_proxy=sp, now=now)
 
     setter(f, unit, now)
-    assert operator.eq(filter_cls(), 1).match(f, stat_proxy=StatProxy(f), now=now)
-    assert not operator.ne(filter_cls(), 1).match(f, stat_proxy=StatProxy(f), now=now)
-    assert operator.eq(filter_cls(), 1).match(f, stat_proxy=StatProxy(f), now=now)
-    assert not operator.ne(filter_cls(), 1).match(f, stat_proxy=StatProxy(f), now=now)
+    sp = StatProxy(f)
+    assert operator.eq(filter_cls(), 1).match(f, stat_proxy=sp, now=now)
+    assert not operator.ne(filter_cls(), 1).match(f, stat_proxy=sp, now=now)
 
 def test_age_filter_missing_stat_proxy():
     """Raise TypeError if filter is not fully specified."""
@@ -188,3 +177,116 @@ def test_age_filter_invalid_threshold_type(filter_cls, bad_value):
     with pytest.raises(TypeError, match="filter not fully specified"):
         f.match(pathlib.Path("foo.txt"), stat_proxy=None)
 
+
+def test_age_filter_accepts_epoch_now(age_file):
+    """`now` may be given as epoch seconds; results match the equivalent datetime."""
+    # Arrange
+    now = dt.datetime.now()
+    set_mtime_hours_ago(age_file, 2.5, now)
+    sp = StatProxy(age_file)
+    flt = AgeHours() == 2
+    # Act
+    from_datetime = flt.match(age_file, stat_proxy=sp, now=now)
+    from_epoch = flt.match(age_file, stat_proxy=sp, now=now.timestamp())
+    # Assert
+    assert from_datetime is True
+    assert from_epoch is True
+
+
+@pytest.mark.parametrize(
+    "filt",
+    [AgeMinutes() < 3, AgeMinutes() >= 3, AgeHours() == 0, AgeDays() > 0],
+    ids=["min-lt", "min-ge", "hours-eq", "days-gt"],
+)
+def test_age_match_batch_agrees_with_match(tmp_path: pathlib.Path, filt: Filter) -> None:
+    """match_batch gives match()'s results, including a path whose stat() fails."""
+    # Arrange
+    now = dt.datetime.now()
+    files = []
+    for i, seconds in enumerate([30, 150, 200, 7200]):
+        f = tmp_path / f"f{i}.txt"
+        f.write_text("x")
+        _set_mtime_seconds_ago(f, seconds, now)
+        files.append(f)
+    files.append(tmp_path / "missing.txt")
+
+    # Act
+    batch = filt.match_batch(files, [StatProxy(f) for f in files], now=now)
+
+    # Assert
+    assert batch == [filt.match(f, StatProxy(f), now=now) for f in files]
+    assert batch[-1] is False
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_age_bad_now_matches_nothing_in_query(age_file: pathlib.Path, threaded: bool) -> None:
+    """A `now` without a timestamp gives no matches through Query, as match() does."""
+    # Arrange
+    bad_now = dt.date(2024, 6, 1)
+    filt = AgeDays() >= 0
+    q = Query(where_expr=filt)
+
+    # Act
+    selected = q.select(age_file.parent, now=bad_now, threaded=threaded)
+    single = filt.match(age_file, StatProxy(age_file), now=bad_now)
+
+    # Assert
+    assert list(selected) == []
+    assert single is False
+
+
+@pytest.mark.parametrize(
+    "op",
+    [operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne],
+    ids=["lt", "le", "gt", "ge", "eq", "ne"],
+)
+@pytest.mark.parametrize("filter_cls", [AgeSeconds, AgeMinutes, AgeHours, AgeDays, AgeYears])
+def test_age_boundaries_follow_floor_division(
+    tmp_path: pathlib.Path,
+    filter_cls: type[AgeBase],
+    op: Callable[[int, int], bool],
+) -> None:
+    """At value * unit +/- 1 microsecond, match and match_batch both floor-divide the age."""
+    # Arrange
+    value = 3
+    now = dt.datetime(2024, 6, 1, 12, 0, 0)
+    now_ns = int(now.timestamp()) * 1_000_000_000
+    boundary_ns = round(value * filter_cls.unit_seconds * 1_000_000_000)
+    epsilon_ns = 1_000
+    files = []
+    for i, age_ns in enumerate([boundary_ns - epsilon_ns, boundary_ns, boundary_ns + epsilon_ns]):
+        f = tmp_path / f"f{i}.txt"
+        f.write_text("x")
+        os.utime(f, ns=(now_ns - age_ns, now_ns - age_ns))
+        files.append(f)
+    filt = filter_cls(op=op, value=value)
+
+    # Act
+    single = [filt.match(f, StatProxy(f), now=now) for f in files]
+    batch = filt.match_batch(files, [StatProxy(f) for f in files], now=now)
+
+    # Assert
+    expected = [op(units, value) for units in (value - 1, value, value)]
+    assert single == expected
+    assert batch == expected
+
+
+def test_age_window_matches_floor_division_at_exact_boundaries() -> None:
+    """The precomputed window agrees with _age_units at value * unit and one ulp either side."""
+    # Arrange
+    now_ts = 1_717_243_200.0
+    cases = []
+    for filter_cls in [AgeSeconds, AgeMinutes, AgeHours, AgeDays, AgeYears]:
+        for value in [0, 1, 3, 10]:
+            boundary = value * filter_cls.unit_seconds
+            below, above = math.nextafter(boundary, -math.inf), math.nextafter(boundary, math.inf)
+            for age in [below, boundary, above]:
+                cases.append((filter_cls, value, now_ts - age))
+
+    # Act / Assert
+    for op in [operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne]:
+        for filter_cls, value, ts in cases:
+            filt = filter_cls(op=op, value=value)
+            low, high, inside = filt._window
+            expected = op(filt._age_units(ts, now_ts), value)
+            assert ((low <= now_ts - ts < high) is inside) is expected, (filter_cls, op, value)
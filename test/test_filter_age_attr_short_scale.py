@@ -1,26 +1,41 @@
 """Deterministic tests for 1-second age behavior using injected stat_result objects.
 
-These tests avoid filesystem platform differences (ctime semantics) by creating a
-lightweight object with the expected `st_mtime`, `st_atime`, and `st_ctime`
-attributes and passing it via the `stat_result` parameter to the filter's
-`match()` method.
+These tests avoid filesystem platform differences (ctime semantics) by building an
+`os.stat_result` with the expected `st_mtime`, `st_atime`, and `st_ctime`
+values and injecting it through a stat proxy passed to the filter's `match()`
+method.
 """
 
 import datetime as dt
+import os
 import pathlib
-import types
 
 import pytest
 
 from pathql.filters.age import AgeSeconds
 
+# Fixed reference time shared by every parametrized case.
+_NOW = dt.datetime(2025, 10, 21, 12, 0, 0)
+_NOW_TS = int(_NOW.timestamp())
+_DUMMY_PATH = pathlib.Path("dummy")
+
 
 class TestStatProxy:
+    """StatProxy stand-in that returns an injected stat result."""
+
+    __test__ = False  # Not a pytest test class
+
     def __init__(self, path, stat_result):
         self.path = path
         self._stat = stat_result
         self._stat_calls = 0
 
+    def set_stat(self, stat_result) -> "TestStatProxy":
+        """Swap in a new stat result and reset the call counter for reuse."""
+        self._stat = stat_result
+        self._stat_calls = 0
+        return self
+
     def stat(self):
         self._stat_calls += 1
         return self._stat
@@ -34,13 +49,19 @@ def make_stat(
     st_mtime: float,
     st_atime: float | None = None,
     st_ctime: float | None = None,
-):
-    # create a simple object with the required attributes
-    obj = types.SimpleNamespace()
-    obj.st_mtime = st_mtime
-    obj.st_atime = st_atime if st_atime is not None else st_mtime
-    obj.st_ctime = st_ctime if st_ctime is not None else st_mtime
-    return obj
+) -> os.stat_result:
+    """Build a real os.stat_result; atime/ctime default to mtime."""
+    atime = st_atime if st_atime is not None else st_mtime
+    ctime = st_ctime if st_ctime is not None else st_mtime
+    # (mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime)
+    return os.stat_result((0, 0, 0, 0, 0, 0, 0, atime, st_mtime, ctime))
+
+
+@pytest.fixture(scope="session")
+def reusable_stat_proxy() -> TestStatProxy:
+    """Single TestStatProxy reused across cases via set_stat()."""
+    # Arrange
+    return TestStatProxy(_DUMMY_PATH, None)
 
 
 @pytest.mark.parametrize(
@@ -63,7 +84,11 @@ def make_stat(
     ],
 )
 def test_age_seconds_boundaries(
-    attr_name: str, offset: int, expected_age: int, msg: str
+    reusable_stat_proxy: TestStatProxy,
+    attr_name: str,
+    offset: int,
+    expected_age: int,
+    msg: str,
 ) -> None:
     """
     Test AgeSeconds filter at 1-second boundaries using injected stat_result.
@@ -74,18 +99,14 @@ def test_age_seconds_boundaries(
     """
 
     # Arrange
-    now = dt.datetime(2025, 10, 21, 12, 0, 0)
-
-    def stat_for_attr(attr_name: str, ts: float):
-        # Set all three fields to ts for consistency
-        return make_stat(st_mtime=ts, st_atime=ts, st_ctime=ts)
-
-    ts = int(now.timestamp()) - offset
-    st = stat_for_attr(attr_name, ts)
+    now = _NOW
+    ts = _NOW_TS - offset
+    # Set all three fields to ts for consistency
+    st = make_stat(st_mtime=ts, st_atime=ts, st_ctime=ts)
     f = AgeSeconds(attr=attr_name) == expected_age
-    dummy_path = pathlib.Path("dummy")
+    stat_proxy = reusable_stat_proxy.set_stat(st)
 
     # Act & Assert
     assert f.match(
-        path=dummy_path, now=now, stat_proxy=TestStatProxy(dummy_path, st)
+        path=_DUMMY_PATH, now=now, stat_proxy=stat_proxy
     ), f"{attr_name}: {msg}"
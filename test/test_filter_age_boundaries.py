@@ -1,7 +1,7 @@
 """Boundary tests for Age filters: check just-below, exact, and just-above unit boundaries.
 
-These tests set file mtimes precisely using `os.utime` with timestamps computed
-from a fixed `now` datetime and exercise AgeMinutes, AgeHours, AgeDays, and
+These tests set file mtimes precisely using `os.utime(ns=...)` with integer
+nanosecond timestamps computed from a fixed `now` datetime and exercise AgeMinutes, AgeHours, AgeDays, and
 AgeYears for the boundary values 0 and 1 unit.
 """
 
@@ -12,11 +12,14 @@ import pathlib
 import pytest
 
 from pathql.filters.age import AgeDays, AgeHours, AgeMinutes, AgeYears
+from pathql.filters.stat_proxy import StatProxy
 
 
 def set_mtime(path: pathlib.Path, when: dt.datetime) -> None:
-    ts = when.timestamp()
-    os.utime(path, (ts, ts))
+    """Set path's atime/mtime to `when` exactly, as integer nanoseconds (no float rounding)."""
+    whole_seconds = int(when.replace(microsecond=0).timestamp())
+    ns = whole_seconds * 1_000_000_000 + when.microsecond * 1_000
+    os.utime(path, ns=(ns, ns))
 
 
 @pytest.mark.parametrize(
@@ -40,8 +43,6 @@ def test_age_boundaries(
     just_below = now - dt.timedelta(seconds=(unit_seconds - small_delta))
     set_mtime(f, just_below)
     # unit_age floors to 0
-    from pathql.filters.stat_proxy import StatProxy
-
     assert (filter_cls() == 0).match(f, stat_proxy=StatProxy(f), now=now)
     assert not (filter_cls() == 1).match(f, stat_proxy=StatProxy(f), now=now)
 
@@ -7,6 +7,7 @@ import pytest
 
 from pathql.filters import Filter
 from pathql.filters.age import AgeDays, AgeHours, AgeMinutes, AgeYears
+from pathql.filters.stat_proxy import StatProxy
 
 
 def test_fractional_thresholds_disallowed_class_comparison():
@@ -24,26 +25,35 @@ def test_fractional_thresholds_disallowed_direct_init():
         _ = AgeMinutes(op=operator.gt, value=3.5)
 
 
-def make_file(tmp_path: pathlib.Path) -> pathlib.Path:
-    """Create a temporary file for age filter tests."""
-    file = tmp_path / "a_file.txt"
+@pytest.fixture(scope="module")
+def a_file(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Create one read-only file shared by the age error cases."""
+    # Arrange
+    file = tmp_path_factory.mktemp("age_extra") / "a_file.txt"
     file.write_text("x")
     return file
 
 
-@pytest.mark.parametrize("filter_cls", [AgeDays, AgeYears, AgeHours, AgeMinutes])
+@pytest.mark.parametrize("with_stat_proxy", [False, True], ids=["no_proxy", "proxy"])
+@pytest.mark.parametrize(
+    "filter_cls",
+    [AgeDays, AgeYears, AgeHours, AgeMinutes],
+    ids=lambda cls: cls.__name__,
+)
 def test_age_error(
-    tmp_path: pathlib.Path,
+    a_file: pathlib.Path,
     filter_cls: type[Filter],
+    with_stat_proxy: bool,
 ) -> None:
     """Age filters raise TypeError for missing args or unsupported operators."""
     # Arrange
-    file = make_file(tmp_path)
+    file = a_file
+    stat_proxy = StatProxy(file) if with_stat_proxy else None
 
     # Act and Assert
-    # Missing required arguments should raise TypeError
+    # Missing required arguments should raise TypeError, with or without a stat proxy
     with pytest.raises(TypeError):
-        filter_cls().match(file)
+        filter_cls().match(file, stat_proxy)
     # Now equality/inequality are supported (they construct filters), so ensure
     # construction does not raise for eq/ne but match still respects semantics.
     eq_f = filter_cls(op=operator.eq, value=0)
@@ -12,24 +12,20 @@ from typing import List
 
 import pytest
 
+from _filter_test_util import FALSE_FILTER as _F
+from _filter_test_util import TRUE_FILTER as _T
 from pathql.filters.alias import DatetimeOrNone
 from pathql.filters.base import All, Any, AllowAll, Filter, StatProxyOrNone
 
+_DUMMY = pathlib.Path("dummy.txt")
 
-class TrueFilter(Filter):
-    def match(self, path: pathlib.Path, stat_proxy:StatProxyOrNone=None, now:DatetimeOrNone =None) -> bool:
-        """All files match"""
-        return True
-
-class FalseFilter(Filter):
-    def match(self, path: pathlib.Path, stat_proxy:StatProxyOrNone=None, now:DatetimeOrNone=None) -> bool:
-        """No files match"""
-        return False
 
 class SideEffectFilter(Filter):
     """
     Filter that returns a fixed result and counts how many times match() is called.
     """
+    __slots__ = ("result", "call_count")
+
     def __init__(self, result: bool):
         self.result = result
         self.call_count = 0
@@ -46,34 +42,34 @@ class SideEffectFilter(Filter):
         (AllowAll, [], True),
 
         # All: single filter
-        (All, [TrueFilter()], True),
-        (All, [FalseFilter()], False),
+        (All, [_T], True),
+        (All, [_F], False),
 
         # All: two filters
-        (All, [TrueFilter(), TrueFilter()], True),
-        (All, [TrueFilter(), FalseFilter()], False),
-        (All, [FalseFilter(), TrueFilter()], False),
-        (All, [FalseFilter(), FalseFilter()], False),
+        (All, [_T, _T], True),
+        (All, [_T, _F], False),
+        (All, [_F, _T], False),
+        (All, [_F, _F], False),
 
         # All: three filters
-        (All, [TrueFilter(), TrueFilter(), TrueFilter()], True),
-        (All, [TrueFilter(), TrueFilter(), FalseFilter()], False),
-        (All, [FalseFilter(), TrueFilter(), TrueFilter()], False),
+        (All, [_T, _T, _T], True),
+        (All, [_T, _T, _F], False),
+        (All, [_F, _T, _T], False),
 
         # Any: single filter
-        (Any, [TrueFilter()], True),
-        (Any, [FalseFilter()], False),
+        (Any, [_T], True),
+        (Any, [_F], False),
 
         # Any: two filters
-       (Any, [TrueFilter(), FalseFilter()], True),
-        (Any, [FalseFilter(), TrueFilter()], True),
-        (Any, [FalseFilter(), FalseFilter()], False),
+       (Any, [_T, _F], True),
+        (Any, [_F, _T], True),
+        (Any, [_F, _F], False),
 
         # Any: three filters
-        (Any, [TrueFilter(), TrueFilter(), TrueFilter()], True),
-        (Any, [TrueFilter(), TrueFilter(), FalseFilter()], True),
-        (Any, [FalseFilter(), FalseFilter(), TrueFilter()], True),
-        (Any, [FalseFilter(), FalseFilter(), FalseFilter()], False),
+        (Any, [_T, _T, _T], True),
+        (Any, [_T, _T, _F], True),
+        (Any, [_F, _F, _T], True),
+        (Any, [_F, _F, _F], False),
     ]
 )
 @pytest.mark.parametrize("form", ["positional", "iterable"])
@@ -83,7 +79,7 @@ def test_combinator_filters(combinator, args, expected, form):
     using both positional and iterable forms.
     """
     # Arrange
-    dummy_path = pathlib.Path("dummy.txt")
+    dummy_path = _DUMMY
     # Act
     if combinator is AllowAll:
         value_filter: Filter = combinator()
@@ -122,12 +118,12 @@ def test_short_circuiting(combinator:Filter, results: list[bool], expected_resul
     filters:List[Filter] = [SideEffectFilter(r) for r in results]
     value_filter: Filter = combinator(*filters)
     # Act
-    result:bool = value_filter.match(pathlib.Path("dummy.txt"))
+    result:bool = value_filter.match(_DUMMY)
     # Assert
     assert result == expected_result
-    for idx, (filter, expected_count) in enumerate(zip(filters, expected_calls)):
-        assert filter.call_count == expected_count, (
-            f"Filter {idx} call_count={filt.call_count}, expected {expected_count}"
+    for idx, (flt, expected_count) in enumerate(zip(filters, expected_calls)):
+        assert flt.call_count == expected_count, (
+            f"Filter {idx} call_count={flt.call_count}, expected {expected_count}"
         )
 
 def test_any_single_filter_count():
@@ -138,7 +134,7 @@ def test_any_single_filter_count():
     f1 = SideEffectFilter(True)
     value_filter: Filter = Any(f1)
     # Act
-    result = value_filter.match(pathlib.Path("dummy.txt"))
+    result = value_filter.match(_DUMMY)
     # Assert
     assert result is True
     assert f1.call_count == 1, "Single filter should be called once"
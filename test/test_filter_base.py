@@ -7,161 +7,164 @@ Each test uses the Arrange-Act-Assert (AAA) pattern for clarity.
 
 import pathlib
 import pytest
-from pathql.filters.base import Filter, AndFilter, OrFilter, NotFilter, AllowAll, AllowNone
-
-class AlwaysTrue(Filter):
-    """Dummy filter that always matches."""
-    def match(self, path, stat_proxy=None, now=None):
-        return True
-
-class AlwaysFalse(Filter):
-    """Dummy filter that never matches."""
-    def match(self, path, stat_proxy=None, now=None):
-        return False
-
-def test_and_filter_match_true_true():
+from pathql.filters.alias import DatetimeOrNone, StatProxyOrNone
+from pathql.filters.base import (
+    All,
+    AllowAll,
+    AllowNone,
+    AndFilter,
+    Any,
+    Filter,
+    NotFilter,
+    OrFilter,
+)
+from pathql.filters.suffix import Suffix
+
+_FOO = pathlib.Path("foo")
+
+def test_and_filter_match_true_true(true_filter):
     """AndFilter: both True."""
     # Arrange
-    f1 = AlwaysTrue()
-    f2 = AlwaysTrue()
+    f1 = true_filter
+    f2 = true_filter
     and_filter = AndFilter(f1, f2)
     # Act
-    result = and_filter.match(pathlib.Path("foo"))
+    result = and_filter.match(_FOO)
     # Assert
     assert result
 
-def test_and_filter_match_true_false():
+def test_and_filter_match_true_false(true_filter, false_filter):
     """AndFilter: True and False."""
     # Arrange
-    f1 = AlwaysTrue()
-    f2 = AlwaysFalse()
+    f1 = true_filter
+    f2 = false_filter
     and_filter = AndFilter(f1, f2)
     # Act
-    result = and_filter.match(pathlib.Path("foo"))
+    result = and_filter.match(_FOO)
     # Assert
     assert not result
 
-def test_and_filter_match_false_true():
+def test_and_filter_match_false_true(true_filter, false_filter):
     """AndFilter: False and True."""
     # Arrange
-    f1 = AlwaysFalse()
-    f2 = AlwaysTrue()
+    f1 = false_filter
+    f2 = true_filter
     and_filter = AndFilter(f1, f2)
     # Act
-    result = and_filter.match(pathlib.Path("foo"))
+    result = and_filter.match(_FOO)
     # Assert
     assert not result
 
-def test_and_filter_match_false_false():
+def test_and_filter_match_false_false(false_filter):
     """AndFilter: both False."""
     # Arrange
-    f1 = AlwaysFalse()
-    f2 = AlwaysFalse()
+    f1 = false_filter
+    f2 = false_filter
     and_filter = AndFilter(f1, f2)
     # Act
-    result = and_filter.match(pathlib.Path("foo"))
+    result = and_filter.match(_FOO)
     # Assert
     assert not result
 
-def test_and_operator_chaining():
+def test_and_operator_chaining(true_filter, false_filter):
     """AndFilter: chaining with & operator."""
     # Arrange
-    f1 = AlwaysTrue()
-    f2 = AlwaysTrue()
-    f3 = AlwaysFalse()
+    f1 = true_filter
+    f2 = true_filter
+    f3 = false_filter
     # Act
     chained = f1 & f2 & f3
-    result = chained.match(pathlib.Path("foo"))
+    result = chained.match(_FOO)
     # Assert
     assert not result
 
-def test_or_filter_match_true_true():
+def test_or_filter_match_true_true(true_filter):
     """OrFilter: both True."""
     # Arrange
-    f1 = AlwaysTrue()
-    f2 = AlwaysTrue()
+    f1 = true_filter
+    f2 = true_filter
     or_filter = OrFilter(f1, f2)
     # Act
-    result = or_filter.match(pathlib.Path("foo"))
+    result = or_filter.match(_FOO)
     # Assert
     assert result
 
-def test_or_filter_match_true_false():
+def test_or_filter_match_true_false(true_filter, false_filter):
     """OrFilter: True or False."""
     # Arrange
-    f1 = AlwaysTrue()
-    f2 = AlwaysFalse()
+    f1 = true_filter
+    f2 = false_filter
     or_filter = OrFilter(f1, f2)
     # Act
-    result = or_filter.match(pathlib.Path("foo"))
+    result = or_filter.match(_FOO)
     # Assert
     assert result
 
-def test_or_filter_match_false_true():
+def test_or_filter_match_false_true(true_filter, false_filter):
     """OrFilter: False or True."""
     # Arrange
-    f1 = AlwaysFalse()
-    f2 = AlwaysTrue()
+    f1 = false_filter
+    f2 = true_filter
     or_filter = OrFilter(f1, f2)
     # Act
-    result = or_filter.match(pathlib.Path("foo"))
+    result = or_filter.match(_FOO)
     # Assert
     assert result
 
-def test_or_filter_match_false_false():
+def test_or_filter_match_false_false(false_filter):
     """OrFilter: both False."""
     # Arrange
-    f1 = AlwaysFalse()
-    f2 = AlwaysFalse()
+    f1 = false_filter
+    f2 = false_filter
     or_filter = OrFilter(f1, f2)
     # Act
-    result = or_filter.match(pathlib.Path("foo"))
+    result = or_filter.match(_FOO)
     # Assert
     assert not result
 
-def test_or_operator_chaining():
+def test_or_operator_chaining(true_filter, false_filter):
     """OrFilter: chaining with | operator."""
     # Arrange
-    f1 = AlwaysFalse()
-    f2 = AlwaysFalse()
-    f3 = AlwaysTrue()
+    f1 = false_filter
+    f2 = false_filter
+    f3 = true_filter
     # Act
     chained = f1 | f2 | f3
-    result = chained.match(pathlib.Path("foo"))
+    result = chained.match(_FOO)
     # Assert
     assert result
 
-def test_not_filter_true():
+def test_not_filter_true(true_filter):
     """NotFilter: negates True."""
     # Arrange
-    f = AlwaysTrue()
+    f = true_filter
     not_filter = NotFilter(f)
     # Act
-    result = not_filter.match(pathlib.Path("foo"))
+    result = not_filter.match(_FOO)
     # Assert
     assert not result
 
-def test_not_filter_false():
+def test_not_filter_false(false_filter):
     """NotFilter: negates False."""
     # Arrange
-    f = AlwaysFalse()
+    f = false_filter
     not_filter = NotFilter(f)
     # Act
-    result = not_filter.match(pathlib.Path("foo"))
+    result = not_filter.match(_FOO)
     # Assert
     assert result
 
-def test_not_operator():
+def test_not_operator(true_filter, false_filter):
     """NotFilter: ~ operator."""
     # Arrange
-    f = AlwaysTrue()
-    f2 = AlwaysFalse()
+    f = true_filter
+    f2 = false_filter
     # Act
     not_filter = ~f
     not_filter2 = ~f2
     # Assert
-    assert not not_filter.match(pathlib.Path("foo"))
-    assert not_filter2.match(pathlib.Path("foo"))
+    assert not not_filter.match(_FOO)
+    assert not_filter2.match(_FOO)
 
 def test_allowall_and_allownone():
     """AllowAll and AllowNone filters."""
@@ -169,8 +172,62 @@ def test_allowall_and_allownone():
     allow_all = AllowAll()
     allow_none = AllowNone()
     # Act
-    result_all = allow_all.match(pathlib.Path("foo"))
-    result_none = allow_none.match(pathlib.Path("foo"))
+    result_all = allow_all.match(_FOO)
+    result_none = allow_none.match(_FOO)
     # Assert
     assert result_all
-    assert not result_none
\ No newline at end of file
+    assert not result_none
+
+
+class RecordingStemFilter(Filter):
+    """Filter that matches stems starting with a prefix and records the paths it saw."""
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.seen: list[pathlib.Path] = []
+
+    def match(
+        self,
+        path: pathlib.Path,
+        stat_proxy: StatProxyOrNone = None,
+        now: DatetimeOrNone = None,
+    ) -> bool:
+        """Record the path and match on the stem prefix."""
+        self.seen.append(path)
+        return path.stem.startswith(self.prefix)
+
+
+_BATCH = [pathlib.Path(n) for n in ("a1.txt", "a2.log", "b1.txt", "b2.log")]
+
+
+@pytest.mark.parametrize(
+    "make_filter",
+    [
+        lambda: AndFilter(Suffix("txt"), RecordingStemFilter("a")),
+        lambda: OrFilter(Suffix("txt"), RecordingStemFilter("a")),
+        lambda: NotFilter(AndFilter(Suffix("txt"), RecordingStemFilter("a"))),
+        lambda: All(Suffix("txt"), RecordingStemFilter("a"), RecordingStemFilter("a1")),
+        lambda: Any(Suffix("log"), RecordingStemFilter("a"), RecordingStemFilter("b1")),
+    ],
+)
+def test_match_batch_agrees_with_match(make_filter):
+    """match_batch returns the same results as calling match per path."""
+    # Arrange
+    filt = make_filter()
+    proxies = [None] * len(_BATCH)
+    # Act
+    batch = filt.match_batch(_BATCH, proxies)
+    single = [filt.match(p) for p in _BATCH]
+    # Assert
+    assert batch == single
+
+def test_and_match_batch_only_evaluates_survivors():
+    """AndFilter.match_batch evaluates the right filter only where the left matched."""
+    # Arrange
+    right = RecordingStemFilter("a")
+    filt = AndFilter(Suffix("txt"), right)
+    # Act
+    result = filt.match_batch(_BATCH, [None] * len(_BATCH))
+    # Assert
+    assert result == [True, False, False, False]
+    assert right.seen == [pathlib.Path("a1.txt"), pathlib.Path("b1.txt")]
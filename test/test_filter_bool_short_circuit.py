@@ -9,16 +9,21 @@ unnecessary computation, especially for expensive filters.
 
 import pathlib
 import time
+from typing import Callable
 
-from pathql.filters.base import AndFilter, Filter, OrFilter
+import pytest
+
+from _filter_test_util import FalseFilter, TrueFilter
+from pathql.filters.base import All, AndFilter, Any, Filter, OrFilter
 
 DELAY = 0.1  # seconds to sleep in DelayFilter
 SHORT_CIRCUIT_THRESHOLD = 0.5 * DELAY  # max time for short-circuiting tests
 
 class DelayFilter(Filter):
-    """Filter that sleeps for DELAY seconds and returns a fixed boolean."""
-    def __init__(self, result: bool):
+    """Filter that sleeps for DELAY seconds and returns a fixed boolean; cost is configurable."""
+    def __init__(self, result: bool, cost: int = 1):
         self.result = result
+        self.cost = cost
         self.called = False
 
     def match(
@@ -31,26 +36,6 @@ class DelayFilter(Filter):
         time.sleep(DELAY)
         return self.result
 
-class TrueFilter(Filter):
-    """Filter that always returns True."""
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy=None,
-        now=None,
-    ) -> bool:
-        return True
-
-class FalseFilter(Filter):
-    """Filter that always returns False."""
-    def match(
-        self,
-        path: pathlib.Path,
-        stat_proxy=None,
-        now=None,
-    ) -> bool:
-        return False
-
 def test_and_filter_short_circuit() -> None:
     """
     Test that AndFilter short-circuits and does not call right filter if left is False.
@@ -193,4 +178,60 @@ def test_and_filter_chain_short_circuit() -> None:
     assert not getattr(b, "called", False)
     assert not c.called  # c should NOT be called because a fails
     assert actual_elapsed < SHORT_CIRCUIT_THRESHOLD
-    
\ No newline at end of file
+    
+@pytest.mark.parametrize(
+    "combine, result",
+    [(AndFilter, False), (OrFilter, True), (Any, True)],
+    ids=["and", "or", "any"],
+)
+def test_combinator_keeps_operand_order_regardless_of_cost(
+    combine: Callable[[Filter, Filter], Filter],
+    result: bool,
+) -> None:
+    """
+    Test that AndFilter, OrFilter and Any evaluate left first, and keep it first, even when
+    it advertises a higher cost; left alone decides the result, so right is never reached.
+    """
+    # Arrange
+
+    left = DelayFilter(result, cost=100)
+    right = DelayFilter(True)
+
+    # Act
+
+    combined = combine(left, right)
+    actual_result = combined.match(pathlib.Path("dummy"))
+
+    # Assert
+
+    assert actual_result is result
+    operands = [combined.left, combined.right] if hasattr(combined, "left") else combined.filters
+    assert operands[0] is left and operands[1] is right
+    assert left.called
+    assert not right.called
+
+
+def test_all_keeps_order_unless_by_cost() -> None:
+    """
+    Test that All evaluates in the given order, and cheapest first only with by_cost=True.
+    """
+    # Arrange
+
+    in_order = [DelayFilter(False, cost=100), DelayFilter(True)]
+    by_cost = [DelayFilter(True, cost=100), FalseFilter()]
+
+    # Act
+
+    in_order_result = All(*in_order).match(pathlib.Path("dummy"))
+    start = time.time()
+    by_cost_result = All(*by_cost, by_cost=True).match(pathlib.Path("dummy"))
+    by_cost_elapsed = time.time() - start
+
+    # Assert
+
+    assert in_order_result is False
+    assert in_order[0].called
+    assert not in_order[1].called
+    assert by_cost_result is False
+    assert not by_cost[0].called  # expensive filter skipped because the cheap one failed
+    assert by_cost_elapsed < SHORT_CIRCUIT_THRESHOLD
@@ -0,0 +1,186 @@
+"""
+Differential tests: every filter gives the same answer through every evaluation path.
+
+match() is the reference semantics; match_batch() is what Query evaluates, for the
+unthreaded walk, the threaded walk and Query.match alike. The same filters are run over
+one fixed tree (files of different sizes and ages, a directory and a path that does not
+exist) and all paths must agree, including raising the same exception type when match()
+raises.
+"""
+
+import datetime as dt
+import operator
+import os
+import pathlib
+from typing import Callable
+
+import pytest
+
+from pathql.filters.access import Read, Write
+from pathql.filters.age import AgeDays, AgeMinutes, AgeSeconds
+from pathql.filters.attribute_filter import AttributeFilter
+from pathql.filters.base import All, AllowAll, AllowNone, Any, Filter
+from pathql.filters.between import Between
+from pathql.filters.datetime_parts import YearFilter
+from pathql.filters.file import File
+from pathql.filters.file_type import FileType
+from pathql.filters.size import Size
+from pathql.filters.stat_proxy import StatProxy
+from pathql.filters.stem import Stem
+from pathql.filters.suffix import Suffix
+from pathql.query import Query
+
+# Reference time for every age filter; file mtimes are set relative to it.
+NOW = dt.datetime(2024, 6, 1, 12, 0, 0)
+
+# name -> (size in bytes, age in seconds before NOW)
+_TREE = {
+    "a1.txt": (5, 10),
+    "a2.log": (20, 59),
+    "b1.txt": (40, 60),
+    "b2.md": (100, 3600),
+    "old.txt": (1000, 3 * 86400),
+}
+
+
+class _SizeVsStr(AttributeFilter):
+    """Compares st_size to a str, so every comparison raises TypeError."""
+
+    stat_column = "st_size"
+
+    def __init__(self) -> None:
+        super().__init__(lambda p, sp, now: sp.stat().st_size, operator.lt, "x")
+
+
+class _NameVsInt(AttributeFilter):
+    """Compares the file name to an int through its extractor, so every comparison raises."""
+
+    def __init__(self) -> None:
+        super().__init__(lambda p, sp, now: p.name, operator.lt, 5, requires_stat=False)
+
+
+FILTERS: dict[str, Callable[[], Filter]] = {
+    "suffix": lambda: Suffix("txt"),
+    "suffix-ne": lambda: Suffix() != "txt",
+    "stem": lambda: Stem("a*"),
+    "file": lambda: File("*.log"),
+    "type-file": lambda: FileType().file,
+    "type-dir": lambda: FileType().directory,
+    "type-unknown": lambda: FileType().unknown,
+    "size-gt": lambda: Size() > 15,
+    "size-eq": lambda: Size() == 40,
+    "size-str": lambda: Size() <= "1 kb",
+    "size-vs-str": _SizeVsStr,
+    "name-vs-int": _NameVsInt,
+    "age-seconds": lambda: AgeSeconds() > 30,
+    "age-minutes-eq": lambda: AgeMinutes() == 1,
+    "age-minutes-ne": lambda: AgeMinutes() != 0,
+    "age-days": lambda: AgeDays() < 1,
+    "between": lambda: Between(Size(), 10, 101),
+    "read": Read,
+    "write": Write,
+    "allow-all": AllowAll,
+    "allow-none": AllowNone,
+    "and": lambda: Suffix("txt") & (Size() > 15),
+    "or": lambda: Stem("b*") | (AgeSeconds() < 30),
+    "not": lambda: ~(FileType().file & (Size() < 50)),
+    "all": lambda: All(Suffix("txt"), Size() > 1, AgeMinutes() < 10),
+    "any": lambda: Any(File("*.md"), Size() >= 1000, _SizeVsStr()),
+    "year": lambda: YearFilter(NOW.year),
+}
+
+
+@pytest.fixture(scope="module")
+def diff_tree(tmp_path_factory: pytest.TempPathFactory) -> list[pathlib.Path]:
+    """The _TREE files plus a directory, with mtimes set relative to NOW (read only)."""
+    root = tmp_path_factory.mktemp("differential")
+    now_ns = int(NOW.timestamp()) * 1_000_000_000
+    paths = []
+    for name, (size, age) in _TREE.items():
+        path = root / name
+        path.write_bytes(b"x" * size)
+        mtime_ns = now_ns - age * 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        paths.append(path)
+    os.mkdir(root / "sub")
+    return [*paths, root / "sub"]
+
+
+def _outcome(call: Callable[[], object]) -> object:
+    """Return call()'s result, or the type of the exception it raised."""
+    try:
+        return call()
+    except Exception as exc:  # pylint: disable=broad-except
+        return type(exc)
+
+
+def _single(flt: Filter, paths: list[pathlib.Path]) -> list[object]:
+    """Evaluate flt with match() per path, each with its own fresh StatProxy."""
+    return [_outcome(lambda p=p: bool(flt.match(p, StatProxy(p), now=NOW))) for p in paths]
+
+
+@pytest.mark.parametrize("make_filter", FILTERS.values(), ids=FILTERS.keys())
+def test_match_batch_agrees_with_match(diff_tree: list[pathlib.Path], make_filter):
+    """match_batch returns match()'s result for every path, on existing files."""
+    # Arrange
+    flt = make_filter()
+    proxies = [StatProxy(p) for p in diff_tree]
+
+    # Act
+    single = _single(flt, diff_tree)
+    batch = _outcome(lambda: [bool(m) for m in flt.match_batch(diff_tree, proxies, now=NOW)])
+
+    # Assert
+    assert batch == single
+
+
+@pytest.mark.parametrize("make_filter", FILTERS.values(), ids=FILTERS.keys())
+def test_match_batch_agrees_with_match_on_missing_path(
+    diff_tree: list[pathlib.Path],
+    make_filter,
+):
+    """Where stat() fails, match_batch returns, or raises, exactly as match() does."""
+    # Arrange
+    flt = make_filter()
+    missing = diff_tree[0].parent / "missing.txt"
+
+    # Act
+    single = _single(flt, [missing])
+    batch = _outcome(
+        lambda: [bool(m) for m in flt.match_batch([missing], [StatProxy(missing)], now=NOW)]
+    )
+
+    # Assert
+    assert batch == (single[0] if isinstance(single[0], type) else single)
+
+
+@pytest.mark.parametrize("threaded", [False, True], ids=["unthreaded", "threaded"])
+@pytest.mark.parametrize("make_filter", FILTERS.values(), ids=FILTERS.keys())
+def test_query_walks_agree_with_match(
+    diff_tree: list[pathlib.Path],
+    make_filter,
+    threaded: bool,
+):
+    """Query.files and Query.match select exactly the paths match() accepts, or raise alike."""
+    # Arrange
+    flt = make_filter()
+    query = Query(where_expr=flt)
+    single = _single(flt, diff_tree)
+    expected = next(
+        (r for r in single if isinstance(r, type)),
+        sorted(p for p, r in zip(diff_tree, single) if r),
+    )
+
+    # Act
+    walked = _outcome(
+        lambda: sorted(
+            query.files(diff_tree[0].parent, files_only=False, now=NOW, threaded=threaded)
+        )
+    )
+    one_by_one = _outcome(
+        lambda: sorted(p for p in diff_tree if query.match(p, StatProxy(p), now=NOW))
+    )
+
+    # Assert
+    assert walked == expected
+    assert one_by_one == expected
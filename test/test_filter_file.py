@@ -1,10 +1,15 @@
 """Tests for File filter: curly-brace extension patterns and case-insensitivity."""
 
+import fnmatch
+import ntpath
+import os
 import pathlib
 
 import pytest
 
+import pathql.filters.file as file_module
 from pathql.filters import File
+from pathql.query import Query
 
 
 @pytest.mark.parametrize(
@@ -39,7 +44,7 @@ def test_file_curly_brace_suffix(
 def make_file(tmp_path: pathlib.Path, name: str) -> pathlib.Path:
     """Create a file with the given name in the temporary directory."""
     file = tmp_path / name
-    file.write_text("x")
+    file.touch()
     return file
 
 
@@ -89,3 +94,69 @@ def test_file_patterns(
 
 
 ## as_stem_and_suffix is no longer supported in File filter
+
+
+@pytest.mark.parametrize(
+    "name, pattern, ignore_case, should_match",
+    [
+        ("FOO.TXT", "foo*", True, True),
+        ("FOO.TXT", "foo*", False, False),
+        ("\u0130x.md", "ix*", True, False),  # lower() of U+0130 is "i" + combining dot
+        ("\u0130x.md", "\u0130x*", True, True),
+    ],
+    ids=["upper-name", "case-sensitive", "dotted-capital-i", "dotted-capital-i-pattern"],
+)
+def test_file_ignore_case_lowers_name_and_pattern(
+    name: str,
+    pattern: str,
+    ignore_case: bool,
+    should_match: bool,
+) -> None:
+    """Case-insensitive matching compares the lowered name with the lowered pattern."""
+    # Arrange
+    path = pathlib.PurePosixPath(name)
+
+    # Act
+    matched = File(pattern, ignore_case=ignore_case).match(path)
+
+    # Assert
+    assert matched is should_match
+
+
+@pytest.mark.parametrize("ignore_case", [True, False])
+@pytest.mark.parametrize(
+    "filename, pattern",
+    [("Foo.TXT", "foo.txt"), ("foo.txt", "FOO.*"), ("foo.txt", "foo.txt"), ("a.md", "b.md")],
+)
+def test_file_agrees_with_fnmatch(filename: str, pattern: str, ignore_case: bool) -> None:
+    """File matches exactly where fnmatch.fnmatch does, normcase included, on this platform."""
+    # Arrange
+    name = filename.lower() if ignore_case else filename
+    expected = fnmatch.fnmatch(name, pattern.lower() if ignore_case else pattern)
+    flt = File(pattern, ignore_case=ignore_case)
+
+    # Act
+    actual = flt.match(pathlib.PurePosixPath(filename))
+    pushed_down = Query._extract_name_predicate(flt)(filename)
+
+    # Assert
+    assert actual is expected
+    assert pushed_down is expected
+
+
+def test_file_case_sensitive_folds_case_where_normcase_does(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With a case-folding os.path.normcase (Windows), ignore_case=False still folds case."""
+    # Arrange
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    monkeypatch.setattr(file_module, "_NORMCASE", True)
+    flt = File("FOO.txt", ignore_case=False)
+
+    # Act
+    actual = flt.match(pathlib.PurePosixPath("foo.TXT"))
+    pushed_down = Query._extract_name_predicate(flt)("foo.TXT")
+
+    # Assert
+    assert actual is True
+    assert pushed_down is True
@@ -4,6 +4,7 @@ Verifies correct age calculation and matching for files with date-encoded filena
 """
 
 import datetime as dt
+import functools
 import operator
 import pathlib
 import pytest
@@ -11,6 +12,14 @@ import pytest
 from pathql.filters.file_age import FilenameAgeDays, FilenameAgeHours, FilenameAgeYears
 from pathql.filters.date_filename import path_from_datetime
 
+_UNDATED = pathlib.Path("archive.txt")
+
+
+@functools.lru_cache(maxsize=None)
+def make_filter(filter_cls: type, op: object, threshold: int):
+    """Return a shared filter instance for identical (class, op, threshold) keys."""
+    return filter_cls(op, threshold)
+
 
 def make_file(
     date: dt.datetime, name: str = "archive", ext: str = "txt", date_width: str = "hour"
@@ -27,6 +36,14 @@ def make_file(
     Returns:
         pathlib.Path: Path object with the encoded filename.
     """
+    return _cached_file(date, name, ext, date_width)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_file(
+    date: dt.datetime, name: str, ext: str, date_width: str
+) -> pathlib.Path:
+    """Build the date-encoded path once per distinct argument tuple."""
     fname: str = path_from_datetime(name, ext, width=date_width, dt_=date)
     return pathlib.Path(fname)
 
@@ -212,11 +229,11 @@ def test_filename_age_filters(
     if file_date is not None:
         path = make_file(file_date, date_width=date_width)
     else:
-        path = pathlib.Path("archive.txt")
+        path = _UNDATED
 
     # Act
 
-    filt = filter_cls(op, threshold)
+    filt = make_filter(filter_cls, op, threshold)
     result = filt.match(path, now=now)
 
     # Assert
@@ -4,8 +4,8 @@ Verifies operator overloads and correct extraction of file dates from stat and f
 """
 
 import datetime as dt
+import os
 import pathlib
-import sys
 
 import pytest
 
@@ -13,43 +13,27 @@ from pathql.filters.between import Between
 from pathql.filters.filedate import FileDate
 from pathql.filters.stat_proxy import StatProxy
 
-if sys.platform == "win32":
-    BasePath = pathlib.WindowsPath
-else:
-    BasePath = pathlib.PosixPath
+class StubPath:
+    """Minimal path stand-in exposing only the name, stem and stat() FileDate uses."""
 
+    __slots__ = ("name", "stem", "_stat")
 
-class DummyPath(BasePath):
-    """A dummy Path subclass for testing with custom stat and stem."""
-
-    def __new__(cls, *args, **kwargs):
-        # Extract test-only kwargs before letting pathlib build the Path
-        stat = kwargs.pop("stat", None)
-        stem = kwargs.pop("stem", None)
-        self = BasePath.__new__(cls, *args, **kwargs)
-        # Attach test-only attributes without touching pathlib internals
-        object.__setattr__(self, "_stat", stat)
-        object.__setattr__(self, "_stem", stem)
-        return self
+    def __init__(self, name, stat=None, stem=None):
+        self.name = name
+        self.stem = stem if stem is not None else name.rsplit(".", 1)[0]
+        self._stat = stat
 
     def stat(self):
         return self._stat
 
-    @property
-    def stem(self):
-        return self._stem if self._stem is not None else super().stem
-
-
-class DummyStat:
-    """Dummy stat result for testing."""
 
-    def __init__(self, mtime, ctime, atime):
-        self.st_mtime = mtime
-        self.st_ctime = ctime
-        self.st_atime = atime
+def dummy_stat(*, st_mtime: float, st_ctime: float, st_atime: float) -> os.stat_result:
+    """Build a real os.stat_result carrying the three timestamp fields (others zero)."""
+    # (mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime)
+    return os.stat_result((0, 0, 0, 0, 0, 0, 0, st_atime, st_mtime, st_ctime))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dummy_times():
     # Arrange
 
@@ -62,27 +46,35 @@ def dummy_times():
     return dt1, dt2, dt3
 
 
-def test_filedate_modified(dummy_times):
+@pytest.fixture(scope="module")
+def dummy_times_stat(dummy_times) -> os.stat_result:
+    """Stat result with mtime=dt2, ctime=dt1, atime=dt3, converted once per module."""
+    # Arrange
+    dt1, dt2, dt3 = dummy_times
+    return dummy_stat(
+        st_mtime=dt2.timestamp(), st_ctime=dt1.timestamp(), st_atime=dt3.timestamp()
+    )
+
+
+def test_filedate_modified(dummy_times, dummy_times_stat):
     """
     Test FileDate.modified operator overloads.
     """
     # Arrange
 
-    dt1, dt2, dt3 = dummy_times
-    stat = DummyStat(
-        mtime=dt2.timestamp(), ctime=dt1.timestamp(), atime=dt3.timestamp()
-    )
-    path = DummyPath("dummy.txt", stat=stat)
+    dt1, dt2, _ = dummy_times
+    path = StubPath("dummy.txt", stat=dummy_times_stat)
+    proxy = StatProxy(path)
     fmod = FileDate().modified
 
     # Act
 
-    actual_gt = (fmod > dt1).match(path, StatProxy(path))
-    actual_ge = (fmod >= dt2).match(path, StatProxy(path))
-    actual_lt = (fmod < dt1).match(path, StatProxy(path))
-    actual_le = (fmod <= dt2).match(path, StatProxy(path))
-    actual_eq = (fmod == dt2).match(path, StatProxy(path))
-    actual_ne = (fmod != dt1).match(path, StatProxy(path))
+    actual_gt = (fmod > dt1).match(path, proxy)
+    actual_ge = (fmod >= dt2).match(path, proxy)
+    actual_lt = (fmod < dt1).match(path, proxy)
+    actual_le = (fmod <= dt2).match(path, proxy)
+    actual_eq = (fmod == dt2).match(path, proxy)
+    actual_ne = (fmod != dt1).match(path, proxy)
 
     # Assert
 
@@ -94,26 +86,24 @@ def test_filedate_modified(dummy_times):
     assert actual_ne
 
 
-def test_filedate_created(dummy_times):
+def test_filedate_created(dummy_times, dummy_times_stat):
     """
     Test FileDate.created operator overloads.
     """
     # Arrange
 
-    dt1, dt2, dt3 = dummy_times
-    stat = DummyStat(
-        mtime=dt2.timestamp(), ctime=dt1.timestamp(), atime=dt3.timestamp()
-    )
-    path = DummyPath("dummy.txt", stat=stat)
+    dt1, dt2, _ = dummy_times
+    path = StubPath("dummy.txt", stat=dummy_times_stat)
+    proxy = StatProxy(path)
     fcre = FileDate().created
 
     # Act
 
-    actual_lt = (fcre < dt2).match(path, StatProxy(path))
-    actual_le = (fcre <= dt1).match(path, StatProxy(path))
-    actual_eq = (fcre == dt1).match(path, StatProxy(path))
-    actual_ne = (fcre != dt2).match(path, StatProxy(path))
-    actual_gt = (fcre > dt2).match(path, StatProxy(path))
+    actual_lt = (fcre < dt2).match(path, proxy)
+    actual_le = (fcre <= dt1).match(path, proxy)
+    actual_eq = (fcre == dt1).match(path, proxy)
+    actual_ne = (fcre != dt2).match(path, proxy)
+    actual_gt = (fcre > dt2).match(path, proxy)
 
     # Assert
 
@@ -124,26 +114,24 @@ def test_filedate_created(dummy_times):
     assert not actual_gt
 
 
-def test_filedate_accessed(dummy_times):
+def test_filedate_accessed(dummy_times, dummy_times_stat):
     """
     Test FileDate.accessed operator overloads.
     """
     # Arrange
 
-    dt1, dt2, dt3 = dummy_times
-    stat = DummyStat(
-        mtime=dt2.timestamp(), ctime=dt1.timestamp(), atime=dt3.timestamp()
-    )
-    path = DummyPath("dummy.txt", stat=stat)
+    _, dt2, dt3 = dummy_times
+    path = StubPath("dummy.txt", stat=dummy_times_stat)
+    proxy = StatProxy(path)
     facc = FileDate().accessed
 
     # Act
 
-    actual_gt = (facc > dt2).match(path, StatProxy(path))
-    actual_ge = (facc >= dt3).match(path, StatProxy(path))
-    actual_eq = (facc == dt3).match(path, StatProxy(path))
-    actual_ne = (facc != dt2).match(path, StatProxy(path))
-    actual_lt = (facc < dt2).match(path, StatProxy(path))
+    actual_gt = (facc > dt2).match(path, proxy)
+    actual_ge = (facc >= dt3).match(path, proxy)
+    actual_eq = (facc == dt3).match(path, proxy)
+    actual_ne = (facc != dt2).match(path, proxy)
+    actual_lt = (facc < dt2).match(path, proxy)
 
     # Assert
 
@@ -160,18 +148,19 @@ def test_filedate_filename(dummy_times):
     """
     # Arrange
 
-    dt1, dt2, dt3 = dummy_times
+    dt1, dt2, _ = dummy_times
     # Filename: "2024-02-01_log.txt"
-    path = DummyPath("2024-02-01_log.txt", stem="2024-02-01_log")
+    path = StubPath("2024-02-01_log.txt", stem="2024-02-01_log")
+    proxy = StatProxy(path)
     ffile = FileDate().filename
 
     # Act
 
-    actual_gt = (ffile > dt1).match(path, StatProxy(path))
-    actual_ge = (ffile >= dt2).match(path, StatProxy(path))
-    actual_eq = (ffile == dt2).match(path, StatProxy(path))
-    actual_ne = (ffile != dt1).match(path, StatProxy(path))
-    actual_lt = (ffile < dt1).match(path, StatProxy(path))
+    actual_gt = (ffile > dt1).match(path, proxy)
+    actual_ge = (ffile >= dt2).match(path, proxy)
+    actual_eq = (ffile == dt2).match(path, proxy)
+    actual_ne = (ffile != dt1).match(path, proxy)
+    actual_lt = (ffile < dt1).match(path, proxy)
 
     # Assert
 
@@ -182,27 +171,25 @@ def test_filedate_filename(dummy_times):
     assert not actual_lt
 
 
-def test_filedate_between(dummy_times):
+def test_filedate_between(dummy_times, dummy_times_stat):
     """
     Test FileDate 'between' logic using two comparisons (lower inclusive, upper exclusive).
     """
     # Arrange
 
-    dt1, dt2, dt3 = dummy_times
-    stat = DummyStat(
-        mtime=dt2.timestamp(), ctime=dt1.timestamp(), atime=dt3.timestamp()
-    )
-    path = DummyPath("dummy.txt", stat=stat)
+    dt1, _, dt3 = dummy_times
+    path = StubPath("dummy.txt", stat=dummy_times_stat)
+    proxy = StatProxy(path)
     fmod = FileDate().modified
 
     # Act
 
     between = (fmod >= dt1) & (fmod < dt3)
 
-    actual_between = between.match(path, StatProxy(path))
+    actual_between = between.match(path, proxy)
 
     not_between = (fmod > dt.datetime(2024, 2, 2)) & (fmod < dt3)
-    actual_not_between = not_between.match(path, StatProxy(path))
+    actual_not_between = not_between.match(path, proxy)
 
     # Assert
 
@@ -210,6 +197,25 @@ def test_filedate_between(dummy_times):
     assert not actual_not_between
 
 
+def test_filedate_modified_eq_at_microsecond_precision(tmp_path: pathlib.Path):
+    """== matches a file whose nanosecond mtime equals the datetime to the microsecond."""
+    # Arrange
+    when = dt.datetime(2024, 2, 1, 12, 0, 0, 123456)
+    path = tmp_path / "ns.txt"
+    path.write_text("x")
+    ns = int(when.replace(microsecond=0).timestamp()) * 1_000_000_000 + 123_456_400
+    os.utime(path, ns=(ns, ns))
+    fmod = FileDate().modified
+
+    # Act
+    actual_eq = (fmod == when).match(path, StatProxy(path))
+    actual_ne = (fmod != when).match(path, StatProxy(path))
+
+    # Assert
+    assert actual_eq
+    assert not actual_ne
+
+
 @pytest.fixture
 def between_times():
     # Arrange
@@ -232,21 +238,22 @@ def test_filedate_between_operator(between_times):
     # Arrange
 
     dt1, dt2, dt3, dt4 = between_times
-    stat = DummyStat(
-        mtime=dt2.timestamp(), ctime=dt1.timestamp(), atime=dt3.timestamp()
+    stat = dummy_stat(
+        st_mtime=dt2.timestamp(), st_ctime=dt1.timestamp(), st_atime=dt3.timestamp()
     )
-    path = DummyPath("dummy.txt", stat=stat)
+    path = StubPath("dummy.txt", stat=stat)
+    proxy = StatProxy(path)
     fmod = FileDate().modified
 
     # Act
 
     # Should match: dt2 is between dt1 and dt3
     between_filter = Between(fmod, dt1, dt3)
-    actual_between = between_filter.match(path, StatProxy(path))
+    actual_between = between_filter.match(path, proxy)
 
     # Should not match: dt2 is not between dt3 and dt4
     not_between_filter = Between(fmod, dt3, dt4)
-    actual_not_between = not_between_filter.match(path, StatProxy(path))
+    actual_not_between = not_between_filter.match(path, proxy)
 
     # Assert
 
@@ -299,3 +306,26 @@ def test_filedate_between_filename_edges(filename, low, high, expected):
     between_filter = Between(ffile, low, high)
     result = between_filter.match(path, None)
     assert result is expected
+
+
+@pytest.mark.parametrize(
+    "filename, threshold, expected",
+    [
+        ("2024-02-01_10_log.txt", dt.datetime(2024, 2, 1, 10, 30), True),  # minutes count
+        ("2024-02-01_10_log.txt", dt.datetime(2024, 2, 1, 10, 0), False),
+        ("2024-13-01_log.txt", dt.datetime(2030, 1, 1), False),  # invalid month
+        ("2023-02-29_log.txt", dt.datetime(2030, 1, 1), False),  # not a leap year
+        ("log.txt", dt.datetime(2030, 1, 1), False),  # no date
+    ],
+)
+def test_filedate_filename_less_than(filename, threshold, expected):
+    """FileDate.filename orders by full datetime and rejects invalid dates."""
+    # Arrange
+    path = pathlib.Path(filename)
+    ffile = FileDate().filename < threshold
+
+    # Act
+    actual = ffile.match(path)
+
+    # Assert
+    assert actual is expected, f"{filename} < {threshold} should be {expected}"
@@ -77,4 +77,24 @@ def test_normalize_path_invalid_type():
     dummy = Dummy()
     # Act & Assert
     with pytest.raises(ValueError, match="Invalid paths argument"):
-        list(normalize_path(dummy))
\ No newline at end of file
+        list(normalize_path(dummy))
+def test_normalize_path_deeply_nested():
+    """Normalize nesting deeper than the recursion limit."""
+    # Arrange
+    paths = ["/tmp/a.txt"]
+    for _ in range(5000):
+        paths = [paths]
+    # Act
+    result = list(normalize_path(paths))
+    # Assert
+    assert result == [pathlib.Path("/tmp/a.txt")]
+
+def test_normalize_path_repeated_str_reuses_path():
+    """Repeated string inputs map to the same cached Path object."""
+    # Arrange
+    paths = ["/tmp/same.txt", "/tmp/same.txt"]
+    # Act
+    first, second = normalize_path(paths)
+    # Assert
+    assert first == pathlib.Path("/tmp/same.txt")
+    assert first is second
@@ -5,73 +5,103 @@
 #   100.txt (100 bytes)
 #   200.txt (200 bytes)
 
+import operator
 import pathlib
+from typing import Callable
+
+import pytest
 
 from pathql.filters.size import Size
 from pathql.filters.stat_proxy import StatProxy
 
-
-def test_size_eq(size_test_folder: pathlib.Path) -> None:
-    """Equality operator matches expected files by size."""
+SizeFiles = tuple[list[pathlib.Path], list[StatProxy]]
+
+
+@pytest.fixture
+def size_files(
+    size_test_files: tuple[pathlib.Path, ...],
+    size_test_proxies: tuple[StatProxy, ...],
+) -> SizeFiles:
+    """The size_test_folder files and their session-wide proxies, as lists."""
+    return list(size_test_files), list(size_test_proxies)
+
+
+@pytest.mark.parametrize(
+    "op, rhs, expected",
+    [
+        (operator.eq, 100, [True, False]),
+        (operator.eq, 200, [False, True]),
+        (operator.eq, 150, [False, False]),
+        (operator.ne, 150, [True, True]),
+        (operator.ne, 100, [False, True]),
+        (operator.lt, 300, [True, True]),
+        (operator.lt, 150, [True, False]),
+        (operator.lt, 100, [False, False]),
+        (operator.le, 200, [True, True]),
+        (operator.le, 100, [True, False]),
+        (operator.le, 50, [False, False]),
+        (operator.gt, 100, [False, True]),
+        (operator.gt, 200, [False, False]),
+        (operator.ge, 100, [True, True]),
+        (operator.ge, 200, [False, True]),
+        (operator.ge, 300, [False, False]),
+    ],
+)
+def test_size_operator(
+    size_files: SizeFiles,
+    op: Callable[[Size, int], Size],
+    rhs: int,
+    expected: list[bool],
+) -> None:
+    """Each Size operator overload matches the expected files of 100.txt and 200.txt."""
     # Arrange
-    files = list(size_test_folder.iterdir())
-
-    # Act and Assert
-    assert any((Size() == 100).match(f, StatProxy(f)) for f in files)
-    assert any((Size() == 200).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() == 150).match(f, StatProxy(f)) for f in files)
-
-
-def test_size_ne(size_test_folder: pathlib.Path) -> None:
-    """Inequality operator matches expected files by size."""
-    # Arrange
-    files = list(size_test_folder.iterdir())
-
-    # Act and Assert
-    assert all((Size() != 150).match(f, StatProxy(f)) for f in files)
-    assert any((Size() != 100).match(f, StatProxy(f)) for f in files)
-
-
-def test_size_lt(size_test_folder: pathlib.Path) -> None:
-    """Less-than operator matches files below the threshold."""
+    files, proxies = size_files
+    flt = op(Size(), rhs)
+
+    # Act
+    batch = flt.match_batch(files, proxies)
+    single = [flt.match(f, sp) for f, sp in zip(files, proxies)]
+
+    # Assert
+    assert batch == expected
+    assert single == expected
+
+
+@pytest.mark.parametrize(
+    "op",
+    [operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge],
+)
+def test_size_operator_sweep(
+    size_files: SizeFiles,
+    size_test_sizes: dict[pathlib.Path, int],
+    op: Callable[[object, int], object],
+) -> None:
+    """Across a range of thresholds, each Size operator agrees with the same op on st_size."""
     # Arrange
-    files = list(size_test_folder.iterdir())
+    files, proxies = size_files
+    thresholds = range(0, 301, 25)
 
-    # Act and Assert
-    assert all((Size() < 300).match(f, StatProxy(f)) for f in files)
-    assert any((Size() < 150).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() < 100).match(f, StatProxy(f)) for f in files)
+    # Act
+    results = {rhs: op(Size(), rhs).match_batch(files, proxies) for rhs in thresholds}
 
+    # Assert
+    for rhs, batch in results.items():
+        assert batch == [op(size_test_sizes[f], rhs) for f in files], rhs
 
-def test_size_le(size_test_folder: pathlib.Path) -> None:
-    """Less-than-or-equal operator matches files at or below threshold."""
-    # Arrange
-    files = list(size_test_folder.iterdir())
-
-    # Act and Assert
-    assert all((Size() <= 200).match(f, StatProxy(f)) for f in files)
-    assert any((Size() <= 100).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() <= 50).match(f, StatProxy(f)) for f in files)
 
-
-def test_size_gt(size_test_folder: pathlib.Path) -> None:
-    """Greater-than operator matches files above the threshold."""
+def test_size_match_batch_uses_stat_column(
+    size_test_folder: pathlib.Path,
+    size_test_files: tuple[pathlib.Path, ...],
+) -> None:
+    """match_batch agrees with match, including a path whose stat() fails."""
     # Arrange
-    files = list(size_test_folder.iterdir())
-
-    # Act and Assert
-    assert any((Size() > 100).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() > 200).match(f, StatProxy(f)) for f in files)
+    files = [*size_test_files, size_test_folder / "missing.txt"]
+    proxies = [StatProxy(f) for f in files]
+    filt = Size() >= 150
 
+    # Act
+    batch = filt.match_batch(files, proxies)
 
-def test_size_ge(size_test_folder: pathlib.Path) -> None:
-    """Greater-than-or-equal operator matches files at or above threshold."""
-    # Arrange
-    files = list(size_test_folder.iterdir())
-
-    # Act and Assert
-    assert all((Size() >= 100).match(f, StatProxy(f)) for f in files)
-    assert any((Size() >= 200).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() >= 300).match(f, StatProxy(f)) for f in files)
-    assert any((Size() >= 200).match(f, StatProxy(f)) for f in files)
-    assert not any((Size() >= 300).match(f, StatProxy(f)) for f in files)
+    # Assert
+    assert batch == [filt.match(f, StatProxy(f)) for f in files]
+    assert batch == [False, True, False]
@@ -1,6 +1,8 @@
 """Extra tests for Size filter: errors and operator overloads."""
 
+import operator
 import pathlib
+from typing import Callable
 
 from pathql.filters.stat_proxy import StatProxy
 
@@ -9,46 +11,58 @@ import pytest
 from pathql.filters.size import Size
 
 
-def make_file(tmp_path: pathlib.Path, size: int = 1) -> pathlib.Path:
-    """Create a file with the specified size in bytes."""
-    file = tmp_path / "a_file.txt"
-    file.write_bytes(b"x" * size)
-    return file
-
-
-def test_size_basic(tmp_path: pathlib.Path) -> None:
+def test_size_basic(sized_file: Callable[[int], pathlib.Path]) -> None:
     """Basic Size filter logic is correct."""
     # Arrange
-    file = make_file(tmp_path, 100)
+    file = sized_file(100)
 
     # Act and Assert
-    assert Size(lambda x, y: x == y, 100).match(file, StatProxy(file))
-    assert Size(lambda x, y: x < y, 200).match(file, StatProxy(file))
-    assert not Size(lambda x, y: x > y, 200).match(file, StatProxy(file))
+    assert Size(operator.eq, 100).match(file, StatProxy(file))
+    assert Size(operator.lt, 200).match(file, StatProxy(file))
+    assert not Size(operator.gt, 200).match(file, StatProxy(file))
 
 
 def test_size_error() -> None:
     """Size filter handles stat errors and missing value types gracefully."""
     # Act and Assert
     path = pathlib.Path("a_file.txt")
-    assert Size(lambda x, y: x < y, 1).match(path, StatProxy(path)) is False
+    assert Size(operator.lt, 1).match(path, StatProxy(path)) is False
     with pytest.raises(TypeError):
         Size().match(path, StatProxy(path))
 
 
-def test_size_operator_overloads(tmp_path: pathlib.Path) -> None:
-    """Operator overloads produce expected filters and comparisons."""
+# Operators are applied to one shared Size() instance; each returns a new filter.
+_SIZE = Size()
+
+
+@pytest.mark.parametrize(
+    "op, rhs, expected",
+    [
+        (operator.le, 100, True),
+        (operator.lt, 1000, True),
+        (operator.ge, 10, True),
+        (operator.gt, 1, True),
+        (operator.eq, 50, True),
+        (operator.ne, 51, True),
+        (operator.lt, 50, False),
+        (operator.gt, 50, False),
+        (operator.eq, 51, False),
+        (operator.ne, 50, False),
+    ],
+)
+def test_size_operator_overloads(
+    sized_file: Callable[[int], pathlib.Path],
+    op: Callable[[Size, int], Size],
+    rhs: int,
+    expected: bool,
+) -> None:
+    """Operator overloads build Size filters that compare a 50-byte file as expected."""
     # Arrange
-    file = make_file(tmp_path, 50)
+    file = sized_file(50)
 
-    # Act and Assert
-    assert Size() <= 100
-    assert Size() < 1000
-    assert Size() >= 10
-    assert Size() > 1
-    assert Size() == 50
-    assert Size() != 51
-    assert Size(lambda x, y: x == y, 50).match(file, StatProxy(file))
-    assert Size() == 50
-    assert Size() != 51
-    assert Size(lambda x, y: x == y, 50).match(file, StatProxy(file))
+    # Act
+    flt = op(_SIZE, rhs)
+
+    # Assert
+    assert isinstance(flt, Size)
+    assert flt.match(file, StatProxy(file)) is expected
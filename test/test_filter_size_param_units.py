@@ -4,45 +4,74 @@ This checks SI (1000**n) and IEC (1024**n) units across a range of magnitudes an
 verifies both integer and decimal inputs behave as expected.
 """
 
+import os
 import pathlib
+from typing import Callable
 
 import pytest
 
-from pathql.filters.size import Size, parse_size
-from pathql.query import StatProxy
+from pathql.filters.size import Size, _parse_size_str, parse_size
+from pathql.filters.stat_proxy import StatProxy
+
+
+class _SizeStatProxy:
+    """StatProxy stand-in reporting a given st_size, so no file of that size is needed."""
+
+    def __init__(self, size: int) -> None:
+        self._stat = os.stat_result((0, 0, 0, 0, 0, 0, size, 0, 0, 0))
+
+    def stat(self) -> os.stat_result:
+        """Return the fixed stat result."""
+        return self._stat
+
+
+_DUMMY_PATH = pathlib.Path("dummy.bin")
 
 SIZES = [
     # (string form, numeric bytes)
     ("b", 1),
     ("kb", 1000),
     ("mb", 1000**2),
+    ("gb", 1000**3),
+    ("eb", 1000**6),
     ("KiB", 1024),
     ("MiB", 1024**2),
+    ("GiB", 1024**3),
+    ("EiB", 1024**6),
 ]
 
 
 @pytest.mark.parametrize("unit,multiplier", SIZES)
-def test_numeric_and_string_equivalents(
-    tmp_path: pathlib.Path, unit: str, multiplier: int
-) -> None:
-    """Verify that numeric and string size representations are equivalent for Size filter."""
+def test_numeric_and_string_equivalents(unit: str, multiplier: int) -> None:
+    """Verify that numeric and canonical string size operands are equivalent for Size filter."""
     # integer equality: 1 <unit> == multiplier bytes
-    p = tmp_path / f"one_{unit}.bin"
-    p.write_bytes(b"x" * multiplier)
+    proxy = _SizeStatProxy(multiplier)
 
     # Numeric operand
+    assert (Size() == multiplier).match(_DUMMY_PATH, proxy)
 
-    # String operand, various casings and whitespace
-    assert (Size() == f"1 {unit}").match(p, StatProxy(p))
+    # String operand
+    assert (Size() == f"1 {unit}").match(_DUMMY_PATH, proxy)
 
-    assert (Size() == f"1{unit}").match(p, StatProxy(p))
-    assert (Size() == f"1 {unit.lower()}").match(p, StatProxy(p))
 
+@pytest.mark.parametrize("unit", [unit for unit, _ in SIZES])
+def test_parse_size_spacing_and_casing(unit: str) -> None:
+    """Whitespace and unit casing do not change the parsed size."""
+    # Act
+    canonical = parse_size(f"1 {unit}")
 
-def test_large_unit_ranges(tmp_path: pathlib.Path):
-    """Create a 1MB file and verify that larger unit filters (GB, TB, PB, etc.) are correct."""
-    p = tmp_path / "one_mb.bin"
-    p.write_bytes(b"x" * 1000**2)
+    # Assert
+    assert parse_size(f"1{unit}") == canonical
+    assert parse_size(f"1 {unit.lower()}") == canonical
+    assert parse_size(f"1 {unit.upper()}") == canonical
+
+
+def test_large_unit_ranges(sized_file: Callable[[int], pathlib.Path]) -> None:
+    """
+    Create a 1MB file and verify that larger unit filters (GB, TB, PB, etc.) are correct.
+    This one uses a real file, as an end-to-end check of the injected-stat cases above.
+    """
+    p = sized_file(1000**2)
 
     # Should be less than 1GB, 1TB, 1PB, etc.
     assert (Size() < "1 GB").match(p, StatProxy(p))
@@ -60,15 +89,29 @@ def test_large_unit_ranges(tmp_path: pathlib.Path):
 
 
 @pytest.mark.parametrize("unit,multiplier", SIZES)
-def test_decimal_string_values_truncate(
-    tmp_path: pathlib.Path, unit: str, multiplier: int
-) -> None:
-    # Create a file of size int(1.5 * multiplier)
+def test_decimal_string_values_truncate(unit: str, multiplier: int) -> None:
+    # A file of size int(1.5 * multiplier)
     size = int(1.5 * multiplier)
-    p = tmp_path / f"one_half_{unit}.bin"
-    p.write_bytes(b"x" * size)
+    proxy = _SizeStatProxy(size)
 
     # '1.5 <unit>' should truncate to int(1.5 * multiplier)
-    assert (Size() == "1.5 " + unit).match(p, StatProxy(p))
+    assert (Size() == "1.5 " + unit).match(_DUMMY_PATH, proxy)
     # parse_size should produce the same numeric value
     assert parse_size("1.5 " + unit) == size
+
+
+def test_parse_size_reuses_parsed_strings() -> None:
+    """Repeated size strings are parsed once; bad strings still raise every time."""
+    # Arrange
+    _parse_size_str.cache_clear()
+
+    # Act
+    values = [parse_size("1.5 MiB") for _ in range(3)]
+    info = _parse_size_str.cache_info()
+
+    # Assert
+    assert values == [int(1.5 * 1024**2)] * 3
+    assert (info.misses, info.hits) == (1, 2)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_size("1.5 XB")
@@ -8,6 +8,7 @@ import pathlib
 import pytest
 
 from pathql.filters.size import Size, parse_size
+from pathql.filters.stat_proxy import StatProxy
 
 
 @pytest.mark.parametrize(
@@ -124,8 +125,6 @@ def test_size_operator_with_various_units(
     result_filter = getattr(s, op)(operand)
 
     # Assert
-    from pathql.filters.stat_proxy import StatProxy
-
     assert result_filter.match(f, StatProxy(f)) is expected
 
 
@@ -135,7 +134,5 @@ def test_size_operator_notimplemented_for_other_types() -> None:
     s = Size()
 
     # Act & Assert
-    import pytest
-
     with pytest.raises(TypeError):
         s.__lt__([1, 2, 3])
@@ -3,27 +3,41 @@ the same as numeric operands.
 """
 
 import pathlib
+from typing import Iterator, Sequence
 
 import pytest
 
+from pathql.filters.base import Filter
 from pathql.filters.size import Size, parse_size
 from pathql.filters.stat_proxy import StatProxy
 
 
-def test_size_ops_with_string_operands(size_test_folder: pathlib.Path) -> None:
+def _matches(
+    flt: Filter,
+    files: Sequence[pathlib.Path],
+    proxies: Sequence[StatProxy],
+) -> Iterator[bool]:
+    """Lazily map flt.match over files and their proxies; the caller builds flt once."""
+    return map(flt.match, files, proxies)
+
+
+def test_size_ops_with_string_operands(
+    size_test_files: tuple[pathlib.Path, ...],
+    size_test_proxies: tuple[StatProxy, ...],
+) -> None:
     """Size operators accept string operands and behave like numeric ones."""
     # Arrange
-    files = list(size_test_folder.iterdir())
+    files, proxies = size_test_files, size_test_proxies
 
     # Act / Assert - equality with plain number string and with explicit 'B'.
-    assert any((Size() == "100").match(f, StatProxy(f)) for f in files)
-    assert any((Size() == "200 B").match(f, StatProxy(f)) for f in files)
+    assert any(_matches(Size() == "100", files, proxies))
+    assert any(_matches(Size() == "200 B", files, proxies))
 
     # Act / Assert - inequality and comparisons using string operands
-    assert all((Size() < "300").match(f, StatProxy(f)) for f in files)
-    assert any((Size() <= "100").match(f, StatProxy(f)) for f in files)
-    assert any((Size() >= "200").match(f, StatProxy(f)) for f in files)
-    assert any((Size() > "100").match(f, StatProxy(f)) for f in files)
+    assert all(_matches(Size() < "300", files, proxies))
+    assert any(_matches(Size() <= "100", files, proxies))
+    assert any(_matches(Size() >= "200", files, proxies))
+    assert any(_matches(Size() > "100", files, proxies))
 
 
 def test_size_eq_kib(tmp_path: pathlib.Path) -> None:
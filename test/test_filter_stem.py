@@ -1,27 +1,38 @@
 """Tests for Stem filters (equality, multiple, wildcard, case, and negation)."""
 
 import pathlib
+import re
 from typing import Any, Callable
 
 import pytest
 
 from pathql.filters.stem import Stem
 
+# Paths are immutable; build the ones shared by many cases once.
+FOO_TXT = pathlib.PurePosixPath("foo.txt")
+
 
 @pytest.mark.parametrize(
     "patterns, path, expected",
     [
-        (["foo"], pathlib.Path("foo.txt"), True),
-        (["bar"], pathlib.Path("foo.txt"), False),
-        (["foo", "bar"], pathlib.Path("foo.txt"), True),
-        (["foo", "bar"], pathlib.Path("bar.txt"), True),
-        ("foo", pathlib.Path("foo.txt"), True),
-        ("bar", pathlib.Path("foo.txt"), False),
-        ("foo*", pathlib.Path("foo123.txt"), True),
-        ("bar*", pathlib.Path("foo123.txt"), False),
+        (["foo"], FOO_TXT, True),
+        (["bar"], FOO_TXT, False),
+        (["foo", "bar"], FOO_TXT, True),
+        (["foo", "bar"], pathlib.PurePosixPath("bar.txt"), True),
+        ("foo", FOO_TXT, True),
+        ("bar", FOO_TXT, False),
+        ("foo*", pathlib.PurePosixPath("foo123.txt"), True),
+        ("bar*", pathlib.PurePosixPath("foo123.txt"), False),
+        # Patterns are regexes with '*' as shorthand for '.*', matched against the whole stem
+        ("^g.*", pathlib.PurePosixPath("g50.txt"), True),
+        ("[a-z][a-z][a-z]", pathlib.PurePosixPath("abc.txt"), True),
+        ("fo?", FOO_TXT, False),
+        ("fo+", FOO_TXT, True),
+        ("d", pathlib.PurePosixPath("d30.txt"), False),
+        ("foo.bar", pathlib.PurePosixPath("fooxbar.txt"), True),
     ],
 )
-def test_stem_match_patterns(patterns: Any, path: pathlib.Path, expected: bool):
+def test_stem_match_patterns(patterns: Any, path: pathlib.PurePosixPath, expected: bool):
     """Stem matches patterns, multiple, and wildcards."""
     # Arrange
     stem_filter = Stem(patterns)
@@ -34,13 +45,18 @@ def test_stem_match_patterns(patterns: Any, path: pathlib.Path, expected: bool):
 @pytest.mark.parametrize(
     "pattern, path, ignore_case, expected",
     [
-        ("foo", pathlib.Path("FOO.txt"), False, False),
-        ("foo", pathlib.Path("FOO.txt"), True, True),
-        ("FOO", pathlib.Path("foo.txt"), False, False),
-        ("FOO", pathlib.Path("foo.txt"), True, True),
+        ("foo", pathlib.PurePosixPath("FOO.txt"), False, False),
+        ("foo", pathlib.PurePosixPath("FOO.txt"), True, True),
+        ("FOO", FOO_TXT, False, False),
+        ("FOO", FOO_TXT, True, True),
     ],
 )
-def test_stem_case_sensitivity(pattern: str, path: pathlib.Path, ignore_case: bool, expected: bool):
+def test_stem_case_sensitivity(
+    pattern: str,
+    path: pathlib.PurePosixPath,
+    ignore_case: bool,
+    expected: bool,
+):
     """Stem matches with/without case sensitivity."""
     # Arrange
     stem_filter = Stem(pattern, ignore_case=ignore_case)
@@ -53,13 +69,18 @@ def test_stem_case_sensitivity(pattern: str, path: pathlib.Path, ignore_case: bo
 @pytest.mark.parametrize(
     "negate, pattern, path, expected",
     [
-        (True, "foo", pathlib.Path("foo.txt"), False),
-        (True, "bar", pathlib.Path("foo.txt"), True),
-        (False, "foo", pathlib.Path("foo.txt"), True),
-        (False, "bar", pathlib.Path("foo.txt"), False),
+        (True, "foo", FOO_TXT, False),
+        (True, "bar", FOO_TXT, True),
+        (False, "foo", FOO_TXT, True),
+        (False, "bar", FOO_TXT, False),
     ],
 )
-def test_stem_match_negation(negate: bool, pattern: str, path: pathlib.Path, expected: bool):
+def test_stem_match_negation(
+    negate: bool,
+    pattern: str,
+    path: pathlib.PurePosixPath,
+    expected: bool,
+):
     """Stem negation works with _negate flag."""
     # Arrange
     stem_filter = Stem(pattern)
@@ -74,7 +95,7 @@ def test_stem_match_negation(negate: bool, pattern: str, path: pathlib.Path, exp
 def test_stem_match_no_patterns_raises(patterns:Any):
     """Stem raises ValueError if no patterns are set."""
     # Arrange
-    f = pathlib.Path("foo.txt")
+    f = FOO_TXT
     stem_filter = Stem(patterns)
     # Act & Assert
     with pytest.raises(ValueError):
@@ -121,4 +142,49 @@ def test_stem_unsupported_operators(op: Callable[[Stem], Any], opname: str):
     except NotImplementedError:
         pass
     else:
-        pytest.fail(f"Stem did not raise NotImplementedError for operator '{opname}'")
\ No newline at end of file
+        pytest.fail(f"Stem did not raise NotImplementedError for operator '{opname}'")
+
+def test_stem_reuses_compiled_patterns():
+    """Stem filters with the same patterns share the same compiled regexes."""
+    # Arrange
+    first = Stem(["foo*", "bar?"])
+
+    # Act
+    second = Stem("foo* bar?")
+    other_case = Stem(["foo*", "bar?"], ignore_case=False)
+
+    # Assert
+    assert second._regexes is first._regexes
+    assert other_case._regexes is first._regexes  # case handling lives in match, not the regex
+    foo1 = pathlib.PurePosixPath("FOO1.txt")
+    assert second.match(foo1) and not other_case.match(foo1)
+
+
+@pytest.mark.parametrize(
+    "patterns, name, expected",
+    [
+        (["(x)\\1", "(a)\\1"], "aa.txt", True),
+        (["(x)\\1", "(a)\\1"], "ab.txt", False),
+        ("(?i)foo", "FOO.txt", True),
+        (["(?i)foo", "ba(r)"], "bar.txt", True),
+    ],
+    ids=["backref-second", "backref-miss", "inline-flag", "inline-flag-and-group"],
+)
+def test_stem_patterns_compile_independently(patterns, name: str, expected: bool):
+    """Groups, backreferences and inline flags keep their meaning in each pattern."""
+    # Arrange
+    flt = Stem(patterns, ignore_case=False)
+    path = pathlib.PurePosixPath(name)
+
+    # Act
+    result = flt.match(path)
+
+    # Assert
+    assert result is expected
+
+
+def test_stem_invalid_pattern_raises_at_construction():
+    """An invalid regex raises re.error when the Stem filter is built."""
+    # Act / Assert
+    with pytest.raises(re.error):
+        Stem("foo(")
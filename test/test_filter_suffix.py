@@ -10,72 +10,50 @@ from pathql.filters.stat_proxy import StatProxy
 from pathql.filters.suffix import Ext, Suffix
 
 
-@pytest.mark.parametrize("suffix_class", [Suffix, Ext])
-def test_suffix_eq(suffix_class: Type[Filter]) -> None:
-    """Equality matching for Suffix/Ext filters."""
-    # Arrange
-    f = pathlib.Path("foo.txt")
-
-    # Act and Assert
-    assert suffix_class("txt").match(f, StatProxy(f))
-    assert not suffix_class("md").match(f, StatProxy(f))
-
-
-@pytest.mark.parametrize("suffix_class", [Suffix, Ext])
-def test_suffix_multiple(suffix_class: Type[Filter]) -> None:
-    """Multiple extension matching works for Suffix/Ext."""
-    # Arrange
-    f1 = pathlib.Path("foo.txt")
-    f2 = pathlib.Path("bar.md")
-    suffix_filter = suffix_class(["txt", "md"])
-
-    # Act and Assert
-    assert suffix_filter.match(f1, StatProxy(f1))
-    assert suffix_filter.match(f2, StatProxy(f2))
-
-
-@pytest.mark.parametrize("suffix_class", [Suffix, Ext])
-def test_suffix_case_insensitive(suffix_class: Type[Filter]) -> None:
-    """Suffix and Ext are case-insensitive by default."""
-    # Arrange
-    f = pathlib.Path("foo.TXT")
-
-    # Act and Assert
-    assert suffix_class("txt").match(f, StatProxy(f))
-    assert suffix_class("TXT").match(f, StatProxy(f))
-
-
-@pytest.mark.parametrize("suffix_class", [Suffix, Ext])
-def test_suffix_no_extension(suffix_class: Type[Filter]) -> None:
-    """No extension file does not match suffix filters."""
-    # Arrange
-    f = pathlib.Path("foo")
-
-    # Act and Assert
-    assert not suffix_class("txt").match(f, StatProxy(f))
-
-
-@pytest.mark.parametrize("suffix_class", [Suffix, Ext])
-def test_suffix_whitespace_split(suffix_class: Type[Filter]) -> None:
-    """Whitespace-separated patterns match multiple extensions."""
-    # Arrange
-    f1 = pathlib.Path("foo.txt")
-    f2 = pathlib.Path("bar.bmp")
-    suffix_filter = suffix_class("txt bmp")
-
-    # Act and Assert
-    assert suffix_filter.match(f1, StatProxy(f1))
-    assert suffix_filter.match(f2, StatProxy(f2))
-    assert not suffix_filter.match(
-        pathlib.Path("baz.md"), StatProxy(pathlib.Path("baz.md"))
+# (pattern, file name, expected); run against both Suffix and Ext.
+_SUFFIX_CASES = [
+    ("txt", "foo.txt", True),
+    ("md", "foo.txt", False),
+    (["txt", "md"], "foo.txt", True),
+    (["txt", "md"], "bar.md", True),
+    ("txt", "foo.TXT", True),
+    ("TXT", "foo.TXT", True),
+    ("txt", "foo", False),
+    ("txt bmp", "foo.txt", True),
+    ("txt bmp", "bar.bmp", True),
+    ("txt bmp", "baz.md", False),
+]
+
+SUFFIX_CASES = [
+    pytest.param(
+        cls,
+        pathlib.PurePosixPath(name),
+        pattern,
+        expected,
+        id=f"{cls.__name__}-{pattern}-{name}",
     )
+    for cls in (Suffix, Ext)
+    for pattern, name, expected in _SUFFIX_CASES
+]
+
+
+@pytest.mark.parametrize("suffix_class,path,pattern,expected", SUFFIX_CASES)
+def test_suffix_matrix(
+    suffix_class: Type[Filter],
+    path: pathlib.PurePosixPath,
+    pattern: str | list[str],
+    expected: bool,
+) -> None:
+    """Equality, list, case-insensitive, no-extension and whitespace-split matching."""
+    # Act and Assert
+    assert suffix_class(pattern).match(path) is expected
 
 
 @pytest.mark.parametrize("suffix_class", [Suffix, Ext])
 def test_suffix_nosplit(suffix_class: Type[Filter]) -> None:
     """Nosplit matches exact multi-word suffixes only when nosplit=True."""
     # Arrange
-    f = pathlib.Path("foo.txt bmp")
+    f = pathlib.PurePosixPath("foo.txt bmp")
     suffix_filter = suffix_class("txt bmp", nosplit=True)
     suffix_filter2 = suffix_class("txt bmp")
 
@@ -88,8 +66,8 @@ def test_suffix_nosplit(suffix_class: Type[Filter]) -> None:
 def test_suffix_dot_prefix_equivalence(suffix_class: Type[Suffix | Ext]) -> None:
     """Dot-prefixed and non-prefixed extensions are equivalent."""
     # Arrange
-    f = pathlib.Path("image.jpg")
-    f_upper = pathlib.Path("image.JPG")
+    f = pathlib.PurePosixPath("image.jpg")
+    f_upper = pathlib.PurePosixPath("image.JPG")
 
     # Act & Assert
     assert suffix_class("jpg").match(f, StatProxy(f))
@@ -113,23 +91,21 @@ def test_suffix_dot_prefix_equivalence(suffix_class: Type[Suffix | Ext]) -> None
 def test_suffix_multi_part_extensions(suffix_class) -> None:
     """Multi-part extension matching behaves as expected for Suffix/Ext."""
     # Arrange
-    f1 = pathlib.Path("archive.tar.gz")
-    f2 = pathlib.Path("image.tif.back")
-    f3 = pathlib.Path("foo.txt.back")
-    f4 = pathlib.Path("foo.back")
-    f5 = pathlib.Path("foo.tif")
-    f6 = pathlib.Path("foo.tar.zip")
+    f1 = pathlib.PurePosixPath("archive.tar.gz")
+    f2 = pathlib.PurePosixPath("image.tif.back")
+    f3 = pathlib.PurePosixPath("foo.txt.back")
+    f4 = pathlib.PurePosixPath("foo.back")
+    f5 = pathlib.PurePosixPath("foo.tif")
+    f6 = pathlib.PurePosixPath("foo.tar.zip")
+    f7 = pathlib.PurePosixPath("foo.bar.tar.gz")
+    f8 = pathlib.PurePosixPath("foo.tif.back")
 
     # Act & Assert
     assert suffix_class(".tar.gz").match(f1, StatProxy(f1))
     assert not suffix_class(".tar.gz").match(f2, StatProxy(f2))
-    assert suffix_class(".tar.gz").match(
-        pathlib.Path("foo.bar.tar.gz"), StatProxy(pathlib.Path("foo.bar.tar.gz"))
-    )
+    assert suffix_class(".tar.gz").match(f7, StatProxy(f7))
     assert suffix_class(".tif.back").match(f2, StatProxy(f2))
-    assert suffix_class(".tif.back").match(
-        pathlib.Path("foo.tif.back"), StatProxy(pathlib.Path("foo.tif.back"))
-    )
+    assert suffix_class(".tif.back").match(f8, StatProxy(f8))
     assert suffix_class(".txt.back").match(f3, StatProxy(f3))
     assert suffix_class(".back").match(f4, StatProxy(f4))
     assert suffix_class(".back").match(f2, StatProxy(f2))
@@ -140,23 +116,23 @@ def test_suffix_multi_part_extensions(suffix_class) -> None:
     assert not suffix_class(".tar.zip").match(f2, StatProxy(f2))
 
 def test_suffix_eq_new_style():
-    f_txt = pathlib.Path("foo.txt")
-    f_md = pathlib.Path("bar.md")
+    f_txt = pathlib.PurePosixPath("foo.txt")
+    f_md = pathlib.PurePosixPath("bar.md")
     assert (Suffix() == "txt").match(f_txt)
     assert not (Suffix() == "txt").match(f_md)
     assert (Suffix() == ["txt", "md"]).match(f_md)
     assert (Suffix() == ["txt", "md"]).match(f_txt)
 
 def test_suffix_ne_new_style():
-    f_log = pathlib.Path("baz.log")
-    f_txt = pathlib.Path("qux.txt")
+    f_log = pathlib.PurePosixPath("baz.log")
+    f_txt = pathlib.PurePosixPath("qux.txt")
     assert not (Suffix() != "log").match(f_log)
     assert (Suffix() != "log").match(f_txt)
 
 def test_suffix_eq_brace_expansion_new_style():
-    f_foo = pathlib.Path("a.foo")
-    f_fum = pathlib.Path("b.fum")
-    f_bar = pathlib.Path("c.bar")
+    f_foo = pathlib.PurePosixPath("a.foo")
+    f_fum = pathlib.PurePosixPath("b.fum")
+    f_bar = pathlib.PurePosixPath("c.bar")
     suffix_filter = Suffix() == "{foo,fum}"
     assert suffix_filter.match(f_foo)
     assert suffix_filter.match(f_fum)
@@ -177,8 +153,8 @@ def test_suffix_unsupported_operators(op):
 def test_suffix_eq_new_style() -> None:
     """Test Suffix() == ... matches file extensions."""
     # Arrange
-    f_txt = pathlib.Path("foo.txt")
-    f_md = pathlib.Path("bar.md")
+    f_txt = pathlib.PurePosixPath("foo.txt")
+    f_md = pathlib.PurePosixPath("bar.md")
     # Act & Assert
     assert (Suffix() == "txt").match(f_txt)
     assert not (Suffix() == "txt").match(f_md)
@@ -188,8 +164,8 @@ def test_suffix_eq_new_style() -> None:
 def test_suffix_ne_new_style() -> None:
     """Test Suffix() != ... negates file extension matching."""
     # Arrange
-    f_log = pathlib.Path("baz.log")
-    f_txt = pathlib.Path("qux.txt")
+    f_log = pathlib.PurePosixPath("baz.log")
+    f_txt = pathlib.PurePosixPath("qux.txt")
     # Act & Assert
     assert not (Suffix() != "log").match(f_log)
     assert (Suffix() != "log").match(f_txt)
@@ -197,9 +173,9 @@ def test_suffix_ne_new_style() -> None:
 def test_suffix_eq_brace_expansion_new_style() -> None:
     """Test Suffix() == '{foo,fum}' supports brace expansion."""
     # Arrange
-    f_foo = pathlib.Path("a.foo")
-    f_fum = pathlib.Path("b.fum")
-    f_bar = pathlib.Path("c.bar")
+    f_foo = pathlib.PurePosixPath("a.foo")
+    f_fum = pathlib.PurePosixPath("b.fum")
+    f_bar = pathlib.PurePosixPath("c.bar")
     # Act
     suffix_filter = Suffix() == "{foo,fum}"
     # Assert
@@ -220,4 +196,60 @@ def test_suffix_other_unsupported_operators(op: Callable[[Suffix], object]) -> N
     """Test Suffix raises for other unsupported operators."""
     s = Suffix()
     with pytest.raises(NotImplementedError):
-        op(s)
\ No newline at end of file
+        op(s)
+
+@pytest.mark.parametrize(
+    "flt",
+    [
+        Suffix("txt"),
+        Suffix() != "txt",
+        Suffix(["tar.gz", "LOG"]),
+        Suffix("TXT", ignore_case=False),
+        Suffix("txt md py c h log"),
+        Suffix() != "txt md py c h log",
+        Suffix("txt md py c h tar.gz"),
+    ],
+    ids=["eq", "ne", "multi", "case-sensitive", "set", "set-ne", "set-multipart"],
+)
+def test_suffix_match_batch_matches_match(flt: Suffix) -> None:
+    """The batch evaluation Query uses agrees with Suffix.match, name by name."""
+    # Arrange
+    names = ["a.txt", "a.TXT", "a.tar.gz", "a.gz", "b.log", "txt", "a.txt.bak", ".h", "x.c"]
+    paths = [pathlib.PurePosixPath(name) for name in names]
+
+    # Act
+    batch = flt.match_batch(paths, [None] * len(paths))
+
+    # Assert
+    assert batch == [flt.match(path) for path in paths]
+
+
+def test_suffix_uses_set_lookup_only_for_single_dot_suffixes() -> None:
+    """Large single-dot suffix lists use the set lookup; multi-part ones keep endswith."""
+    # Arrange
+    single = Suffix("txt md py c h log")
+    multipart = Suffix("txt md py c h tar.gz")
+
+    # Act and Assert
+    assert single._suffix_set == frozenset({".txt", ".md", ".py", ".c", ".h", ".log"})
+    assert multipart._suffix_set is None
+    assert multipart.match(pathlib.PurePosixPath("a.tar.gz"))
+    assert single.match(pathlib.PurePosixPath("A.LOG"))
+    assert not single.match(pathlib.PurePosixPath("a.log.bak"))
+
+
+def test_equal_suffix_filters_share_suffix_tuple() -> None:
+    """Suffix filters built from the same patterns share one interned suffix tuple."""
+    # Arrange
+    first = Suffix("txt log")
+
+    # Act
+    second = Suffix() == ["txt", "log"]
+    negated = Suffix() != "txt log"
+
+    # Assert
+    assert second._suffixes is first._suffixes
+    assert negated._suffixes is first._suffixes
+    assert first is not second
+    md = pathlib.PurePosixPath("a.md")
+    assert negated.match(md) and not second.match(md)
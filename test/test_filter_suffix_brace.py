@@ -1,17 +1,17 @@
 import pathlib
 
 from pathql.filters.suffix import Suffix
-from pathql.query import StatProxy
+from pathql.filters.stat_proxy import StatProxy
 
 
 def test_suffix_brace_ignores_empty_entry(tmp_path: pathlib.Path) -> None:
     """Brace expansion should ignore empty entries like '{foo,,fum}'."""
     f1 = tmp_path / "a.foo"
-    f1.write_text("x")
+    f1.touch()
     f2 = tmp_path / "b.fum"
-    f2.write_text("x")
+    f2.touch()
     f3 = tmp_path / "c."  # would match empty extension if allowed
-    f3.write_text("x")
+    f3.touch()
 
     s = Suffix("{foo,,fum}")
 
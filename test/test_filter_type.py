@@ -1,73 +1,200 @@
 """Tests for Type filter: file, directory, and symlink detection."""
 
+import os
 import pathlib
 import sys
+from typing import Callable
 
 import pytest
 
 from pathql.filters.file_type import FileType
 from pathql.filters.stat_proxy import StatProxy
+from pathql.filters.stat_proxy_guard import StatProxyGuard
+
+_WIN = sys.platform.startswith("win")
+skip_on_windows = pytest.mark.skipif(_WIN, reason="Symlink tests are skipped on Windows.")
+
+# Filters are immutable, so the ones reused below are built once at import.
+FILE_FILTER = FileType().file
+DIRECTORY_FILTER = FileType().directory
+LINK_FILTER = FileType().link
+UNKNOWN_FILTER = FileType().unknown
+
+
+@pytest.fixture(scope="module")
+def type_tree(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """Read-only folder with a.txt and dir/, created once for this module."""
+    root = tmp_path_factory.mktemp("type_tree")
+    (root / "a.txt").touch()
+    os.mkdir(root / "dir")
+    return root
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [lambda: FileType().file, lambda: FileType(FileType.FILE), lambda: FileType("file")],
+    ids=["property", "constant", "string"],
+)
+def test_type_file(type_tree: pathlib.Path, builder: Callable[[], FileType]) -> None:
+    """Type.FILE matches a regular file and not a directory."""
+    # Arrange
+    f = type_tree / "a.txt"
+    d = type_tree / "dir"
 
+    # Act and Assert
+    assert builder().match(f, StatProxy(f))
+    assert not builder().match(d, StatProxy(d))
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        lambda: FileType().directory,
+        lambda: FileType(FileType.DIRECTORY),
+        lambda: FileType("directory"),
+    ],
+    ids=["property", "constant", "string"],
+)
+def test_type_directory(type_tree: pathlib.Path, builder: Callable[[], FileType]) -> None:
+    """Type.DIRECTORY matches a directory and not a regular file."""
+    # Arrange
+    d = type_tree / "dir"
+    f = type_tree / "a.txt"
 
-def test_type_file(tmp_path: pathlib.Path) -> None:
-    """Type.FILE matches a regular file."""
+    # Act and Assert
+    assert builder().match(d, StatProxy(d))
+    assert not builder().match(f, StatProxy(f))
+
+
+@pytest.fixture(scope="module")
+def link_env(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """
+    Read-only folder with foo.txt, foo_link.txt -> foo.txt and a broken_link.
+
+    Only requested by skip_on_windows tests, so it is never built on Windows.
+    """
+    root = tmp_path_factory.mktemp("links")
+    (root / "foo.txt").touch()
+    os.symlink(root / "foo.txt", root / "foo_link.txt")
+    os.symlink(root / "does_not_exist.txt", root / "broken_link")
+    return root
+
+
+@skip_on_windows
+@pytest.mark.parametrize(
+    "builder",
+    [lambda: FileType().link, lambda: FileType(FileType.LINK), lambda: FileType("link")],
+    ids=["property", "constant", "string"],
+)
+def test_type_link(link_env: pathlib.Path, builder: Callable[[], FileType]) -> None:
+    """Type.LINK matches symlinks and not their regular-file targets."""
     # Arrange
-    f = tmp_path / "a.txt"
-    f.write_text("A")
+    link = link_env / "foo_link.txt"
+    target = link_env / "foo.txt"
 
     # Act and Assert
-    assert (FileType().file).match(f, StatProxy(f))
+    assert builder().match(link, StatProxy(link))
+    assert not builder().match(target, StatProxy(target))
+    assert not FILE_FILTER.match(link, StatProxy(link))
 
 
-def test_type_directory(tmp_path: pathlib.Path) -> None:
-    """Type.DIRECTORY matches a directory."""
+@skip_on_windows
+def test_type_broken_link(link_env: pathlib.Path) -> None:
+    """A dangling symlink is a link of unknown target type, not a file or directory."""
     # Arrange
-    d = tmp_path / "dir"
-    d.mkdir()
+    broken = link_env / "broken_link"
 
     # Act and Assert
-    assert (FileType().directory).match(d, StatProxy(d))
+    assert LINK_FILTER.match(broken, StatProxy(broken))
+    assert UNKNOWN_FILTER.match(broken, StatProxy(broken))
+    assert not FILE_FILTER.match(broken, StatProxy(broken))
+    assert not DIRECTORY_FILTER.match(broken, StatProxy(broken))
 
 
-def test_type_link(tmp_path: pathlib.Path) -> None:
-    """Type.LINK matches symlinks and not files or directories."""
+@skip_on_windows
+def test_type_link_with_stat_guard(link_env: pathlib.Path) -> None:
+    """A StatProxyGuard (no dirent, no stat) still answers the link check from the path."""
     # Arrange
-    if sys.platform.startswith("win"):
-        pytest.skip("Symlink tests are skipped on Windows.")
-    f = tmp_path / "foo.txt"
-    f.write_text("hello")
-    link = tmp_path / "foo_link.txt"
-    link.symlink_to(f)
+    link, target = link_env / "foo_link.txt", link_env / "foo.txt"
 
     # Act and Assert
-    assert (FileType().link).match(link, StatProxy(link))
-    assert not (FileType().file).match(link, StatProxy(link))
+    assert LINK_FILTER.match(link, StatProxyGuard(link))
+    assert not LINK_FILTER.match(target, StatProxyGuard(target))
+    with pytest.raises(RuntimeError):
+        FILE_FILTER.match(target, StatProxyGuard(target))  # stat() use is reported, not hidden
 
 
-def test_type_no_type_name_raises(tmp_path:pathlib.Path):
+def test_type_no_type_name_raises(type_tree: pathlib.Path):
     """Type filter with no type_name should not match anything and should not raise."""
-    f = tmp_path / "foo.txt"
-    f.write_text("x")
+    f = type_tree / "a.txt"
     t = FileType()
     # Should always return False for any file type
     assert not t.match(f, StatProxy(f))
-    assert not t.match(tmp_path, StatProxy(tmp_path))
+    assert not t.match(type_tree, StatProxy(type_tree))
 
 
-def test_type_invalid_type_name(tmp_path:pathlib.Path):
+def test_type_invalid_type_name(type_tree: pathlib.Path):
     """Type filter with an invalid type_name should never match and should not raise."""
-    f = tmp_path / "foo.txt"
-    f.write_text("x")
+    f = type_tree / "a.txt"
     t = FileType("not_a_type")
     # Should always return False for any file type
     assert not t.match(f, StatProxy(f))
-    assert not t.match(tmp_path, StatProxy(tmp_path))
+    assert not t.match(type_tree, StatProxy(type_tree))
 
 
 def test_type_unknown_on_missing_file(tmp_path:pathlib.Path):
     """Type().unknown should match missing files, others should not."""
     missing:pathlib.Path = tmp_path / "does_not_exist.txt"
-    assert FileType().unknown.match(missing, StatProxy(missing))
-    assert not FileType().file.match(missing, StatProxy(missing))
-    assert not FileType().directory.match(missing, StatProxy(missing))
-    assert not FileType().link.match(missing, StatProxy(missing))
+    assert UNKNOWN_FILTER.match(missing, StatProxy(missing))
+    assert not FILE_FILTER.match(missing, StatProxy(missing))
+    assert not DIRECTORY_FILTER.match(missing, StatProxy(missing))
+    assert not LINK_FILTER.match(missing, StatProxy(missing))
+
+
+@skip_on_windows
+def test_type_uses_dirent(tmp_path: pathlib.Path) -> None:
+    """FileType agrees with the path-based checks when given a scandir DirEntry."""
+    # Arrange
+    (tmp_path / "a.txt").touch()
+    os.mkdir(tmp_path / "dir")
+    os.symlink(tmp_path / "a.txt", tmp_path / "link.txt")
+    os.symlink(tmp_path / "missing", tmp_path / "broken")
+    os.symlink(tmp_path / "dir", tmp_path / "dirlink")
+    kinds = [FILE_FILTER, DIRECTORY_FILTER, LINK_FILTER, UNKNOWN_FILTER]
+
+    # Act
+    with_entry = {}
+    without_entry = {}
+    for entry in os.scandir(tmp_path):
+        path = pathlib.Path(entry.path)
+        with_entry[entry.name] = [k.match(path, StatProxy(path, entry)) for k in kinds]
+        without_entry[entry.name] = [k.match(path, StatProxy(path)) for k in kinds]
+
+    # Assert
+    assert with_entry == without_entry
+    assert with_entry == {
+        "a.txt": [True, False, False, False],
+        "dir": [False, True, False, False],
+        "link.txt": [False, False, True, False],
+        "broken": [False, False, True, True],
+        "dirlink": [False, True, True, False],
+    }
+
+
+def test_type_file_and_directory_skip_stat_with_dirent(tmp_path: pathlib.Path) -> None:
+    """FileType().file/.directory answer from the DirEntry without calling stat()."""
+    # Arrange
+    (tmp_path / "a.txt").touch()
+    os.mkdir(tmp_path / "dir")
+    proxies = [
+        StatProxy(pathlib.Path(entry.path), entry) for entry in os.scandir(tmp_path)
+    ]
+
+    # Act
+    files = {sp.path.name for sp in proxies if FILE_FILTER.match(sp.path, sp)}
+    dirs = {sp.path.name for sp in proxies if DIRECTORY_FILTER.match(sp.path, sp)}
+
+    # Assert
+    assert files == {"a.txt"}
+    assert dirs == {"dir"}
+    assert all(sp.stat_calls == 0 for sp in proxies)
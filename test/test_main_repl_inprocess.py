@@ -14,7 +14,8 @@ from unittest.mock import patch
 import pytest
 from _pytest.capture import CaptureFixture
 
-from pathql.__main__ import main
+from pathql import File, Query
+from pathql.__main__ import _use_threads, main
 
 
 @pytest.fixture
@@ -87,3 +88,70 @@ def test_main_repl_inprocess_cli(
     }
     assert found == expected
     assert "PathQL v" in captured.out
+
+
+def test_main_recursive_wide_tree(
+    tmp_path: pathlib.Path,
+    capsys: CaptureFixture[str],
+) -> None:
+    """Recursive CLI search over many subdirectories (parallel walk) prints the serial order."""
+    # Arrange
+    expected = {"top.txt"}
+    for i in range(6):
+        sub = tmp_path / f"d{i}" / "nested"
+        sub.mkdir(parents=True)
+        (sub / f"f{i}.txt").write_text("x")
+        (sub / f"f{i}.md").write_text("x")
+        expected.add(f"f{i}.txt")
+    (tmp_path / "top.txt").write_text("x")
+    with patch.object(sys, "argv", ["pathql", "*.txt", "-r"]):
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
+            serial = [str(p) for p in Query(where_expr=File("*.txt")).files(pathlib.Path("."))]
+
+            # Act
+            main()
+        finally:
+            os.chdir(old_cwd)
+
+    # Assert
+    captured = capsys.readouterr()
+    lines = [
+        line for line in captured.out.strip().splitlines() if not line.startswith("PathQL")
+    ]
+    assert {pathlib.Path(line).name for line in lines} == expected
+    assert len(lines) == len(expected)
+    assert lines == serial
+
+
+@pytest.mark.parametrize(
+    "subdirs, recursive, expected",
+    [(0, True, False), (3, True, False), (4, True, True), (6, False, False)],
+    ids=["flat", "narrow", "wide", "not-recursive"],
+)
+def test_main_threads_only_wide_recursive_trees(
+    tmp_path: pathlib.Path,
+    subdirs: int,
+    recursive: bool,
+    expected: bool,
+) -> None:
+    """The CLI walks small or non-recursive searches serially and wide trees threaded."""
+    # Arrange
+    for i in range(subdirs):
+        (tmp_path / f"d{i}").mkdir()
+
+    # Act
+    actual = _use_threads(tmp_path, recursive)
+
+    # Assert
+    assert actual is expected
+
+
+def test_main_unreadable_root_walks_serially(tmp_path: pathlib.Path) -> None:
+    """A start directory that cannot be listed is walked serially instead of raising."""
+    # Act
+    actual = _use_threads(tmp_path / "missing", True)
+
+    # Assert
+    assert actual is False
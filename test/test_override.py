@@ -18,6 +18,8 @@ from pathql.filters.base import Filter
 class JsonKeyValueFilter(Filter):
     """Filter that matches a specific key/value pair in a JSON file."""
 
+    cost = 100  # Opens and parses the file; All(..., by_cost=True) runs it last.
+
     def __init__(self, key: str, value: str):
         self.key: str = key
         self.value: str = value
@@ -30,8 +32,8 @@ class JsonKeyValueFilter(Filter):
     ) -> bool:
         # Ignore stat_result, only use path and key/value
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data: dict[str, str] = json.load(f)
+            # json.loads decodes the bytes itself, so no text-mode file wrapper is needed.
+            data: dict[str, str] = json.loads(path.read_bytes())
             return data.get(self.key) == self.value
         except (IOError, PermissionError, json.JSONDecodeError):
             return False
@@ -53,6 +55,9 @@ class JsonKeyValueFilter(Filter):
             False,
         ),  # fail match different
         (None, "Error", "File does not exist", False),  # fail file not found
+        ({"Other": "File does not exist"}, "Error", "File does not exist", False),  # no key
+        ("", "Error", "File does not exist", False),  # empty file
+        ({"café": "x"}, "café", "x", True),  # key written \u-escaped (ensure_ascii)
     ],
 )
 def test_json_key_value_filter_param(
@@ -64,7 +69,9 @@ def test_json_key_value_filter_param(
 ):
     # Arrange
     p = tmp_path / "sample.json"
-    if json_content is not None:
+    if json_content == "":
+        p.write_bytes(b"")
+    elif json_content is not None:
         p.write_text(json.dumps(json_content))
     else:
         # Do not create the file for file not found case
@@ -76,3 +83,16 @@ def test_json_key_value_filter_param(
 
     # Assert
     assert actual_result is expected_result
+
+
+def test_json_key_value_filter_escaped_key(tmp_path: pathlib.Path):
+    """A key spelled with a JSON escape in the file still matches its decoded form."""
+    # Arrange
+    p = tmp_path / "escaped.json"
+    p.write_text('{"a\\/b": "y"}', encoding="utf-8")
+
+    # Act
+    actual_result = JsonKeyValueFilter("a/b", "y").match(p)
+
+    # Assert
+    assert actual_result is True
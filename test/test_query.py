@@ -5,7 +5,6 @@ including support for single path, list, pathlib.Path, and glob patterns.
 """
 
 import pathlib
-import shutil
 
 import pytest
 
@@ -21,8 +20,8 @@ def test_query_select_list_of_paths(mini_fs: pathlib.Path) -> None:
     subdir = mini_fs / "subdir"
     paths = [mini_fs, subdir]
     q = Query(where_expr=Suffix(".txt"))
-    files = sorted([p.name for p in q.select(paths)])
-    assert set(files) == {"foo.txt", "baz.txt", "qux.txt"}
+    files = {p.name for p in q.select(paths)}
+    assert files == {"foo.txt", "baz.txt", "qux.txt"}
 
 
 def test_query_files_subdir(mini_fs: pathlib.Path) -> None:
@@ -41,36 +40,6 @@ def test_query_select_subdir(mini_fs: pathlib.Path) -> None:
     assert files == ["qux.txt"]
 
 
-@pytest.fixture(name="hundred_files")
-def _hundred_files(tmp_path: pathlib.Path):  # pyright: ignore[reportUnusedFunction]
-    """Create a temp folder with 100 files for benchmarking/concurrency tests."""
-    # Arrange
-    folder = tmp_path / "hundred_files"
-    folder.mkdir()
-    for i in range(100):
-        (folder / f"file_{i}.txt").write_text("x")
-    yield folder
-    # Teardown
-    shutil.rmtree(folder)
-
-
-@pytest.fixture(name="mini_fs")
-def _mini_fs(tmp_path: pathlib.Path) -> pathlib.Path:  # pyright: ignore[reportUnusedFunction]
-    """Create a small file structure for query tests."""
-    # Arrange
-    f1 = tmp_path / "foo.txt"
-    f2 = tmp_path / "bar.md"
-    f3 = tmp_path / "baz.txt"
-    d1 = tmp_path / "subdir"
-    d1.mkdir()
-    f4 = d1 / "qux.txt"
-    f1.write_text("a" * 100)
-    f2.write_text("b" * 200)
-    f3.write_text("c" * 50)
-    f4.write_text("d" * 300)
-    return tmp_path
-
-
 @pytest.mark.parametrize(
     "recursive,expected_files",
     [
@@ -91,26 +60,53 @@ def test_query_no_filter_param(
     assert actual_files == expected_files
 
 
-def test_query_size_and_suffix(mini_fs: pathlib.Path) -> None:
+# Filter trees are immutable and the tests below never reconfigure their Query,
+# so each is built once per module.
+@pytest.fixture(scope="module")
+def q_size_and_suffix() -> Query:
+    """Query for .txt files of at least 100 bytes."""
+    # Arrange
+    return Query(where_expr=(Size() >= 100) & Suffix("txt"))
+
+
+@pytest.fixture(scope="module")
+def q_or_and() -> Query:
+    """Query for large .txt files or any .md file."""
+    # Arrange
+    return Query(where_expr=(Size() > 250) & Suffix("txt") | Suffix("md"))
+
+
+@pytest.fixture(scope="module")
+def q_complex() -> Query:
+    """Query mixing size bounds across .txt and .md files."""
+    # Arrange
+    return Query(
+        where_expr=(Suffix("txt") & (Size() > 50)) | (Suffix("md") & (Size() < 300))
+    )
+
+
+def test_query_size_and_suffix(mini_fs: pathlib.Path, q_size_and_suffix: Query) -> None:
     """Test Query with size and suffix filters."""
     # Arrange
-    q = Query(where_expr=(Size() >= 100) & Suffix("txt"))
+    q = q_size_and_suffix
     # Act
     files = list(q.files(mini_fs, recursive=True, files_only=True, threaded=False))
-    names = sorted(f.name for f in files)
+    names = {f.name for f in files}
     # Assert
-    assert names == ["foo.txt", "qux.txt"]
+    assert names == {"foo.txt", "qux.txt"}
+    assert len(files) == len(names)
 
 
-def test_query_or_and(mini_fs: pathlib.Path) -> None:
+def test_query_or_and(mini_fs: pathlib.Path, q_or_and: Query) -> None:
     """Test Query with OR and AND filters."""
     # Arrange
-    q = Query(where_expr=(Size() > 250) & Suffix("txt") | Suffix("md"))
+    q = q_or_and
     # Act
     files = list(q.files(mini_fs, recursive=True, files_only=True, threaded=False))
-    names = sorted(f.name for f in files)
+    names = {f.name for f in files}
     # Assert
-    assert names == ["bar.md", "qux.txt"]
+    assert names == {"bar.md", "qux.txt"}
+    assert len(files) == len(names)
 
 
 def test_query_select_tuple_and_nested_tuple(mini_fs: pathlib.Path) -> None:
@@ -118,9 +114,9 @@ def test_query_select_tuple_and_nested_tuple(mini_fs: pathlib.Path) -> None:
     subdir = mini_fs / "subdir"
     paths = (mini_fs, subdir)
     q = Query(where_expr=Suffix(".txt"))
-    files = sorted([p.name for p in q.select(paths)])
+    files = {p.name for p in q.select(paths)}
     # Should find all .txt files in both mini_fs and subdir
-    assert set(files) == {"foo.txt", "baz.txt", "qux.txt"}
+    assert files == {"foo.txt", "baz.txt", "qux.txt"}
 
 
 def test_query_type_file_and_dir(mini_fs: pathlib.Path) -> None:
@@ -138,19 +134,18 @@ def test_query_type_file_and_dir(mini_fs: pathlib.Path) -> None:
     assert all(d.is_dir() for d in dirs)
 
 
-def test_query_complex(mini_fs: pathlib.Path) -> None:
+def test_query_complex(mini_fs: pathlib.Path, q_complex: Query) -> None:
     """Test Query with complex filter combinations."""
     # Arrange
-    q = Query(
-        where_expr=(Suffix("txt") & (Size() > 50)) | (Suffix("md") & (Size() < 300))
-    )
+    q = q_complex
 
     # Act
     files = list(q.files(mini_fs, recursive=True, files_only=True, threaded=False))
-    names = sorted(f.name for f in files)
+    names = {f.name for f in files}
 
     # Assert
-    assert names == ["bar.md", "foo.txt", "qux.txt"]
+    assert names == {"bar.md", "foo.txt", "qux.txt"}
+    assert len(files) == len(names)
 
 
 # pytest.mark.timeout(10)
@@ -160,6 +155,8 @@ def test_threaded_vs_unthreaded_equivalence_hundred(
     """Threaded and unthreaded Query yield the same results on 100 files."""
     # Arrange
     q = Query(where_expr=Suffix("txt"))
+    # hundred_files is read-only and built from this pattern, so no listing is needed.
+    expected = {f"file_{i}.txt" for i in range(100)}
 
     # Act
     threaded = set(
@@ -182,14 +179,28 @@ def test_threaded_vs_unthreaded_equivalence_hundred(
     )
 
     # Assert
-    assert threaded == unthreaded
-    assert len(threaded) == 100
-    assert threaded == unthreaded
-    assert len(threaded) == 100
-    assert threaded == unthreaded
-    assert len(threaded) == 100
-    assert threaded == unthreaded
-    assert len(threaded) == 100
+    assert threaded == expected
+    assert unthreaded == expected
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("files_only", [True, False])
+def test_threaded_matches_unthreaded_nested(
+    mini_fs: pathlib.Path,
+    recursive: bool,
+    files_only: bool,
+) -> None:
+    """Threaded directory tasks find the same paths as the serial walk on a nested tree."""
+    # Arrange
+    q = Query()
+
+    # Act
+    threaded = list(q.files(mini_fs, recursive, files_only, threaded=True))
+    unthreaded = list(q.files(mini_fs, recursive, files_only, threaded=False))
+
+    # Assert
+    assert sorted(threaded) == sorted(unthreaded)
+    assert len(threaded) == len(set(threaded))
 
 
 def test_query_where_expr_and_from_path(tmp_path: pathlib.Path) -> None:
@@ -2,10 +2,20 @@
 
 import datetime as dt
 import pathlib
+import re
+import time
 from typing import Any, cast
 
-from pathql.filters.base import Filter
+import pytest
+
+import pathql.query as query_module
+import pathql.walker as walker_module
+from pathql.filters.base import AllowAll, Filter
+from pathql.filters.file import File
+from pathql.filters.size import Size
 from pathql.filters.stat_proxy import StatProxy
+from pathql.filters.stem import Stem
+from pathql.filters.suffix import Suffix
 from pathql.query import Query
 
 
@@ -35,6 +45,55 @@ class AlwaysFalse(Filter):
         return False
 
 
+class BadPath:
+    """Path stand-in whose stat() always fails."""
+
+    __slots__ = ("_p",)
+
+    def __init__(self, p: pathlib.Path) -> None:
+        """Wrap the real path p."""
+        self._p = p
+
+    def stat(self):
+        """Simulate a stat error."""
+        raise OSError("fail")
+
+    def is_file(self):
+        """Always return True for is_file()."""
+        return True
+
+    @property
+    def name(self):
+        """Return the name of the path."""
+        return self._p.name
+
+    def __fspath__(self) -> str:
+        """Return the filesystem path as string."""
+        return str(self._p)
+
+
+class RecordingStatProxy(StatProxy):
+    """StatProxy that records every instance created by the query in `created`."""
+
+    __slots__ = ()
+
+    created: list[StatProxy] = []
+
+    def __init__(self, path, dirent=None):
+        """Build the proxy and record it."""
+        super().__init__(path, dirent)
+        self.created.append(self)
+
+
+@pytest.fixture
+def recorded_proxies(monkeypatch: pytest.MonkeyPatch) -> list[StatProxy]:
+    """Make Query build RecordingStatProxy objects; return the list that records them."""
+    proxies: list[StatProxy] = []
+    monkeypatch.setattr(RecordingStatProxy, "created", proxies)
+    monkeypatch.setattr(query_module, "StatProxy", RecordingStatProxy)
+    return proxies
+
+
 def make_file(tmp_path: pathlib.Path, name: str = "a_file.txt") -> pathlib.Path:
     """Create a file with the given name in tmp_path."""
     file = tmp_path / name
@@ -73,29 +132,6 @@ def test_query_files_stat_error(tmp_path: pathlib.Path):
     """Query.match handles stat errors gracefully (returns True)."""
 
     # Arrange
-    class BadPath:
-        """Simulate a bad path"""
-
-        def __init__(self, p: pathlib.Path) -> None:
-            self._p = p
-
-        def stat(self):
-            """Simulate a stat error."""
-            raise OSError("fail")
-
-        def is_file(self):
-            """Always return True for is_file()."""
-            return True
-
-        @property
-        def name(self):
-            """Return the name of the path."""
-            return self._p.name
-
-        def __fspath__(self) -> str:
-            """Return the filesystem path as string."""
-            return str(self._p)
-
     bad = BadPath(tmp_path / "bad.txt")
     q = Query(where_expr=AlwaysTrue())
     # Act and Assert - should handle stat error and return True
@@ -107,23 +143,369 @@ def test_query_match_stat_error(tmp_path: pathlib.Path):
     """Query.match handles stat errors gracefully (returns False)."""
 
     # Arrange
-    class BadPath:
-        """Simulate a bad path"""
-
-        def __init__(self, p: pathlib.Path) -> None:
-            """Simulate a bad path init."""
-            self._p = p
-
-        def stat(self):
-            """Simulate a stat error."""
-            raise OSError("fail")
-
-        def __fspath__(self) -> str:
-            """Return the filesystem path as string."""
-            return str(self._p)
-
     bad = BadPath(tmp_path / "bad.txt")
     q = Query(where_expr=AlwaysFalse())
     # Act and Assert - should not raise, just return False
     # Accessing _p for test purposes
     assert q.match(cast(Any, bad), StatProxy(bad._p)) is False  # type: ignore[attr-defined]
+
+
+def test_query_match_builds_stat_proxy(tmp_path: pathlib.Path):
+    """Query.match works for stat-based filters when no StatProxy is passed."""
+    # Arrange
+    f = tmp_path / "f.txt"
+    f.write_bytes(b"x" * 10)
+    q = Query(where_expr=(Size() == 10) & (Size() > 5))
+
+    # Act and Assert
+    assert q.match(f) is True
+
+
+def test_query_overlapping_roots_share_stats(
+    mini_fs: pathlib.Path,
+    recorded_proxies: list[StatProxy],
+):
+    """A file reached from two roots in one files() call is stat'd once."""
+    # Arrange
+    q = Query(where_expr=Size() >= 300)
+
+    # Act
+    names = [p.name for p in q.files([mini_fs, mini_fs / "subdir"], threaded=False)]
+
+    # Assert
+    assert names == ["qux.txt", "qux.txt"]
+    assert len(recorded_proxies) == len({p.path for p in recorded_proxies})
+
+
+@pytest.mark.parametrize(
+    "roots, expected",
+    [
+        (["a", "b"], set()),
+        (["a", "a/sub"], {0, 1}),
+        (["a/sub", "a"], {0, 1}),
+        (["a", "b", "a"], {0, 2}),
+        (["a", "ab"], set()),
+        (["a"], set()),
+    ],
+    ids=["disjoint", "child-after", "child-before", "repeated", "name-prefix", "single"],
+)
+def test_overlapping_roots(tmp_path: pathlib.Path, roots: list[str], expected: set[int]):
+    """Only roots that equal, contain or lie inside another root are reported."""
+    # Act
+    shared = query_module._overlapping_roots([tmp_path / r for r in roots])
+
+    # Assert
+    assert shared == expected
+
+
+def test_query_disjoint_roots_keep_no_caches(
+    mini_fs: pathlib.Path,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Roots that cannot reach each other's files share no stat or directory cache."""
+    # Arrange
+    caches: list[object] = []
+    real_walk = Query._unthreaded_files
+
+    def recording_walk(self, path, walk):
+        caches.append((walk.stat_cache, walk.dir_cache))
+        return real_walk(self, path, walk)
+
+    monkeypatch.setattr(Query, "_unthreaded_files", recording_walk)
+    (tmp_path / "other").mkdir()
+    q = Query(where_expr=Size() >= 0)
+
+    # Act
+    list(q.files([mini_fs, tmp_path / "other"], threaded=False))
+
+    # Assert
+    assert caches == [(None, None), (None, None)]
+
+
+@pytest.mark.parametrize(
+    "expr, name, expected",
+    [
+        (Suffix("txt"), "a.TXT", True),
+        (Suffix("txt"), "a.md", False),
+        (Suffix() != "txt", "a.txt", False),
+        (Stem("foo*"), "foobar.txt", True),
+        (Stem("foo*"), "bar.txt", False),
+        (File("*.md"), "x.md", True),
+        (Suffix("txt") & (Size() > 10), "a.txt", True),
+        (Suffix("txt") & (Size() > 10), "a.md", False),
+        (Suffix("txt") | Stem("readme"), "README.md", True),
+        (Suffix("txt") | Stem("readme"), "notes.md", False),
+        (~Suffix("txt"), "a.txt", False),
+        (~Suffix("txt"), "a.md", True),
+        (Suffix("txt") | Suffix("md") | Suffix("LOG", ignore_case=False), "a.MD", True),
+        (Suffix("txt") | Suffix("md") | Suffix("LOG", ignore_case=False), "a.log", False),
+        (Suffix("txt") | Suffix("md") | Suffix("LOG", ignore_case=False), "a.LOG", True),
+        (Stem("a") & Suffix("txt") & File("a*"), "a.txt", True),
+        (Stem("a") & Suffix("txt") & File("a*"), "b.txt", False),
+        (Stem("foo*") | Stem("bar") | File("*.md") | File("x?.log"), "bar.txt", True),
+        (Stem("foo*") | Stem("bar") | File("*.md") | File("x?.log"), "xy.LOG", True),
+        (Stem("foo*") | Stem("bar") | File("*.md") | File("x?.log"), "barx.txt", False),
+        (Stem("foo*") | (Stem() != "bar"), "bar.txt", False),
+        (Stem(["(x)\\1"]) | Stem(["(a)\\1"]) | Stem("b*"), "aa.txt", True),
+        (Stem("(?i)foo", ignore_case=False) | Stem("bar*"), "FOO.txt", True),
+        (Stem("(?i)foo", ignore_case=False) | Stem("bar*"), "baz.txt", False),
+        (File("ix*"), "\u0130x.md", False),
+        (File("ix*") | File("y*"), "\u0130x.md", False),
+        (File("ix*") | File("y*"), "IX.md", True),
+    ],
+    ids=[
+        "suffix-case", "suffix-miss", "suffix-ne", "stem-hit", "stem-miss", "file",
+        "and-size-hit", "and-size-miss", "or-hit", "or-miss", "not-hit", "not-miss",
+        "merged-md", "merged-case-miss", "merged-case-hit", "and3-hit", "and3-miss",
+        "merged-stem", "merged-file", "merged-miss", "stem-or-ne", "stem-or-backref",
+        "stem-or-flag-hit", "stem-or-flag-miss", "file-dotted-i", "merged-file-dotted-i",
+        "merged-file-upper",
+    ],
+)
+def test_extract_name_predicate(expr: Filter, name: str, expected: bool):
+    """Name-level predicates are extracted from AND/OR/NOT trees of name filters."""
+    # Act
+    pred = Query._extract_name_predicate(expr)
+
+    # Assert
+    assert pred is not None
+    assert pred(name) is expected
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [Size() > 10, Suffix("txt") | (Size() > 10), ~(Suffix("txt") & (Size() > 10))],
+    ids=["size", "or-size", "not-and-size"],
+)
+def test_extract_name_predicate_none(expr: Filter):
+    """No predicate is pushed down when the name alone cannot rule a file out."""
+    # Act and Assert
+    assert Query._extract_name_predicate(expr) is None
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["a(b.txt", "c(d.txt", "xx.txt", "x(1)y.md", "y.md", "ab.txt", "x1y.md", "xy.txt"],
+)
+def test_name_predicate_merges_literal_parentheses(name: str):
+    """OR'd Stem/File patterns with a literal '(' push down exactly as match() decides."""
+    # Arrange
+    expr = (
+        Stem(r"a\(b", ignore_case=False)
+        | Stem("c[(]d", ignore_case=False)
+        | Stem(r"(x)\1", ignore_case=False)
+        | File("x(1)*")
+        | File("y.*")
+    )
+    pred = Query._extract_name_predicate(expr)
+
+    # Act and Assert
+    assert pred is not None
+    assert pred(name) is expr.match(pathlib.PurePosixPath(name))
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [(r"a\(b", True), ("c[(]d", True), (r"(x)\1", False), ("(?i)x", False), ("(?i:x)", True)],
+    ids=["escaped", "char-class", "group", "global-flag", "scoped-flag"],
+)
+def test_alternable_inspects_compiled_regex(regex: str, expected: bool):
+    """Only group-free regexes without global flags are merged into an alternation."""
+    # Act and Assert
+    assert query_module._alternable(re.compile(regex)) is expected
+
+
+@pytest.mark.parametrize(
+    "name",
+    [".bashrc", "foo.", "foo..", "a..b", "a.b.c", "...", "noext", ".a.b"],
+)
+def test_stem_helper_matches_pathlib(name: str):
+    """The pushed-down stem helper agrees with pathlib, dotfiles and trailing dots included."""
+    # Act and Assert
+    assert query_module._stem(name) == pathlib.PurePath(name).stem
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_subclass_match_is_not_pushed_down(mini_fs: pathlib.Path, threaded: bool):
+    """A subclass of a name filter that overrides match() is evaluated by that match()."""
+
+    # Arrange
+    class NoTxt(Suffix):
+        """A Suffix("txt") subclass that rejects every file."""
+
+        def match(self, path, stat_proxy=None, now=None) -> bool:
+            """Never match."""
+            return False
+
+    q = Query(where_expr=NoTxt("txt") | Stem("nothing_is_named_this"))
+
+    # Act
+    found = list(q.files(mini_fs, threaded=threaded))
+
+    # Assert
+    assert found == []
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_name_pushdown_skips_stat_proxies(
+    mini_fs: pathlib.Path,
+    recorded_proxies: list[StatProxy],
+    threaded: bool,
+):
+    """Entries rejected by the pushed-down name predicate never get a StatProxy."""
+    # Arrange
+    q = Query(where_expr=Suffix("txt") & (Size() >= 0))
+
+    # Act
+    found = set(q.files(mini_fs, threaded=threaded))
+
+    # Assert
+    assert found == {p for p in mini_fs.rglob("*.txt") if p.is_file()}
+    assert all(p.path.suffix == ".txt" for p in recorded_proxies)
+
+
+def test_query_threaded_yields_in_walk_order(tmp_path: pathlib.Path):
+    """Threaded walks yield the unthreaded order, even when early directories finish last."""
+    # Arrange
+    for rel in ["a/1.txt", "a/2.txt", "a/x/3.txt", "b/4.txt", "b/y/z/5.txt", "c/6.txt", "7.txt"]:
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(rel)
+
+    class SlowInA(Filter):
+        """Matches everything, but slowly inside directory a, so its task completes last."""
+
+        def match(
+            self,
+            path: pathlib.Path,
+            stat_proxy: StatProxy | None = None,
+            now: dt.datetime | None = None,
+        ) -> bool:
+            """Sleep for files directly in a, then match."""
+            if path.parent.name == "a":
+                time.sleep(0.05)
+            return True
+
+    q = Query(where_expr=SlowInA())
+
+    # Act
+    unthreaded = list(q.files(tmp_path, files_only=False, threaded=False))
+    threaded = list(q.files(tmp_path, files_only=False, threaded=True))
+
+    # Assert
+    assert threaded == unthreaded
+    assert len(threaded) == 13
+
+
+def test_query_builds_name_plan_once(mini_fs: pathlib.Path):
+    """The WHERE name plan is built once, reused across calls and rebuilt after where()."""
+    # Arrange
+    q = Query(where_expr=Suffix("txt") & (Size() > 60))
+
+    # Act
+    first = q._name_plan()
+    list(q.files(mini_fs, threaded=True))
+    list(q.select(mini_fs, threaded=False))
+    second = q._name_plan()
+    q.where(Suffix("md"))
+    third = q._name_plan()
+
+    # Assert
+    assert first is second
+    assert third is not first
+    assert q.match(mini_fs / "bar.md") is True
+
+
+@pytest.mark.parametrize(
+    "expr, threaded, uses_proxies",
+    [
+        (AlwaysTrue() | AlwaysFalse(), False, True),
+        (AllowAll(), False, False),
+        (AllowAll(), True, False),
+        (Suffix("txt") | ~Stem("bar"), False, False),
+        (Suffix("txt") | ~Stem("bar"), True, False),
+    ],
+    ids=["custom", "allow-all", "allow-all-threaded", "names", "names-threaded"],
+)
+def test_query_name_exact_skips_match(
+    mini_fs: pathlib.Path,
+    recorded_proxies: list[StatProxy],
+    expr: Filter,
+    threaded: bool,
+    uses_proxies: bool,
+):
+    """Expressions decided by the file name alone are answered without any StatProxy."""
+    # Arrange
+    q = Query(where_expr=expr)
+    expected = {p for p in mini_fs.rglob("*") if p.is_file() and q.match(p)}
+    recorded_proxies.clear()
+
+    # Act
+    found = set(q.files(mini_fs, threaded=threaded))
+
+    # Assert
+    assert found == expected
+    assert bool(recorded_proxies) is uses_proxies
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_overlapping_roots_scan_each_dir_once(
+    mini_fs: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    threaded: bool,
+):
+    """Directories reached from several roots in one files() call are scandir'd once."""
+    # Arrange
+    scanned: list[str] = []
+    real_scandir = walker_module.os.scandir
+
+    def counting_scandir(path):
+        scanned.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(walker_module.os, "scandir", counting_scandir)
+    q = Query(where_expr=Suffix("txt"))
+    roots = [mini_fs, mini_fs / "subdir", mini_fs]
+
+    # Act
+    names = sorted(p.name for p in q.files(roots, threaded=threaded))
+
+    # Assert
+    assert names == sorted(["foo.txt", "baz.txt", "qux.txt"] * 2 + ["qux.txt"])
+    assert sorted(scanned) == sorted([str(mini_fs), str(mini_fs / "subdir")])
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_entries_reuse_filter_stat(mini_fs: pathlib.Path, threaded: bool):
+    """entries() hands back the stat the filters fetched, and None for name-only queries."""
+    # Arrange
+    sized = Query(where_expr=Size() >= 0)
+    named = Query(where_expr=Suffix("txt"))
+
+    # Act
+    sized_entries = list(sized.entries(mini_fs, threaded=threaded))
+    named_entries = list(named.entries(mini_fs, threaded=threaded))
+
+    # Assert
+    assert sorted(p for p, _ in sized_entries) == sorted(sized.files(mini_fs))
+    assert all(st is not None and st.st_size == p.stat().st_size for p, st in sized_entries)
+    assert sorted(p for p, _ in named_entries) == sorted(named.files(mini_fs))
+    assert all(st is None for _, st in named_entries)
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_files_sees_root_created_after_missing(tmp_path: pathlib.Path, threaded: bool):
+    """A root created right after a query found it missing is walked by the next query."""
+    # Arrange
+    root = tmp_path / "later"
+    q = Query(where_expr=AlwaysTrue())
+
+    # Act
+    before = list(q.files(root, threaded=threaded))
+    root.mkdir()
+    (root / "a.txt").write_text("a")
+    after = list(q.files(root, threaded=threaded))
+
+    # Assert
+    assert before == []
+    assert after == [root / "a.txt"]
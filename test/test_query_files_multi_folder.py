@@ -9,16 +9,18 @@ import pathlib
 
 import pytest
 
-from pathql.query import AllowAll, Query
+from pathql.filters.base import AllowAll
+from pathql.query import Query
 
 
-@pytest.fixture
-def multi_folder_fixture(tmp_path: pathlib.Path) -> list[pathlib.Path]:
+@pytest.fixture(scope="module")
+def multi_folder_fixture(tmp_path_factory: pytest.TempPathFactory) -> list[pathlib.Path]:
     """
     Create three explicit folders (alpha, beta, gamma) each with two files.
-    Returns a list of folder paths.
+    Returns a list of folder paths. Built once per module; tests only read it.
     """
     # Arrange
+    tmp_path = tmp_path_factory.mktemp("multi_folder")
     folder_names = ["alpha", "beta", "gamma"]
     folders: list[pathlib.Path] = []
     for name in folder_names:
@@ -71,7 +73,7 @@ def test_query_files_multi_folder(
     assert actual_count == expected_count, (
         f"Expected {expected_count} files, got {actual_count} for folders {folder_combo}"
     )
+    selected = set(selected_folders)
     for f in actual_files:
-        assert any(str(f).startswith(str(folder)) for folder in selected_folders), (
-            f"File {f} not in selected folders {selected_folders}"
-        )
+        # Non-recursive query: every file sits directly in one of the folders.
+        assert f.parent in selected, f"File {f} not in selected folders {selected_folders}"
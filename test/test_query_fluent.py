@@ -87,3 +87,17 @@ def test_fluent_reverse_order_equivalence():
     assert q_normal.get_files_only == q_reverse.get_files_only
     assert q_normal.get_now == q_reverse.get_now
     assert q_normal.get_threaded == q_reverse.get_threaded
+
+
+def test_from_paths_defaults_used_by_files(mini_fs):
+    """Default roots given to from_paths() are what files() walks when none are passed."""
+    # Arrange
+    q = Query(where_expr=Suffix() == "txt").recursive(False)
+    q.from_paths([str(mini_fs), mini_fs / "subdir"])
+
+    # Act
+    names = sorted(p.name for p in q.files())
+
+    # Assert
+    assert names == ["baz.txt", "foo.txt", "qux.txt"]
+    assert q.get_from_paths == [str(mini_fs), mini_fs / "subdir"]
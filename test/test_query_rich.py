@@ -26,9 +26,10 @@ def test_all_files_bigger_than_50(
     files = list(q.files(root_path, recursive=True, files_only=True, now=now_dt))
 
     # Assert
-    assert all(f.stat().st_size > 50 for f in files)
-    for f in files:
-        print(f"Matched: {f} size={f.stat().st_size}")
+    sizes = {f: f.stat().st_size for f in files}
+    assert all(size > 50 for size in sizes.values())
+    for f, size in sizes.items():
+        print(f"Matched: {f} size={size}")
 
 
 def test_txt_files_older_than_20_seconds(
@@ -66,9 +67,10 @@ def test_bmp_files_size_and_age(
 
     # Assert
     for f in files:
+        st = f.stat()
         assert f.suffix == ".bmp"
-        assert f.stat().st_size > 30
-        assert (now - f.stat().st_mtime) > 0.01 * 60
+        assert st.st_size > 30
+        assert (now - st.st_mtime) > 0.01 * 60
 
 
 def test_stem_pattern_and_type(
@@ -85,8 +87,8 @@ def test_stem_pattern_and_type(
     files = list(q.files(root_path, recursive=True, files_only=True, now=now_dt))
 
     # Assert
+    assert sorted(f.name for f in files) == ["g50.txt", "g51.txt"]
     for f in files:
-        assert f.stem.startswith("g")
         assert f.is_file()
 
 
@@ -99,17 +101,19 @@ def test_complex_combination(
     root_path = Path(root)
     now_dt = dt.datetime.fromtimestamp(now)
     q = Query(
-        where_expr=Suffix("txt") & (Size() > 20) & (AgeSeconds() > 10) & Stem(r"d")
+        where_expr=Suffix("txt") & (Size() > 20) & (AgeSeconds() > 10) & Stem("d*")
     )
 
     # Act
     files = list(q.files(root_path, recursive=True, files_only=True, now=now_dt))
 
     # Assert
+    assert sorted(f.name for f in files) == ["d30.txt", "d31.txt"]
     for f in files:
+        st = f.stat()
         assert f.suffix == ".txt"
-        assert f.stat().st_size > 20
-        assert (now - f.stat().st_mtime) > 10
+        assert st.st_size > 20
+        assert (now - st.st_mtime) > 10
         assert "d" in f.stem
 
 
@@ -1,19 +1,22 @@
 """Tests for ResultSet aggregations (min/max/top_n/sort/average/median/count)."""
 
 import pathlib
+import statistics
+from dataclasses import dataclass
 
 import pytest
 
+from pathql.filters.size import Size
 from pathql.filters.suffix import Suffix
+import pathql.result_set as result_set_module
 from pathql.query import Query
 from pathql.result_set import ResultField, ResultSet
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_max_size(test_result_files: list[pathlib.Path]) -> None:
+def test_max_size(result_set: ResultSet) -> None:
     """Test max aggregation by file size."""
     # Arrange
-    result = ResultSet(test_result_files)
+    result = result_set
     expected = 3000
     # Act
     actual = result.max(ResultField.SIZE)
@@ -21,11 +24,10 @@ def test_max_size(test_result_files: list[pathlib.Path]) -> None:
     assert actual == expected, f"Max size should be {expected}, got {actual}"
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_min_size(test_result_files: list[pathlib.Path]) -> None:
+def test_min_size(result_set: ResultSet) -> None:
     """Test min aggregation by file size."""
     # Arrange
-    result = ResultSet(test_result_files)
+    result = result_set
     expected = 10
     # Act
     actual = result.min(ResultField.SIZE)
@@ -33,11 +35,10 @@ def test_min_size(test_result_files: list[pathlib.Path]) -> None:
     assert actual == expected, f"Min size should be {expected}, got {actual}"
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_top3_largest(test_result_files: list[pathlib.Path]) -> None:
+def test_top3_largest(result_set: ResultSet) -> None:
     """Test top_n aggregation for largest files by size."""
     # Arrange
-    result = ResultSet(test_result_files)
+    result = result_set
     expected = {"largest_1.txt", "largest_2.txt", "largest_3.txt"}
     # Act
     actual = {p.name for p in result.top_n(ResultField.SIZE, 3)}
@@ -45,11 +46,10 @@ def test_top3_largest(test_result_files: list[pathlib.Path]) -> None:
     assert actual == expected, f"Top 3 largest files should be {expected}, got {actual}"
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_bottom3_smallest(test_result_files: list[pathlib.Path]) -> None:
+def test_bottom3_smallest(result_set: ResultSet) -> None:
     """Test bottom_n aggregation for smallest files by size."""
     # Arrange
-    result = ResultSet(test_result_files)
+    result = result_set
     expected = {"smallest_1.txt", "smallest_2.txt", "smallest_3.txt"}
     # Act
     actual = {p.name for p in result.bottom_n(ResultField.SIZE, 3)}
@@ -59,11 +59,10 @@ def test_bottom3_smallest(test_result_files: list[pathlib.Path]) -> None:
     )
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_sort_by_name(test_result_files: list[pathlib.Path]) -> None:
+def test_sort_by_name(result_set: ResultSet) -> None:
     """Test sorting files by name."""
     # Arrange
-    result = ResultSet(test_result_files)
+    result = result_set
     expected_first = "a_first.txt"
     expected_last = "z_last.txt"
     # Act
@@ -79,38 +78,56 @@ def test_sort_by_name(test_result_files: list[pathlib.Path]) -> None:
     )
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_average_size(test_result_files: list[pathlib.Path]) -> None:
+def test_average_size(result_set: ResultSet) -> None:
     """Test average aggregation by file size."""
     # Arrange
-    result = ResultSet(test_result_files)
-    expected = sum(p.stat().st_size for p in result) / len(result)
+    result = result_set
+    expected = sum(result.get(ResultField.SIZE, p) for p in result) / len(result)
     # Act
     actual = result.average(ResultField.SIZE)
     # Assert
     assert actual == expected, f"Average size should be {expected}, got {actual}"
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_median_size(test_result_files: list[pathlib.Path]) -> None:
+@pytest.mark.parametrize(
+    "sizes",
+    [[1, 2, 3], [1, 2], [0, 10, 11], [7]],
+    ids=["whole", "half", "repeating", "single"],
+)
+def test_average_size_matches_statistics_mean(tmp_path: pathlib.Path, sizes: list[int]) -> None:
+    """Average of an integer field has statistics.mean's value and type (int when whole)."""
+    # Arrange
+    files = []
+    for i, size in enumerate(sizes):
+        f = tmp_path / f"f{i}.bin"
+        f.write_bytes(b"x" * size)
+        files.append(f)
+
+    # Act
+    actual = ResultSet(files).average(ResultField.SIZE)
+
+    # Assert
+    expected = statistics.mean(sizes)
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+def test_median_size(result_set: ResultSet) -> None:
     """Test median aggregation by file size."""
     # Arrange
-    result = ResultSet(test_result_files)
-    sizes = sorted(p.stat().st_size for p in result)
-    n = len(sizes)
-    expected = sizes[n // 2] if n % 2 else (sizes[n // 2 - 1] + sizes[n // 2]) / 2
+    result = result_set
+    expected = 200  # 8th of the 15 fixture sizes in ascending order
     # Act
     actual = result.median(ResultField.SIZE)
     # Assert
     assert actual == expected, f"Median size should be {expected}, got {actual}"
 
 
-@pytest.mark.usefixtures("test_result_files")
-def test_count(test_result_files: list[pathlib.Path]) -> None:
+def test_count(result_set: ResultSet) -> None:
     """Test count aggregation for number of files."""
     # Arrange
-    result = ResultSet(test_result_files)
-    expected = len(test_result_files)
+    result = result_set
+    expected = 15
     # Act
     actual = result.count_()
     # Assert
@@ -125,8 +142,7 @@ def test_min_max_size(test_result_files_with_mtime: list[pathlib.Path]) -> None:
     expected_min = 100
     expected_max = 180
     # Act
-    actual_min = rs.min(ResultField.SIZE)
-    actual_max = rs.max(ResultField.SIZE)
+    actual_min, actual_max = rs.min_max(ResultField.SIZE)
     # Assert
     assert actual_min == expected_min, (
         f"Min size should be {expected_min}, got {actual_min}"
@@ -141,12 +157,11 @@ def test_min_max_mtime(test_result_files_with_mtime: list[pathlib.Path]) -> None
     """Test min and max aggregations on modification time."""
     # Arrange
     rs = ResultSet(test_result_files_with_mtime)
-    mtimes = [f.stat().st_mtime for f in rs]
+    mtimes = [rs.get(ResultField.MTIME, f) for f in rs]
     expected_min = min(mtimes)
     expected_max = max(mtimes)
     # Act
-    actual_min = rs.min(ResultField.MTIME)
-    actual_max = rs.max(ResultField.MTIME)
+    actual_min, actual_max = rs.min_max(ResultField.MTIME)
     # Assert
     assert actual_min == expected_min, (
         f"Min mtime should match oldest file: {expected_min}, got {actual_min}"
@@ -171,53 +186,68 @@ def test_end_to_end_query_and_aggregations(test_result_folder: pathlib.Path) ->
         f"Expected {expected_files} files, got {len(files)}"
     )
 
-@pytest.fixture
-def sample_files(tmp_path):
-    """Create sample files with different names and sizes."""
+@dataclass(frozen=True)
+class SampleFixture:
+    """sample_files ResultSet plus each file's fields, computed once for the module."""
+
+    rs: ResultSet
+    sizes: list[int]
+    names: list[str]
+    suffixes: list[str]
+    stems: list[str]
+
+
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory: pytest.TempPathFactory) -> SampleFixture:
+    """Create sample files with different names and sizes (read only for the module)."""
+    root = tmp_path_factory.mktemp("sample_files")
     files = []
     for i, name in enumerate(["a.txt", "b.md", "c.log"]):
-        f = tmp_path / name
+        f = root / name
         f.write_text("x" * (i + 1))  # size: 1, 2, 3
         files.append(f)
-    return ResultSet(files)
+    return SampleFixture(
+        rs=ResultSet(files),
+        sizes=[f.stat().st_size for f in files],
+        names=[f.name for f in files],
+        suffixes=[f.suffix for f in files],
+        stems=[f.stem for f in files],
+    )
 
-def test_resultset_name_suffix_stem(sample_files):
+def test_resultset_name_suffix_stem(sample_files: SampleFixture):
     """Test extraction of name, suffix, and stem fields."""
     # Arrange
-    rs = sample_files
+    rs = sample_files.rs
     # Act & Assert
-    names = [f.name for f in rs]
-    suffixes = [f.suffix for f in rs]
-    stems = [f.stem for f in rs]
-    assert rs.max(ResultField.NAME) == max(names)
-    assert rs.min(ResultField.NAME) == min(names)
-    assert rs.max(ResultField.SUFFIX) == max(suffixes)
-    assert rs.min(ResultField.SUFFIX) == min(suffixes)
-    assert rs.max(ResultField.STEM) == max(stems)
-    assert rs.min(ResultField.STEM) == min(stems)
-
-def test_resultset_path_parent_parents(sample_files):
+    assert rs.max(ResultField.NAME) == max(sample_files.names)
+    assert rs.min(ResultField.NAME) == min(sample_files.names)
+    assert rs.max(ResultField.SUFFIX) == max(sample_files.suffixes)
+    assert rs.min(ResultField.SUFFIX) == min(sample_files.suffixes)
+    assert rs.max(ResultField.STEM) == max(sample_files.stems)
+    assert rs.min(ResultField.STEM) == min(sample_files.stems)
+
+def test_resultset_path_parent_parents(sample_files: SampleFixture):
     """Test extraction of path, parent, parents, parents_stem_suffix."""
     # Arrange
-    rs = sample_files
+    rs = sample_files.rs
     # Act & Assert
     assert all(isinstance(rs.max(ResultField.PATH), str) for _ in rs)
     assert all(isinstance(rs.min(ResultField.PARENT), str) for _ in rs)
     assert all(isinstance(rs.max(ResultField.PARENTS), tuple) for _ in rs)
     assert all(isinstance(rs.min(ResultField.PARENTS_STEM_SUFFIX), tuple) for _ in rs)
 
-def test_resultset_size_fields(sample_files):
+def test_resultset_size_fields(sample_files: SampleFixture):
     """Test extraction of size field."""
     # Arrange
-    rs = sample_files
+    rs = sample_files.rs
     # Act & Assert
     assert isinstance(rs.max(ResultField.SIZE), int)
     assert isinstance(rs.min(ResultField.SIZE), int)
 
-def test_resultset_aggregates(sample_files):
+def test_resultset_aggregates(sample_files: SampleFixture):
     """Test average, median, count_, sort_, top_n, bottom_n."""
     # Arrange
-    rs = sample_files
+    rs = sample_files.rs
     # Act
     avg_size = rs.average(ResultField.SIZE)
     med_size = rs.median(ResultField.SIZE)
@@ -226,13 +256,13 @@ def test_resultset_aggregates(sample_files):
     top = rs.top_n(ResultField.SIZE, 2)
     bottom = rs.bottom_n(ResultField.SIZE, 2)
     # Assert
-    sizes = [f.stat().st_size for f in rs]
+    sizes = sample_files.sizes
     assert avg_size == pytest.approx(sum(sizes) / len(rs))
     assert med_size == 2
     assert count == 3
-    assert sorted_rs[0].stat().st_size == 1
-    assert top[0].stat().st_size == 3
-    assert bottom[0].stat().st_size == 1
+    assert sorted_rs[0] == rs[sizes.index(min(sizes))]
+    assert top[0] == rs[sizes.index(max(sizes))]
+    assert bottom[0] == rs[sizes.index(min(sizes))]
 
 def test_resultset_empty():
     """Test aggregates on empty ResultSet."""
@@ -241,16 +271,162 @@ def test_resultset_empty():
     # Act & Assert
     assert rs.max(ResultField.SIZE) is None
     assert rs.min(ResultField.SIZE) is None
+    assert rs.min_max(ResultField.SIZE) == (None, None)
     assert rs.average(ResultField.SIZE) is None
     assert rs.median(ResultField.SIZE) is None
     assert rs.count_() == 0
     assert rs.top_n(ResultField.SIZE, 2) == []
     assert rs.bottom_n(ResultField.SIZE, 2) == []
 
-def test_resultset_invalid_field(sample_files):
+def test_resultset_invalid_field(sample_files: SampleFixture):
     """Test ValueError for unknown ResultField."""
     # Arrange
-    rs = sample_files
+    rs = sample_files.rs
     # Act & Assert
     with pytest.raises(ValueError):
-        rs.max("not_a_field")
\ No newline at end of file
+        rs.max("not_a_field")
+
+def test_sorted_index_between_mtime(test_result_files_with_mtime: list[pathlib.Path]) -> None:
+    """SortedIndex.between returns the half-open mtime window, oldest first."""
+    # Arrange
+    result = ResultSet(test_result_files_with_mtime)
+    mtimes = {p.name: result.get(ResultField.MTIME, p) for p in result}
+    lower = mtimes["middle_1.txt"]
+    upper = mtimes["youngest_2.txt"]
+    index = result.sorted_index(ResultField.MTIME)
+    # Act
+    actual = [p.name for p in index.between(lower, upper)]
+    # Assert
+    assert actual == ["middle_1.txt", "middle_2.txt", "middle_3.txt", "youngest_1.txt"]
+    assert len(index) == len(result)
+
+
+@pytest.mark.parametrize("n", [-1, 0, 1, 2, 3, 4, 5, 6, 9])
+def test_top_bottom_n_match_sorted_slice(tmp_path: pathlib.Path, n: int) -> None:
+    """top_n/bottom_n equal a sorted slice on both the heap and the full-sort path."""
+    # Arrange
+    files = []
+    for i, size in enumerate([5, 1, 3, 3, 8, 0, 3, 7]):
+        f = tmp_path / f"f{i}.txt"
+        f.write_bytes(b"x" * size)
+        files.append(f)
+    rs = ResultSet(files)
+
+    def size_of(p):
+        return p.stat().st_size
+
+    # Act
+    top = rs.top_n(ResultField.SIZE, n)
+    bottom = rs.bottom_n(ResultField.SIZE, n)
+
+    # Assert
+    assert top == sorted(files, key=size_of, reverse=True)[: max(n, 0)]
+    assert bottom == sorted(files, key=size_of)[: max(n, 0)]
+
+
+def test_result_set_stats_each_path_once(
+    sample_files: SampleFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Several stat-based aggregations, and sets derived by sorting, stat each path once."""
+    # Arrange
+    calls: list[pathlib.Path] = []
+    real_stat = pathlib.Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        calls.append(self)
+        return real_stat(self, *args, **kwargs)
+
+    rs = ResultSet(sample_files.rs)  # fresh stat cache
+    monkeypatch.setattr(pathlib.Path, "stat", counting_stat)
+
+    # Act
+    rs.max(ResultField.SIZE)
+    rs.average(ResultField.SIZE)
+    rs.median(ResultField.MTIME)
+    top = rs.top_n(ResultField.SIZE, 2)
+    top.min(ResultField.ATIME_DT)
+
+    # Assert
+    assert sorted(calls) == sorted(rs)
+
+
+def test_select_seeds_result_set_stats(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """select() hands the stats fetched by stat-based filters to the ResultSet."""
+    # Arrange
+    for i in range(3):
+        (tmp_path / f"f{i}.txt").write_text("x" * (i + 1))
+    rs = Query(where_expr=Size() > 1).select(tmp_path)
+    monkeypatch.setattr(pathlib.Path, "stat", None)
+
+    # Act
+    smallest, largest = rs.min(ResultField.SIZE), rs.max(ResultField.SIZE)
+
+    # Assert
+    assert (smallest, largest) == (2, 3)
+
+
+def test_result_set_warmup_fills_stat_cache(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An explicit warmup stats each path once; a path whose stat fails still raises later."""
+    # Arrange
+    files = []
+    for i in range(70):
+        f = tmp_path / f"f{i:02}.txt"
+        f.write_bytes(b"x" * i)
+        files.append(f)
+    rs = ResultSet(files)
+    broken = ResultSet(files + [tmp_path / "missing.txt"])
+    calls: list[pathlib.Path] = []
+    real_stat = pathlib.Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        calls.append(self)
+        return real_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "stat", counting_stat)
+
+    # Act
+    rs.warmup()
+    largest = rs.max(ResultField.SIZE)
+    total = rs.average(ResultField.SIZE) * len(rs)
+
+    # Assert
+    assert largest == 69
+    assert total == pytest.approx(sum(range(70)))
+    assert sorted(calls) == sorted(files)
+    broken.warmup()
+    with pytest.raises(FileNotFoundError):
+        broken.max(ResultField.SIZE)
+
+
+def test_result_set_never_warms_up_implicitly(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Aggregations on a large set stat serially; no thread pool is started without warmup()."""
+    # Arrange
+    files = []
+    for i in range(70):
+        f = tmp_path / f"f{i:02}.txt"
+        f.write_bytes(b"x" * i)
+        files.append(f)
+    rs = ResultSet(files)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("ResultSet started a thread pool without warmup()")
+
+    monkeypatch.setattr(result_set_module, "ThreadPoolExecutor", no_pool)
+
+    # Act
+    largest = rs.max(ResultField.SIZE)
+    ordered = rs.top_n(ResultField.SIZE, 2)
+
+    # Assert
+    assert largest == 69
+    assert [f.name for f in ordered] == ["f69.txt", "f68.txt"]
@@ -5,12 +5,15 @@ This module verifies that stat-based filters and their combinators
 call StatProxy.stat() the expected number of times, including cases
 where short-circuiting in OR combinators reduces the number of stat calls.
 """
+import os
 import pathlib
 import pytest
 
 from pathql.filters.base import Filter
-from pathql.filters.age import AgeDays
+from pathql.filters.file_type import FileType
+from pathql.filters.age import AgeDays, AgeSeconds
 from pathql.filters.size import Size
+from pathql.filters.stem import Stem
 from pathql.filters.suffix import Suffix
 from pathql.filters.stat_proxy import StatProxy
 from pathql.query import Query
@@ -67,3 +70,77 @@ def test_stat_proxy_call_count(tmp_path:pathlib.Path, filter_expr:Filter, expect
         f"OR combinators may short-circuit, reducing stat calls if the first filter matches. "
         f"Nested combinators follow these rules recursively."
     )
+
+
+def test_stat_proxy_caches_until_invalidated(tmp_path: pathlib.Path) -> None:
+    """StatProxy reuses one stat result until invalidate() is called."""
+    # Arrange
+    file: pathlib.Path = tmp_path / "testfile.txt"
+    file.write_bytes(b"x" * 50)
+    proxy = StatProxy(file)
+    first = proxy.stat()
+    file.write_bytes(b"x" * 100)
+
+    # Act
+    cached_size = proxy.stat().st_size
+    proxy.invalidate()
+    fresh_size = proxy.stat().st_size
+
+    # Assert
+    assert cached_size == first.st_size == 50, "Cached stat should be reused"
+    assert fresh_size == 100, "invalidate() should force a fresh stat"
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_stats_each_candidate_once(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    threaded: bool,
+) -> None:
+    """Size and Age in one query share a single real stat per name-matching file."""
+    # Arrange
+    for i in range(6):
+        (tmp_path / f"f{i}.{'txt' if i % 2 else 'bmp'}").write_bytes(b"x" * (10 * i))
+    stats: list[pathlib.Path] = []
+
+    def counting_stat(path):
+        stats.append(path)
+        return os.stat(path)
+
+    monkeypatch.setattr(StatProxy, "stat_func", staticmethod(counting_stat))
+    query = Query(where_expr=Suffix("txt") & (Size() > 5) & (AgeSeconds() > -60))
+
+    # Act
+    found = set(query.files(tmp_path, threaded=threaded))
+
+    # Assert
+    assert {p.name for p in found} == {"f1.txt", "f3.txt", "f5.txt"}
+    assert sorted(p.name for p in stats) == ["f1.txt", "f3.txt", "f5.txt"]
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_query_without_stat_filters_never_stats(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    threaded: bool,
+) -> None:
+    """Name and type filters are answered from the DirEntry with no stat syscall."""
+    # Arrange
+    for name in ["g1.txt", "g2.md", "h.txt"]:
+        (tmp_path / name).write_text("x")
+    (tmp_path / "gdir").mkdir()
+    stats: list[pathlib.Path] = []
+
+    def counting_stat(path):
+        stats.append(path)
+        return os.stat(path)
+
+    monkeypatch.setattr(StatProxy, "stat_func", staticmethod(counting_stat))
+    query = Query(where_expr=Stem("g*") & FileType().file)
+
+    # Act
+    found = set(query.files(tmp_path, files_only=False, threaded=threaded))
+
+    # Assert
+    assert {p.name for p in found} == {"g1.txt", "g2.md"}
+    assert stats == []
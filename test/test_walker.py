@@ -0,0 +1,99 @@
+"""
+Tests for the os.scandir-based walker used by Query.
+"""
+import os
+import pathlib
+
+import pytest
+
+from pathql.filters.stat_proxy import StatProxy
+from pathql.walker import list_dir, scan_dirs
+
+
+@pytest.fixture
+def tree(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Create a small nested directory tree."""
+    # Arrange
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("bb")
+    (tmp_path / "sub" / "deeper").mkdir()
+    (tmp_path / "sub" / "deeper" / "c.txt").write_text("ccc")
+    return tmp_path
+
+
+def _walk(root: pathlib.Path, **kwargs) -> list[tuple[pathlib.Path, os.DirEntry]]:
+    """Flatten scan_dirs() into (path, entry) pairs."""
+    return [
+        (directory / entry.name, entry)
+        for directory, entries in scan_dirs(root, **kwargs)
+        for entry in entries
+    ]
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+def test_scan_dirs_matches_pathlib_glob(tree: pathlib.Path, recursive: bool):
+    """scan_dirs() lists the same paths as rglob("*")/glob("*")."""
+    # Arrange
+    expected = set(tree.rglob("*") if recursive else tree.glob("*"))
+
+    # Act
+    found = {p for p, _ in _walk(tree, recursive=recursive)}
+
+    # Assert
+    assert found == expected
+
+
+def test_stat_proxy_uses_dirent_stat(tree: pathlib.Path):
+    """StatProxy built from a DirEntry returns the same stat data as path.stat()."""
+    # Arrange
+    pairs = [(p, e) for p, e in _walk(tree) if e.is_file()]
+
+    # Act / Assert
+    for p, entry in pairs:
+        proxy = StatProxy(p, entry)
+        assert proxy.stat().st_size == p.stat().st_size
+        assert proxy.stat_calls == 1
+
+
+def test_scan_dirs_name_filter_still_descends(tree: pathlib.Path):
+    """scan_dirs() drops entries rejected by name_filter but still walks their directories."""
+    # Act
+    found = {p for p, _ in _walk(tree, name_filter=lambda name: name.endswith(".txt"))}
+
+    # Assert
+    assert found == set(tree.rglob("*.txt"))
+
+
+def test_list_dir_sees_directory_created_after_missing(tmp_path: pathlib.Path):
+    """A directory created right after a failed listing is listed on the next call."""
+    # Arrange
+    missing = tmp_path / "later"
+
+    # Act
+    first = list_dir(missing)
+    missing.mkdir()
+    (missing / "a.txt").write_text("a")
+    second = list_dir(missing)
+
+    # Assert
+    assert first == ([], [])
+    assert [e.name for e in second[0]] == ["a.txt"]
+
+
+def test_list_dir_cache_keeps_missing_directory_for_one_walk(tmp_path: pathlib.Path):
+    """Within one dir_cache a missing directory stays empty; a new cache lists it afresh."""
+    # Arrange
+    missing = tmp_path / "later"
+    dir_cache: dict = {}
+
+    # Act
+    first = list_dir(missing, dir_cache)
+    missing.mkdir()
+    (missing / "a.txt").write_text("a")
+    cached = list_dir(missing, dir_cache)
+    fresh = list_dir(missing, {})
+
+    # Assert
+    assert first == ([], []) and cached == ([], [])
+    assert [e.name for e in fresh[0]] == ["a.txt"]